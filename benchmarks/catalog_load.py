@@ -0,0 +1,59 @@
+"""Time loading a large catalog into the model classes.
+
+Compares ``CatalogCollection.from_mappings`` with calling ``from_mapping``
+for every entry on the same already-parsed data, so JSON decoding is not
+part of the numbers.
+
+    python benchmarks/catalog_load.py [--collections 100000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+from yaxai.yax import Catalog, CatalogCollection
+
+
+def _entries(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "url": f"https://github.com/org/repo-{index}/blob/main/yax.yml",
+            "name": f"Collection {index}",
+            "output": "AGENTS.md",
+        }
+        for index in range(count)
+    ]
+
+
+def _best(function: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--collections", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    entries = _entries(args.collections)
+    catalog = {"organizations": [{"name": "org", "collections": entries}]}
+
+    per_entry = _best(lambda: [CatalogCollection.from_mapping(entry) for entry in entries], args.repeat)
+    bulk = _best(lambda: CatalogCollection.from_mappings(entries), args.repeat)
+    whole = _best(lambda: Catalog.from_mapping(catalog), args.repeat)
+
+    print(f"collections:              {args.collections}")
+    print(f"from_mapping per entry:   {per_entry * 1000:8.1f} ms")
+    print(f"from_mappings:            {bulk * 1000:8.1f} ms  ({per_entry / bulk:.2f}x)")
+    print(f"Catalog.from_mapping:     {whole * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Time parsing catalog sources inline and in the process pool.
+
+Used to pick ``_PARALLEL_PARSE_MIN_BYTES``: the pool only pays off once the
+YAML is large enough to hide its start-up cost.
+
+    python benchmarks/catalog_parse.py [--sources 64 256 1024 4096] [--workers N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from typing import List, Tuple
+
+from yaxai import yax
+from yaxai.yax import _parse_catalog_sources
+
+_SOURCE = """build:
+  agentsmd:
+    metadata:
+      name: Collection {index}
+    output: AGENTS.md
+    from:
+      - https://github.com/acme/rules/blob/main/terraform.md
+      - https://github.com/acme/rules/blob/main/python.md
+      - file:docs/*.md
+"""
+
+
+def _sources(count: int) -> List[Tuple[str, str]]:
+    return [
+        (_SOURCE.format(index=index), f"https://github.com/org/repo-{index}/blob/main/yax.yml")
+        for index in range(count)
+    ]
+
+
+def _timed(sources: List[Tuple[str, str]], workers: int) -> float:
+    started = time.perf_counter()
+    _parse_catalog_sources(sources, max_workers=workers)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sources", type=int, nargs="+", default=[64, 256, 1024, 4096, 16384])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    # Force the pool for the comparison; the threshold is what is being measured.
+    yax._PARALLEL_PARSE_MIN_BYTES = 0
+
+    print(f"{'sources':>8} {'bytes':>10} {'inline':>10} {'pool':>10}")
+    for count in args.sources:
+        sources = _sources(count)
+        size = sum(len(contents) for contents, _ in sources)
+        inline = _timed(sources, 1)
+        pooled = _timed(sources, args.workers)
+        print(f"{count:>8} {size:>10} {inline * 1000:>8.1f}ms {pooled * 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+from yaxai.agentsmd import PlainAgentsmdConfig, load_plain_config
+
+
+def _write_config(tmp_path, body: str):
+    path = tmp_path / "yax.yml"
+    path.write_text(body, encoding="utf-8")
+    return path
+
+
+def test_load_plain_config_reads_common_options(tmp_path):
+    path = _write_config(
+        tmp_path,
+        "build:\n  agentsmd:\n    from:\n      - file:a.md\n    output: OUT.md\n    metadata:\n      name: Demo\n",
+    )
+
+    assert load_plain_config(path) == PlainAgentsmdConfig(
+        urls=["file:a.md"], output="OUT.md", metadata={"name": "Demo"}
+    )
+
+
+def test_load_plain_config_defers_advanced_options(tmp_path):
+    path = _write_config(
+        tmp_path,
+        "build:\n  agentsmd:\n    from:\n      - file:a.md\n    targets:\n      - output: rules.mdc\n",
+    )
+
+    assert load_plain_config(path) is None
+
+
+def test_load_plain_config_defers_invalid_values(tmp_path):
+    path = _write_config(tmp_path, "build:\n  agentsmd:\n    from: file:a.md\n")
+
+    assert load_plain_config(path) is None
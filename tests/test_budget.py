@@ -0,0 +1,66 @@
+from yaxai.budget import TRUNCATION_MARKER, BudgetFragment, apply_budget
+from yaxai.tokens import estimate_tokens
+
+
+CORE = "# Core\nAlways run the tests.\n"
+STYLE = "# Style\nPrefer small functions.\n"
+EXTRA = "# Extra\n" + "".join(f"Optional hint number {index}.\n" for index in range(20))
+
+
+def test_fragments_under_budget_are_unchanged():
+    fragments = [BudgetFragment("core", 0, CORE), BudgetFragment("style", 0, STYLE)]
+
+    result = apply_budget(fragments, max_tokens=1000)
+
+    assert result.content == CORE + "\n\n" + STYLE
+    assert result.cuts == []
+    assert result.describe() == [f"Token budget: {result.tokens_after} of 1000 tokens"]
+
+
+def test_lowest_priority_sections_are_dropped_first():
+    fragments = [
+        BudgetFragment("core", 10, CORE),
+        BudgetFragment("extra", -1, EXTRA),
+        BudgetFragment("style", 0, STYLE),
+    ]
+    budget = estimate_tokens(CORE) + estimate_tokens(STYLE) + 2
+
+    result = apply_budget(fragments, max_tokens=budget)
+
+    assert result.content == CORE + "\n\n" + STYLE
+    assert [(cut.source, cut.heading, cut.truncated) for cut in result.cuts] == [("extra", "# Extra", False)]
+    assert result.tokens_after <= budget < result.tokens_before
+    assert result.describe()[1].startswith("  dropped '# Extra' from extra (-")
+
+
+def test_last_cut_section_is_truncated_when_part_fits():
+    fragments = [BudgetFragment("core", 1, CORE), BudgetFragment("extra", 0, EXTRA)]
+    budget = estimate_tokens(CORE) + estimate_tokens(EXTRA) // 2
+
+    result = apply_budget(fragments, max_tokens=budget)
+
+    assert result.content.startswith(CORE + "\n\n# Extra\nOptional hint number 0.\n")
+    assert result.content.endswith(TRUNCATION_MARKER)
+    assert "Optional hint number 19." not in result.content
+    assert result.cuts[0].truncated is True
+    assert result.tokens_after <= budget
+
+
+def test_truncation_closes_open_code_blocks():
+    code = "# Commands\n```sh\n" + "".join(f"make target-{index}\n" for index in range(30)) + "```\n"
+    budget = estimate_tokens(code) // 2
+
+    result = apply_budget([BudgetFragment("commands", 0, code)], max_tokens=budget)
+
+    assert result.content.endswith("```\n" + TRUNCATION_MARKER)
+    assert result.content.count("```") == 2
+
+
+def test_budget_counts_separators_between_many_small_fragments():
+    fragments = [BudgetFragment(f"rule-{index}", 0, f"Rule {index}.") for index in range(100)]
+
+    result = apply_budget(fragments, max_tokens=60)
+
+    assert result.tokens_after <= 60
+    assert result.tokens_after == estimate_tokens(result.content)
+    assert result.content.startswith("Rule 0.")
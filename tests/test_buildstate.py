@@ -0,0 +1,69 @@
+from pathlib import Path
+
+from yaxai.buildstate import BuildState
+from yaxai.yax import Yax
+
+
+def _project(tmp_path):
+    project = tmp_path / "app"
+    (project / "docs").mkdir(parents=True)
+    (project / "docs" / "a.md").write_text("alpha", encoding="utf-8")
+    (project / "yax.yml").write_text("build:\n  agentsmd:\n    from:\n      - file:docs/*.md\n", encoding="utf-8")
+    return project
+
+
+def _statuses(tmp_path):
+    return [result.status for result in Yax().build_all(tmp_path, state_path=tmp_path / "state.json")]
+
+
+def test_build_all_skips_projects_with_unchanged_inputs(tmp_path):
+    project = _project(tmp_path)
+
+    assert _statuses(tmp_path) == ["built"]
+    assert _statuses(tmp_path) == ["unchanged"]
+
+    (project / "docs" / "a.md").write_text("alpha 2", encoding="utf-8")
+    assert _statuses(tmp_path) == ["built"]
+    assert (project / "AGENTS.md").read_text(encoding="utf-8") == "alpha 2"
+
+
+def test_build_all_rebuilds_when_a_glob_matches_a_new_file(tmp_path):
+    project = _project(tmp_path)
+    _statuses(tmp_path)
+
+    (project / "docs" / "b.md").write_text("beta", encoding="utf-8")
+
+    assert _statuses(tmp_path) == ["built"]
+    assert "beta" in (project / "AGENTS.md").read_text(encoding="utf-8")
+
+
+def test_build_all_restores_edited_outputs(tmp_path):
+    project = _project(tmp_path)
+    _statuses(tmp_path)
+
+    (project / "AGENTS.md").write_text("edited", encoding="utf-8")
+
+    assert _statuses(tmp_path) == ["built"]
+    assert (project / "AGENTS.md").read_text(encoding="utf-8") == "alpha"
+
+
+def test_fingerprint_is_unknown_for_git_sources(tmp_path):
+    project = _project(tmp_path)
+    state = BuildState(tmp_path / "state.json")
+
+    fingerprint = state.fingerprint(
+        project / "yax.yml",
+        [["file:docs/a.md"]],
+        ["git+https://example.com/repo.git@main:AGENTS.md"],
+    )
+
+    assert fingerprint is None
+
+
+def test_build_state_ignores_unreadable_state_file(tmp_path):
+    path = tmp_path / "state.json"
+    path.write_text("not json", encoding="utf-8")
+
+    state = BuildState(path)
+
+    assert not state.is_unchanged(Path(tmp_path / "yax.yml"), [])
@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+from yaxai.catalogcache import RemoteCatalogCache
+from yaxai.ghurl import ConditionalDownload, GitHubFile
+
+
+URL = "https://github.com/acme/catalogs/blob/main/yax-catalog.json"
+
+
+@pytest.fixture(name="downloads")
+def fixture_downloads(monkeypatch):
+    calls = []
+    responses = []
+
+    def fake_download_conditional(self, etag=None, last_modified=None, binary=False):
+        calls.append((self.url, etag, last_modified))
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(GitHubFile, "download_conditional", fake_download_conditional)
+    return calls, responses
+
+
+def test_fetch_downloads_and_reuses_recent_copy(tmp_path, downloads):
+    calls, responses = downloads
+    responses.append(ConditionalDownload(content='{"organizations": []}', etag='"v1"'))
+    cache = RemoteCatalogCache(tmp_path)
+
+    first = cache.fetch(URL)
+    second = cache.fetch(URL)
+
+    assert first == second
+    assert json.loads(first.read_text(encoding="utf-8")) == {"organizations": []}
+    assert calls == [(URL, None, None)]
+
+
+def test_fetch_revalidates_with_etag_and_keeps_body_when_not_modified(tmp_path, downloads):
+    calls, responses = downloads
+    responses.extend(
+        [
+            ConditionalDownload(content="{}", etag='"v1"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT"),
+            ConditionalDownload(content=None, etag='"v1"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT"),
+        ]
+    )
+    cache = RemoteCatalogCache(tmp_path, revalidate_after=0)
+
+    first = cache.fetch(URL)
+    mtime = first.stat().st_mtime_ns
+    second = cache.fetch(URL)
+
+    assert calls[1] == (URL, '"v1"', "Mon, 01 Jan 2024 00:00:00 GMT")
+    assert second.read_text(encoding="utf-8") == "{}"
+    assert second.stat().st_mtime_ns == mtime
+
+
+def test_fetch_falls_back_to_stale_copy_when_offline(tmp_path, downloads):
+    calls, responses = downloads
+    responses.extend([ConditionalDownload(content="{}", etag='"v1"'), RuntimeError("offline")])
+    cache = RemoteCatalogCache(tmp_path, revalidate_after=0)
+
+    cache.fetch(URL)
+
+    assert cache.fetch(URL).read_text(encoding="utf-8") == "{}"
+
+
+def test_fetch_raises_without_cached_copy(tmp_path, downloads):
+    _, responses = downloads
+    responses.append(RuntimeError("offline"))
+
+    with pytest.raises(RuntimeError):
+        RemoteCatalogCache(tmp_path).fetch(URL)
+
+
+def test_fetch_keeps_gzipped_shards_compressed(tmp_path, downloads):
+    import gzip
+
+    calls, responses = downloads
+    payload = gzip.compress(b'{"organizations": []}')
+    responses.append(ConditionalDownload(content=payload, etag='"v1"'))
+    shard_url = "https://github.com/acme/catalogs/blob/main/yax-catalog.shards/acme-0.json.gz"
+
+    path = RemoteCatalogCache(tmp_path).fetch(shard_url)
+
+    assert path.name.endswith(".json.gz")
+    assert path.read_bytes() == payload
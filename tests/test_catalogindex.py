@@ -0,0 +1,65 @@
+import os
+import sqlite3
+
+from yaxai.catalogindex import _NAME_PREFIX_CLAUSE, CatalogIndex, CatalogIndexRow
+
+
+def _rows():
+    return [
+        CatalogIndexRow("acme", "https://example.com/a/yax.yml", "Terraform", "AGENTS.md", "https://example.com/a/AGENTS.md"),
+        CatalogIndexRow("acme", "https://example.com/b/yax.yml", "terraform_state", None, "https://example.com/b/_agents.md"),
+        CatalogIndexRow("globex", "https://example.com/c/yax.yml", None, None, "https://example.com/c/_agents.md"),
+    ]
+
+
+def test_for_catalog_places_index_next_to_catalog(tmp_path):
+    index = CatalogIndex.for_catalog(tmp_path / "yax-catalog.json")
+
+    assert index.path == tmp_path / "yax-catalog.index.sqlite"
+
+
+def test_query_filters_by_organization_prefix_and_url(tmp_path):
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text("{}", encoding="utf-8")
+    index = CatalogIndex.for_catalog(catalog_path)
+    index.write(catalog_path, _rows())
+
+    assert [row.url for row in index.query(organization="globex")] == ["https://example.com/c/yax.yml"]
+    assert [row.name for row in index.query(name_prefix="TERRA")] == ["Terraform", "terraform_state"]
+    assert [row.name for row in index.query(name_prefix="terraform_")] == ["terraform_state"]
+    assert [row.name for row in index.query(url="https://example.com/a/AGENTS.md")] == ["Terraform"]
+    assert len(list(index.query(limit=2))) == 2
+
+
+def test_name_prefix_lookup_uses_name_index(tmp_path):
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text("{}", encoding="utf-8")
+    index = CatalogIndex.for_catalog(catalog_path)
+    index.write(catalog_path, _rows())
+
+    connection = sqlite3.connect(index.path)
+    try:
+        plan = connection.execute(
+            f"EXPLAIN QUERY PLAN SELECT url FROM collections WHERE {_NAME_PREFIX_CLAUSE}", ["terra%"]
+        ).fetchall()
+    finally:
+        connection.close()
+
+    assert any("collections_name" in row[-1] for row in plan)
+
+
+def test_is_fresh_detects_catalog_changes(tmp_path):
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text("{}", encoding="utf-8")
+    index = CatalogIndex.for_catalog(catalog_path)
+
+    assert not index.is_fresh(catalog_path)
+
+    index.write(catalog_path, _rows())
+    assert index.is_fresh(catalog_path)
+
+    catalog_path.write_text('{"organizations": []}', encoding="utf-8")
+    stat = catalog_path.stat()
+    os.utime(catalog_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert not index.is_fresh(catalog_path)
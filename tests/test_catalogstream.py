@@ -0,0 +1,94 @@
+import io
+import json
+
+import pytest
+
+from yaxai.catalogstream import JsonStreamReader, iter_catalog_events
+
+
+CATALOG = {
+    "version": {"nested": [1, 2.5, None]},
+    "organizations": [
+        {
+            "collections": [
+                {"url": "https://example.com/a.yml", "name": "A \"quoted\" é"},
+                {"url": "https://example.com/b.yml", "output": "AGENTS.md"},
+            ],
+            "name": "acme",
+        },
+        {"name": "empty", "collections": []},
+    ],
+}
+
+
+class _CountingStream(io.StringIO):
+    def __init__(self, value):
+        super().__init__(value)
+        self.reads = 0
+
+    def read(self, size=-1):
+        self.reads += 1
+        return super().read(size)
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_iter_catalog_events_across_chunk_boundaries(monkeypatch, indent, chunk_size):
+    monkeypatch.setattr("yaxai.catalogstream._CHUNK_SIZE", chunk_size)
+    stream = io.StringIO(json.dumps(CATALOG, indent=indent, sort_keys=True))
+
+    events = list(iter_catalog_events(stream))
+
+    assert events == [
+        ("organization_start", 0, {}),
+        ("collection", 0, CATALOG["organizations"][0]["collections"][0]),
+        ("collection", 0, CATALOG["organizations"][0]["collections"][1]),
+        ("organization", 0, {"name": "acme"}),
+        ("organization_start", 1, {}),
+        ("organization", 1, {"name": "empty"}),
+    ]
+
+
+def test_iter_catalog_events_stops_reading_when_consumer_stops():
+    payload = {"organizations": [{"name": "acme", "collections": [{"url": f"https://example.com/{n}.yml"} for n in range(5000)]}]}
+    stream = _CountingStream(json.dumps(payload))
+
+    events = (event for event in iter_catalog_events(stream) if event.kind == "collection")
+    first = next(events)
+
+    assert first.value == {"url": "https://example.com/0.yml"}
+    assert stream.reads == 1
+
+
+def test_read_value_handles_numbers_split_across_chunks():
+    reader = JsonStreamReader(io.StringIO("[12345, 6]"), chunk_size=3)
+
+    values = []
+    for _ in reader.iter_array():
+        values.append(reader.read_value())
+
+    assert values == [12345, 6]
+    reader.expect_end()
+
+
+@pytest.mark.parametrize(
+    "payload",
+    ["not json", '{"organizations": [', '{"organizations": []} trailing', '{"organizations": [{"name": "a",}]}'],
+)
+def test_iter_catalog_events_rejects_malformed_json(payload):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_catalog_events(io.StringIO(payload)))
+
+
+@pytest.mark.parametrize(
+    "payload, message",
+    [
+        ("[]", "must be an object"),
+        ('{"organizations": {}}', "'organizations' must be a list"),
+        ('{"organizations": [1]}', "organization entry to be an object"),
+        ('{"organizations": [{"collections": "x"}]}', "'collections' to be a list"),
+    ],
+)
+def test_iter_catalog_events_validates_structure(payload, message):
+    with pytest.raises(ValueError, match=message):
+        list(iter_catalog_events(io.StringIO(payload)))
@@ -104,6 +104,29 @@ def test_agentsmd_build_uses_config_and_builds_output():
         assert "# yax: You Are eXpert" in output_path.read_text(encoding="utf-8")
 
 
+def test_agentsmd_build_prints_source_graph():
+    with runner.isolated_filesystem():
+        Path("shared").mkdir()
+        Path("shared/rules.md").write_text("rules", encoding="utf-8")
+        Path("shared/yax.yml").write_text("build:\n  agentsmd:\n    from:\n      - file:rules.md\n", encoding="utf-8")
+        Path(DEFAULT_CONFIG_FILENAME).write_text(
+            "build:\n  agentsmd:\n    from:\n      - file:shared/yax.yml\n",
+            encoding="utf-8",
+        )
+        root = Path.cwd().resolve()
+
+        result = runner.invoke(app, ["build", "--graph"])
+
+        assert not Path("AGENTS.md").exists()
+
+    assert result.exit_code == 0
+    assert result.stdout.splitlines() == [
+        f"file:{root / DEFAULT_CONFIG_FILENAME}",
+        f"- file:{root / 'shared' / 'yax.yml'}",
+        f"  - file:{root / 'shared' / 'rules.md'}",
+    ]
+
+
 def test_agentsmd_build_honors_output_override():
     with runner.isolated_filesystem():
         Path(DEFAULT_CONFIG_FILENAME).write_text(
@@ -193,6 +216,20 @@ def test_catalog_build_creates_json():
         assert "Generated catalog" in result.stdout
 
 
+def test_catalog_build_scan_org_without_config(monkeypatch):
+    monkeypatch.setattr("yaxai.orgscan.OrganizationScanner.scan", lambda self: ["file:source.yml"])
+
+    with runner.isolated_filesystem():
+        Path("source.yml").write_text("", encoding="utf-8")
+
+        result = runner.invoke(app, ["catalog", "build", "--scan-org", "acme"])
+
+        catalog = json.loads(Path("yax-catalog.json").read_text(encoding="utf-8"))
+
+    assert result.exit_code == 0
+    assert catalog == {"organizations": [{"collections": [{"url": "file:source.yml"}], "name": "acme"}]}
+
+
 def test_catalog_build_honors_output_override():
     with runner.isolated_filesystem():
         Path(DEFAULT_CATALOG_CONFIG_FILENAME).write_text(
@@ -379,3 +416,432 @@ def test_agentsmd_discover_reports_no_collections():
 
         assert result.exit_code == 0
         assert "No catalog collections found." in result.stdout
+
+
+def test_agentsmd_search_returns_ranked_collections():
+    with runner.isolated_filesystem():
+        for name, content in {
+            "terraform": "Enable state locking for every Terraform backend.",
+            "python": "Use pytest for tests.",
+        }.items():
+            project_dir = Path(name)
+            project_dir.mkdir()
+            (project_dir / "yax.yml").write_text(
+                dedent(
+                    f"""
+                    build:
+                      agentsmd:
+                        metadata:
+                          name: {name.title()} rules
+                    """
+                ),
+                encoding="utf-8",
+            )
+            (project_dir / "AGENTS.md").write_text(content, encoding="utf-8")
+
+        Path(DEFAULT_CATALOG_CONFIG_FILENAME).write_text(
+            dedent(
+                f"""
+                build:
+                  catalog:
+                    organization: example
+                    from:
+                      - file://{Path.cwd() / "terraform" / "yax.yml"}
+                      - file://{Path.cwd() / "python" / "yax.yml"}
+                """
+            ),
+            encoding="utf-8",
+        )
+
+        build_result = runner.invoke(app, ["catalog", "build", "--search"])
+        assert build_result.exit_code == 0
+        assert Path("yax-catalog.search.sqlite").exists()
+
+        result = runner.invoke(
+            app,
+            ["agentsmd", "search", "state locking", "--catalog", "yax-catalog.json"],
+        )
+
+        assert result.exit_code == 0
+        assert "1. Terraform rules" in result.stdout
+        assert "Python rules" not in result.stdout
+        assert "Enable state locking" in result.stdout
+
+
+def test_agentsmd_search_reports_missing_index():
+    with runner.isolated_filesystem():
+        Path("catalog.json").write_text('{"organizations": []}', encoding="utf-8")
+
+        result = runner.invoke(app, ["agentsmd", "search", "terraform", "--catalog", "catalog.json"])
+
+        assert result.exit_code == 1
+        assert "Search index not found" in result.stdout
+
+
+def test_agentsmd_discover_honors_limit():
+    catalog_data = {
+        "organizations": [
+            {
+                "name": "Example Org",
+                "collections": [
+                    {"url": "https://example.com/one.yml", "name": "Example One"},
+                    {"url": "https://example.com/two.yml", "name": "Example Two"},
+                ],
+            }
+        ]
+    }
+
+    with runner.isolated_filesystem():
+        catalog_path = Path("catalog.json")
+        catalog_path.write_text(json.dumps(catalog_data), encoding="utf-8")
+
+        result = runner.invoke(
+            app,
+            ["agentsmd", "discover", "--catalog", str(catalog_path), "--limit", "1"],
+            input="\n",
+        )
+
+        assert result.exit_code == 0
+        assert "1. Example One" in result.stdout
+        assert "Example Two" not in result.stdout
+
+
+def test_agentsmd_discover_federates_repeated_catalogs(monkeypatch):
+    with runner.isolated_filesystem():
+        monkeypatch.setattr("yaxai.yax.Discovery.DEFAULT_CACHE_DIR", Path.cwd() / "cache")
+        for name in ("one", "two"):
+            Path(f"{name}.json").write_text(
+                json.dumps(
+                    {
+                        "organizations": [
+                            {"name": name, "collections": [{"url": f"https://example.com/{name}/yax.yml", "name": f"Example {name}"}]}
+                        ]
+                    }
+                ),
+                encoding="utf-8",
+            )
+
+        result = runner.invoke(
+            app,
+            ["agentsmd", "discover", "--catalog", "one.json", "--catalog", "two.json"],
+            input="\n",
+        )
+
+        assert result.exit_code == 0
+        assert "1. Example one" in result.stdout
+        assert "2. Example two" in result.stdout
+
+
+def test_catalog_build_writes_gzip_shards():
+    with runner.isolated_filesystem():
+        Path(DEFAULT_CATALOG_CONFIG_FILENAME).write_text(
+            dedent(
+                """
+                build:
+                  catalog:
+                    organization: example
+                """
+            ),
+            encoding="utf-8",
+        )
+
+        result = runner.invoke(app, ["catalog", "build", "--gzip"])
+
+        assert result.exit_code == 0
+        manifest = json.loads(Path("yax-catalog.json").read_text(encoding="utf-8"))
+        assert [entry["organization"] for entry in manifest["shards"]] == ["example"]
+        assert list(Path("yax-catalog.shards").glob("*.json.gz"))
+
+
+def test_catalog_export_writes_html_to_stdout():
+    catalog_data = {
+        "organizations": [
+            {
+                "name": "Example",
+                "collections": [{"url": "https://example.com/catalog.yml", "name": "Example Catalog"}],
+            }
+        ]
+    }
+
+    with runner.isolated_filesystem():
+        Path("yax-catalog.json").write_text(json.dumps(catalog_data), encoding="utf-8")
+
+        result = runner.invoke(app, ["catalog", "export", "--format", "html", "--output", "-"])
+
+        assert result.exit_code == 0
+        assert result.stdout.startswith("<!DOCTYPE html>")
+        assert ">Example Catalog</a>" in result.stdout
+        assert "Exported catalog" not in result.stdout
+        assert not Path("yax-catalog.html").exists()
+
+
+def test_catalog_verify_reports_dead_collections():
+    with runner.isolated_filesystem():
+        Path("present").mkdir()
+        Path("present/AGENTS.md").write_text("# Agents", encoding="utf-8")
+        Path("yax-catalog.json").write_text(
+            json.dumps(
+                {
+                    "organizations": [
+                        {
+                            "name": "example",
+                            "collections": [
+                                {"url": f"file:{Path.cwd()}/present/yax.yml", "name": "Present", "output": "AGENTS.md"},
+                                {"url": f"file:{Path.cwd()}/missing/yax.yml", "name": "Missing"},
+                            ],
+                        }
+                    ]
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        result = runner.invoke(app, ["catalog", "verify", "--write"])
+        catalog = json.loads(Path("yax-catalog.json").read_text(encoding="utf-8"))
+
+    assert result.exit_code == 1
+    assert "DEAD" in result.stdout
+    assert "Missing" in result.stdout
+    assert "Present" not in result.stdout
+    assert "Checked 2 collections" in result.stdout
+    assert catalog["organizations"][0]["collections"][1]["verification"]["status"] == "dead"
+
+
+def test_build_all_reports_each_project():
+    with runner.isolated_filesystem():
+        for name in ("api", "web"):
+            Path(name).mkdir()
+            Path(name, "rules.md").write_text(name, encoding="utf-8")
+            Path(name, DEFAULT_CONFIG_FILENAME).write_text(
+                "build:\n  agentsmd:\n    from:\n      - file:rules.md\n",
+                encoding="utf-8",
+            )
+
+        result = runner.invoke(app, ["build", "--all", "."])
+
+        assert Path("web", "AGENTS.md").read_text(encoding="utf-8") == "web"
+
+    assert result.exit_code == 0
+    assert "built     api/yax.yml" in result.stdout
+    assert "Processed 2 projects: 2 built" in result.stdout
+
+
+def test_build_root_argument_requires_all():
+    result = runner.invoke(app, ["build", "."])
+
+    assert result.exit_code == 1
+    assert "only be used together with --all" in result.stdout
+
+
+def test_build_uses_running_daemon(tmp_path, monkeypatch):
+    import threading
+
+    from yaxai.daemon import YaxServer
+
+    server = YaxServer(tmp_path / "yax.sock")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("YAX_SOCKET", str(server.socket_path))
+    try:
+        with runner.isolated_filesystem():
+            Path("fragment.md").write_text("Fragment", encoding="utf-8")
+            Path(DEFAULT_CONFIG_FILENAME).write_text(
+                "build:\n  agentsmd:\n    from:\n      - file:fragment.md\n",
+                encoding="utf-8",
+            )
+
+            result = runner.invoke(app, ["build", "--output", "OUT.md"])
+
+            assert result.exit_code == 0, result.stdout
+            assert "Generated agents markdown: OUT.md" in result.stdout
+            assert Path("OUT.md").read_text(encoding="utf-8") == "Fragment"
+            assert server.requests_served == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def test_serve_stop_without_daemon(tmp_path):
+    result = runner.invoke(app, ["serve", "--stop", "--socket", str(tmp_path / "yax.sock")])
+
+    assert result.exit_code == 1
+    assert "No yax daemon is listening" in result.stdout
+
+
+def _write_numbered_catalog(path: Path, count: int) -> None:
+    collections = [
+        {"url": f"https://example.com/c{number}/yax.yml", "name": f"Collection {number}"}
+        for number in range(1, count + 1)
+    ]
+    path.write_text(json.dumps({"organizations": [{"name": "Example", "collections": collections}]}), encoding="utf-8")
+
+
+def test_agentsmd_discover_selects_ranges_with_single_write(monkeypatch):
+    from yaxai.yax import AgentsmdBuildConfig
+
+    saves = []
+    original_save = AgentsmdBuildConfig.save
+    monkeypatch.setattr(AgentsmdBuildConfig, "save", lambda self, path: saves.append(path) or original_save(self, path))
+
+    with runner.isolated_filesystem():
+        _write_numbered_catalog(Path("catalog.json"), 5)
+
+        result = runner.invoke(
+            app,
+            ["agentsmd", "discover", "--catalog", "catalog.json"],
+            input="1,3-4\n4\n\n",
+        )
+
+        assert result.exit_code == 0, result.stdout
+        config = yaml.safe_load(Path(DEFAULT_CONFIG_FILENAME).read_text(encoding="utf-8"))
+        assert config["build"]["agentsmd"]["from"] == [
+            f"https://example.com/c{number}/_agents.md" for number in (1, 3, 4)
+        ]
+        assert len(saves) == 1
+
+
+def test_agentsmd_discover_filters_and_pages():
+    with runner.isolated_filesystem():
+        _write_numbered_catalog(Path("catalog.json"), 45)
+
+        result = runner.invoke(
+            app,
+            ["agentsmd", "discover", "--catalog", "catalog.json"],
+            input=">\nCollection 4\n2\n\n",
+        )
+
+        assert result.exit_code == 0, result.stdout
+        assert "Showing 1-20 of 45 collections." in result.stdout
+        assert "Showing 21-40 of 45 collections." in result.stdout
+        assert "45. Collection 45" not in result.stdout.split("Showing 21-40")[0]
+        # "Collection 4" ranks Collection 4 first and Collection 40-45 after it.
+        assert "2. Collection 40" in result.stdout
+        config = yaml.safe_load(Path(DEFAULT_CONFIG_FILENAME).read_text(encoding="utf-8"))
+        assert config["build"]["agentsmd"]["from"] == ["https://example.com/c40/_agents.md"]
+
+
+def test_agentsmd_discover_rejects_out_of_range_selection():
+    with runner.isolated_filesystem():
+        _write_numbered_catalog(Path("catalog.json"), 3)
+
+        result = runner.invoke(app, ["agentsmd", "discover", "--catalog", "catalog.json"], input="2-7\n\n")
+
+        assert result.exit_code == 0
+        assert "Invalid selection: '2-7' is outside 1-3" in result.stdout
+        assert not Path(DEFAULT_CONFIG_FILENAME).exists()
+
+
+def test_agentsmd_discover_add_is_non_interactive():
+    with runner.isolated_filesystem():
+        _write_numbered_catalog(Path("catalog.json"), 3)
+
+        result = runner.invoke(
+            app,
+            ["agentsmd", "discover", "--catalog", "catalog.json", "--add", "colection 2", "--add", "c3"],
+        )
+
+        assert result.exit_code == 0, result.stdout
+        assert "1. Collection 1" not in result.stdout
+        config = yaml.safe_load(Path(DEFAULT_CONFIG_FILENAME).read_text(encoding="utf-8"))
+        assert config["build"]["agentsmd"]["from"] == [
+            "https://example.com/c2/_agents.md",
+            "https://example.com/c3/_agents.md",
+        ]
+
+
+def test_agentsmd_discover_add_fails_without_match():
+    with runner.isolated_filesystem():
+        _write_numbered_catalog(Path("catalog.json"), 3)
+
+        result = runner.invoke(app, ["agentsmd", "discover", "--catalog", "catalog.json", "--add", "zzz"])
+
+        assert result.exit_code == 1
+        assert "No collection matches 'zzz'." in result.stdout
+        assert not Path(DEFAULT_CONFIG_FILENAME).exists()
+
+
+def test_build_reports_dedupe_savings():
+    with runner.isolated_filesystem():
+        Path("a.md").write_text("# A\nAlpha\n## Shared\nSame text.\n", encoding="utf-8")
+        Path("b.md").write_text("# B\nBeta\n## Shared\nSame text.\n", encoding="utf-8")
+        Path(DEFAULT_CONFIG_FILENAME).write_text(
+            "build:\n  agentsmd:\n    dedupe: true\n    from:\n      - file:a.md\n      - file:b.md\n",
+            encoding="utf-8",
+        )
+
+        result = runner.invoke(app, ["build"])
+
+        assert result.exit_code == 0, result.stdout
+        assert "Deduplicated: removed 1 duplicate block, saved 21 bytes (~7 tokens)" in result.stdout
+        assert Path("AGENTS.md").read_text(encoding="utf-8").count("## Shared") == 1
+
+
+def test_build_reports_token_budget_cuts():
+    with runner.isolated_filesystem():
+        Path("core.md").write_text("# Core\nAlways run the tests.\n", encoding="utf-8")
+        Path("extra.md").write_text("# Extra\n" + "Optional advice.\n" * 50, encoding="utf-8")
+        Path(DEFAULT_CONFIG_FILENAME).write_text(
+            dedent(
+                """
+                build:
+                  agentsmd:
+                    max_tokens: 20
+                    from:
+                      - url: file:core.md
+                        priority: 1
+                      - file:extra.md
+                """
+            ),
+            encoding="utf-8",
+        )
+
+        result = runner.invoke(app, ["build"])
+
+        assert result.exit_code == 0, result.stdout
+        assert "Token budget: " in result.stdout
+        assert "dropped '# Extra' from file:extra.md" in result.stdout
+        assert Path("AGENTS.md").read_text(encoding="utf-8") == "# Core\nAlways run the tests.\n"
+
+
+def test_build_minify_flag_reports_bytes():
+    with runner.isolated_filesystem():
+        Path("a.md").write_text(
+            "# A\n<!-- editor note -->\n![ci](https://img.shields.io/badge/ci-green.svg)\n\n\n\nAlpha  \n",
+            encoding="utf-8",
+        )
+        Path(DEFAULT_CONFIG_FILENAME).write_text(
+            "build:\n  agentsmd:\n    from:\n      - file:a.md\n",
+            encoding="utf-8",
+        )
+
+        result = runner.invoke(app, ["build", "--minify"])
+
+        assert result.exit_code == 0, result.stdout
+        assert "Minified: 85 -> 11 bytes (-87%)" in result.stdout
+        assert Path("AGENTS.md").read_text(encoding="utf-8") == "# A\n\nAlpha\n"
+
+
+def test_build_writes_scoped_outputs():
+    with runner.isolated_filesystem():
+        Path("core.md").write_text("# Core\nAlways run the tests.\n", encoding="utf-8")
+        Path("infra.md").write_text("# Infra\nRun terraform fmt.\n", encoding="utf-8")
+        Path(DEFAULT_CONFIG_FILENAME).write_text(
+            dedent(
+                """
+                build:
+                  agentsmd:
+                    from:
+                      - file:core.md
+                      - url: file:infra.md
+                        scope: infra
+                """
+            ),
+            encoding="utf-8",
+        )
+
+        result = runner.invoke(app, ["build"])
+
+        assert result.exit_code == 0, result.stdout
+        assert Path("AGENTS.md").read_text(encoding="utf-8") == "# Core\nAlways run the tests.\n"
+        assert Path("infra/AGENTS.md").read_text(encoding="utf-8") == "# Infra\nRun terraform fmt.\n"
@@ -0,0 +1,73 @@
+import os
+
+import pytest
+
+from yaxai import configio
+from yaxai.configio import clear_yaml_cache, dump_yaml, load_yaml_file, parse_yaml, write_yaml_file
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_yaml_cache()
+    yield
+    clear_yaml_cache()
+
+
+@pytest.fixture(name="parses")
+def fixture_parses(monkeypatch):
+    calls = []
+    original = configio.parse_yaml
+
+    def counting_parse(text):
+        calls.append(text)
+        return original(text)
+
+    monkeypatch.setattr(configio, "parse_yaml", counting_parse)
+    return calls
+
+
+def test_parse_and_dump_round_trip():
+    data = {"build": {"agentsmd": {"from": ["https://example.com/a.md"], "output": "AGENTS.md"}}}
+
+    assert parse_yaml(dump_yaml(data)) == data
+    assert dump_yaml(data).startswith("build:")
+
+
+def test_load_reuses_parsed_document_while_file_is_unchanged(tmp_path, parses):
+    path = tmp_path / "yax.yml"
+    path.write_text("build:\n  agentsmd:\n    from: [a]\n", encoding="utf-8")
+
+    first = load_yaml_file(path)
+    first["build"]["agentsmd"]["from"].append("b")
+    second = load_yaml_file(path)
+
+    assert len(parses) == 1
+    assert second == {"build": {"agentsmd": {"from": ["a"]}}}
+
+
+def test_load_reparses_changed_file(tmp_path, parses):
+    path = tmp_path / "yax.yml"
+    path.write_text("value: 1\n", encoding="utf-8")
+    assert load_yaml_file(path) == {"value": 1}
+
+    path.write_text("value: 22\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_yaml_file(path) == {"value": 22}
+    assert len(parses) == 2
+
+
+def test_write_is_atomic_and_primes_cache(tmp_path, parses):
+    path = tmp_path / "nested" / "yax.yml"
+
+    write_yaml_file(path, {"build": {"agentsmd": {"from": ["a"]}}})
+
+    assert load_yaml_file(path) == {"build": {"agentsmd": {"from": ["a"]}}}
+    assert parses == []
+    assert [entry.name for entry in path.parent.iterdir()] == ["yax.yml"]
+
+
+def test_load_missing_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_yaml_file(tmp_path / "missing.yml")
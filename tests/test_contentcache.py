@@ -0,0 +1,126 @@
+import io
+import threading
+
+from yaxai.contentcache import CommitResolver, ContentCache, PinnedGitHubDownloader
+from yaxai.ghurl import GitHubFile
+from yaxai.sources import SourceDownloader, SourceFetcher
+
+
+CORE = "https://github.com/acme/rules/blob/main/core.md"
+STYLE = "https://github.com/acme/rules/blob/main/docs/style.md"
+SHA_1 = "1" * 40
+SHA_2 = "2" * 40
+
+
+class FakeGitHub:
+    def __init__(self, sha):
+        self.sha = sha
+        self.lookups = []
+        self.downloads = []
+        self.lock = threading.Lock()
+
+    def lookup(self, owner, repository, ref):
+        with self.lock:
+            self.lookups.append((owner, repository, ref))
+        return self.sha
+
+    def download(self, github_file):
+        with self.lock:
+            self.downloads.append(github_file.url)
+        return f"{github_file.components()[3]} at {github_file.components()[2][:1]}"
+
+
+def _build(remote, cache_dir, urls):
+    github = PinnedGitHubDownloader(CommitResolver(remote.lookup), ContentCache(cache_dir), remote.download)
+    with SourceFetcher(download=SourceDownloader(github)) as fetcher:
+        return fetcher.fetch_all(urls)
+
+
+def test_refs_resolve_once_per_build_and_files_download_by_sha(tmp_path):
+    remote = FakeGitHub(SHA_1)
+
+    texts = _build(remote, tmp_path, [CORE, STYLE])
+
+    assert texts == {CORE: "core.md at 1", STYLE: "docs/style.md at 1"}
+    assert remote.lookups == [("acme", "rules", "main")]
+    assert sorted(remote.downloads) == [
+        f"https://github.com/acme/rules/blob/{SHA_1}/core.md",
+        f"https://github.com/acme/rules/blob/{SHA_1}/docs/style.md",
+    ]
+
+
+def test_unchanged_commit_is_served_from_cache(tmp_path):
+    remote = FakeGitHub(SHA_1)
+    _build(remote, tmp_path, [CORE, STYLE])
+    remote.downloads.clear()
+
+    assert _build(remote, tmp_path, [CORE, STYLE]) == {CORE: "core.md at 1", STYLE: "docs/style.md at 1"}
+    assert remote.downloads == []
+
+    remote.sha = SHA_2
+    assert _build(remote, tmp_path, [CORE])[CORE] == "core.md at 2"
+    assert remote.downloads == [f"https://github.com/acme/rules/blob/{SHA_2}/core.md"]
+
+
+def test_unresolvable_ref_falls_back_to_ref_download(tmp_path):
+    remote = FakeGitHub(SHA_1)
+
+    def failing_lookup(owner, repository, ref):
+        raise RuntimeError("rate limited")
+
+    github = PinnedGitHubDownloader(CommitResolver(failing_lookup), ContentCache(tmp_path), remote.download)
+
+    assert github.download(CORE) == "core.md at m"
+    assert remote.downloads == [CORE]
+
+
+def test_commit_resolver_expires_after_ttl():
+    remote = FakeGitHub(SHA_1)
+    resolver = CommitResolver(remote.lookup, ttl=0)
+
+    resolver.resolve("acme", "rules", "main")
+    resolver.resolve("acme", "rules", "main")
+
+    assert len(remote.lookups) == 2
+
+
+def test_github_file_at_ref_keeps_path():
+    github_file = GitHubFile.parse(STYLE)
+
+    assert github_file.components() == ("acme", "rules", "main", "docs/style.md")
+    assert github_file.at_ref(SHA_1).url == f"https://github.com/acme/rules/blob/{SHA_1}/docs/style.md"
+
+
+def test_commit_resolver_completes_lookup_on_any_error():
+    calls = []
+
+    def timing_out(owner, repository, ref):
+        calls.append(ref)
+        raise TimeoutError("read timed out")
+
+    resolver = CommitResolver(timing_out)
+
+    assert resolver.resolve("acme", "rules", "main") is None
+    assert resolver.resolve("acme", "rules", "main") is None
+    assert calls == ["main"]
+
+
+def test_commit_resolver_finds_the_token_once(monkeypatch):
+    finds = []
+    authorizations = []
+
+    def find(self):
+        finds.append(self)
+        return "secret"
+
+    def fake_urlopen(request, timeout=10.0):
+        authorizations.append(request.headers["Authorization"])
+        return io.BytesIO(SHA_1.encode("ascii"))
+
+    monkeypatch.setattr("yaxai.ghurl.GitHubTokenFinder.find", find)
+    monkeypatch.setattr("yaxai.ghurl.urlopen", fake_urlopen)
+    resolver = CommitResolver()
+
+    assert [resolver.resolve("acme", repository, "main") for repository in ["rules", "docs", "tools"]] == [SHA_1] * 3
+    assert len(finds) == 1
+    assert authorizations == ["token secret"] * 3
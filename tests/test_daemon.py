@@ -0,0 +1,198 @@
+import threading
+
+import pytest
+
+from yaxai.daemon import FragmentCache, YaxServer, send_request
+
+
+@pytest.fixture
+def server(tmp_path):
+    yax_server = YaxServer(tmp_path / "yax.sock")
+    thread = threading.Thread(target=yax_server.serve_forever, daemon=True)
+    thread.start()
+    yield yax_server
+    yax_server.shutdown()
+    yax_server.server_close()
+    thread.join()
+
+
+def _write_project(directory, body="Fragment"):
+    directory.mkdir(exist_ok=True)
+    (directory / "fragment.md").write_text(body, encoding="utf-8")
+    (directory / "yax.yml").write_text("build:\n  agentsmd:\n    from:\n      - file:fragment.md\n", encoding="utf-8")
+
+
+def test_send_request_returns_none_without_daemon(tmp_path):
+    assert send_request({"command": "ping"}, tmp_path / "missing.sock") is None
+
+
+def test_daemon_builds_relative_to_client_directory(server, tmp_path):
+    project = tmp_path / "project"
+    _write_project(project)
+
+    payload = {"command": "build", "cwd": str(project), "config": "yax.yml", "output": None}
+    response = send_request(payload, server.socket_path)
+
+    assert response == {
+        "ok": True,
+        "config": str(project / "yax.yml"),
+        "fallback": False,
+        "outputs": ["AGENTS.md"],
+        "reports": {},
+    }
+    assert (project / "AGENTS.md").read_text(encoding="utf-8") == "Fragment"
+
+    # Local fragments are read again on every build.
+    (project / "fragment.md").write_text("Edited", encoding="utf-8")
+    send_request(payload, server.socket_path)
+    assert (project / "AGENTS.md").read_text(encoding="utf-8") == "Edited"
+
+
+def test_daemon_reports_missing_config(server, tmp_path):
+    response = send_request({"command": "build", "cwd": str(tmp_path), "config": "yax.yml"}, server.socket_path)
+
+    assert response["ok"] is False
+    assert "Configuration file not found" in response["error"]
+
+
+def test_daemon_rejects_unknown_command(server):
+    response = send_request({"command": "explode"}, server.socket_path)
+
+    assert response == {"ok": False, "error": "Unknown command: 'explode'"}
+
+
+def test_second_daemon_on_same_socket_is_refused(server):
+    with pytest.raises(RuntimeError, match="already listening"):
+        YaxServer(server.socket_path)
+
+
+def test_stale_socket_is_replaced(tmp_path):
+    socket_path = tmp_path / "yax.sock"
+    socket_path.write_text("", encoding="utf-8")
+
+    yax_server = YaxServer(socket_path)
+    yax_server.server_close()
+
+    assert not socket_path.exists()
+
+
+def test_fragment_cache_reuses_remote_downloads_within_ttl():
+    calls = []
+
+    def download(key):
+        calls.append(key)
+        return key.upper()
+
+    cache = FragmentCache(ttl=60, download=download)
+    remote = "https://github.com/acme/rules/blob/main/a.md"
+
+    assert cache.download(remote) == remote.upper()
+    assert cache.download(remote) == remote.upper()
+    cache.download("file:/tmp/a.md")
+    cache.download("file:/tmp/a.md")
+
+    assert calls == [remote, "file:/tmp/a.md", "file:/tmp/a.md"]
+
+
+def test_fragment_cache_expires_entries():
+    calls = []
+    cache = FragmentCache(ttl=0, download=lambda key: calls.append(key) or key)
+
+    cache.download("https://example.com/a.md")
+    cache.download("https://example.com/a.md")
+
+    assert len(calls) == 2
+
+
+def test_daemon_socket_is_owner_only(server):
+    assert server.socket_path.stat().st_mode & 0o777 == 0o600
+
+
+def test_client_with_other_token_falls_back(server, tmp_path, monkeypatch):
+    project = tmp_path / "project"
+    _write_project(project)
+    monkeypatch.setenv("GITHUB_TOKEN", "someone-else")
+
+    payload = {"command": "build", "cwd": str(project), "config": "yax.yml", "output": None}
+
+    assert send_request(payload, server.socket_path) is None
+    assert not (project / "AGENTS.md").exists()
+
+
+def test_send_request_times_out_on_wedged_daemon(tmp_path, monkeypatch):
+    import socket
+
+    monkeypatch.setattr("yaxai.daemon.HANDSHAKE_TIMEOUT", 0.2)
+    socket_path = tmp_path / "wedged.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(str(socket_path))
+        listener.listen(1)
+
+        assert send_request({"command": "ping"}, socket_path) is None
+
+
+def test_send_request_waits_for_accepted_request_past_handshake_timeout(server, monkeypatch):
+    import time
+
+    monkeypatch.setattr("yaxai.daemon.HANDSHAKE_TIMEOUT", 0.2)
+    monkeypatch.setattr(server, "_shutdown", lambda payload: time.sleep(0.5) or {"ok": True, "slow": True})
+
+    assert send_request({"command": "shutdown"}, server.socket_path) == {"ok": True, "slow": True}
+
+
+def _serve_once(socket_path, reply):
+    import socket
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(socket_path))
+    listener.listen(1)
+
+    def answer():
+        connection, _ = listener.accept()
+        with connection:
+            connection.makefile("rb").readline()
+            connection.sendall(reply)
+        listener.close()
+
+    thread = threading.Thread(target=answer, daemon=True)
+    thread.start()
+    return thread
+
+
+@pytest.mark.parametrize("reply", [b"", b'{"ok": tr', b"not json\n", b"[1, 2]\n"])
+def test_send_request_falls_back_on_malformed_reply(tmp_path, reply):
+    socket_path = tmp_path / "broken.sock"
+    thread = _serve_once(socket_path, reply)
+
+    assert send_request({"command": "ping"}, socket_path) is None
+    thread.join()
+
+
+def test_send_request_reports_daemon_lost_after_accepting(tmp_path):
+    socket_path = tmp_path / "broken.sock"
+    thread = _serve_once(socket_path, b'{"accepted": true}\n{"ok": tr')
+
+    response = send_request({"command": "ping"}, socket_path)
+
+    assert response["ok"] is False
+    assert "stopped before finishing" in response["error"]
+    thread.join()
+
+
+def test_discover_with_limit_stops_reading_the_catalog(server, tmp_path, monkeypatch):
+    from yaxai.yax import CatalogCollection, Discovery
+
+    produced = []
+
+    def iter_collections(self):
+        for index in range(1000):
+            produced.append(index)
+            yield CatalogCollection(url=f"https://github.com/acme/rules/blob/main/{index}.md")
+
+    monkeypatch.setattr(Discovery, "__init__", lambda self, *args, **kwargs: None)
+    monkeypatch.setattr(Discovery, "iter_collections", iter_collections)
+
+    response = send_request({"command": "discover", "cwd": str(tmp_path), "limit": 3}, server.socket_path)
+
+    assert len(response["collections"]) == 3
+    assert len(produced) == 3
@@ -0,0 +1,59 @@
+from yaxai.dedupe import dedupe_fragments, estimate_tokens, normalize_block, split_blocks
+
+
+GENERAL = "## General rules\n\nBe concise.\n"
+
+
+def test_split_blocks_round_trips_and_ignores_fenced_headings():
+    text = "Intro\n# One\nText\n```\n# not a heading\n```\n## Two\nMore"
+
+    blocks = split_blocks(text)
+
+    assert blocks == ["Intro\n", "# One\nText\n```\n# not a heading\n```\n", "## Two\nMore"]
+    assert "".join(blocks) == text
+
+
+def test_normalize_block_ignores_whitespace_differences():
+    assert normalize_block("## Rules  \n\n  Be   concise.\n") == normalize_block("## Rules\nBe concise.")
+
+
+def test_dedupe_keeps_first_occurrence_of_each_block():
+    fragments = [
+        "# Terraform\nUse modules.\n\n" + GENERAL,
+        "# Python\nUse pytest.\n\n" + GENERAL.replace("Be concise.", "Be   concise.  "),
+    ]
+
+    result = dedupe_fragments(fragments)
+
+    assert result.content == "# Terraform\nUse modules.\n\n" + GENERAL + "\n\n# Python\nUse pytest.\n"
+    assert result.blocks_removed == 1
+    assert result.bytes_saved == len("\n\n".join(fragments)) - len(result.content)
+    assert result.tokens_saved == estimate_tokens("\n\n".join(fragments)) - estimate_tokens(result.content)
+
+
+def test_dedupe_drops_fragments_that_become_empty():
+    result = dedupe_fragments([GENERAL, GENERAL])
+
+    assert result.content == GENERAL
+    assert "removed 1 duplicate block," in result.describe()
+
+
+def test_dedupe_without_duplicates_matches_plain_join():
+    fragments = ["# A\nText", "# B\nOther\n"]
+
+    result = dedupe_fragments(fragments)
+
+    assert result.content == "\n\n".join(fragments)
+    assert (result.blocks_removed, result.bytes_saved, result.tokens_saved) == (0, 0, 0)
+
+
+def test_dedupe_keeps_heading_only_blocks():
+    fragments = [
+        "# Python\n\n## Testing\n\n### Unit\nuse pytest\n",
+        "# Go\n\n## Testing\n\n### Unit\nuse go test\n",
+    ]
+
+    result = dedupe_fragments(fragments)
+
+    assert result.content == "\n\n".join(fragments)
+    assert result.blocks_removed == 0
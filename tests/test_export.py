@@ -0,0 +1,84 @@
+import csv
+import io
+import json
+
+from yaxai.export import (
+    CsvCatalogWriter,
+    HtmlCatalogWriter,
+    JsonLinesCatalogWriter,
+    MarkdownCatalogWriter,
+)
+from yaxai.yax import CatalogCollection
+
+
+def _render(writer_class, organizations):
+    stream = io.StringIO()
+    writer = writer_class(stream)
+    writer.begin()
+    for name, collections in organizations:
+        writer.begin_organization(name)
+        for collection in collections:
+            writer.collection(name, collection)
+        writer.end_organization(name, len(collections))
+    writer.end(len(organizations))
+    return stream.getvalue()
+
+
+ORGANIZATIONS = [
+    (
+        "Acme",
+        [
+            CatalogCollection(url="https://example.com/tf/yax.yml", name="Terraform", output="AGENTS.md"),
+            CatalogCollection(url="https://example.com/aws/yax.yml"),
+        ],
+    ),
+    ("Empty", []),
+]
+
+
+def test_markdown_writer_matches_catalog_layout():
+    assert _render(MarkdownCatalogWriter, ORGANIZATIONS) == (
+        "# Catalog\n\n## Acme\n\n- [Terraform](https://example.com/tf/yax.yml)\n"
+        "- https://example.com/aws/yax.yml\n\n## Empty\n\n_No collections defined._\n"
+    )
+    assert _render(MarkdownCatalogWriter, []) == "# Catalog\n\n_No organizations defined._\n"
+
+
+def test_jsonl_writer_emits_one_row_per_collection():
+    rows = [json.loads(line) for line in _render(JsonLinesCatalogWriter, ORGANIZATIONS).splitlines()]
+
+    assert rows == [
+        {
+            "organization": "Acme",
+            "name": "Terraform",
+            "url": "https://example.com/tf/yax.yml",
+            "output": "AGENTS.md",
+            "output_url": "https://example.com/tf/AGENTS.md",
+        },
+        {
+            "organization": "Acme",
+            "name": None,
+            "url": "https://example.com/aws/yax.yml",
+            "output": None,
+            "output_url": "https://example.com/aws/_agents.md",
+        },
+    ]
+
+
+def test_csv_writer_writes_header_and_rows():
+    rows = list(csv.DictReader(io.StringIO(_render(CsvCatalogWriter, ORGANIZATIONS))))
+
+    assert [row["name"] for row in rows] == ["Terraform", ""]
+    assert rows[1]["output_url"] == "https://example.com/aws/_agents.md"
+
+
+def test_html_writer_escapes_and_embeds_search():
+    organizations = [("<Acme>", [CatalogCollection(url="https://example.com/x/yax.yml", name="A & B")])]
+
+    html = _render(HtmlCatalogWriter, organizations)
+
+    assert "<h2>&lt;Acme&gt;</h2>" in html
+    assert ">A &amp; B</a>" in html
+    assert 'data-search="&lt;acme&gt; a &amp; b https://example.com/x/yax.yml' in html
+    assert 'id="catalog-search"' in html
+    assert html.rstrip().endswith("</html>")
@@ -0,0 +1,42 @@
+from yaxai.fuzzy import FuzzyIndex, trigrams
+
+
+LABELS = [
+    "Terraform rules https://github.com/acme/terraform/blob/main/yax.yml",
+    "Python testing https://github.com/acme/python/blob/main/yax.yml",
+    "Kubernetes manifests https://github.com/acme/k8s/blob/main/yax.yml",
+]
+
+
+def test_trigrams_pad_each_word():
+    assert trigrams("Go") == {"  g", " go", "go "}
+
+
+def test_search_ranks_substring_matches_first():
+    index = FuzzyIndex(LABELS)
+
+    assert index.search("python") == [1]
+    assert index.search("acme")[:3] == [0, 1, 2]
+
+
+def test_search_tolerates_typos():
+    index = FuzzyIndex(LABELS)
+
+    assert index.search("terafrom") == [0]
+    assert index.search("zzz") == []
+
+
+def test_search_looks_for_substrings_within_previous_results():
+    index = FuzzyIndex(LABELS, threshold=1.0)
+
+    assert index.search("ubernet") == [2]
+    assert index.search("ubernet", within=[0, 1]) == []
+    assert index.search("", within=[2, 0]) == [2, 0]
+
+
+def test_search_finds_typo_matches_outside_previous_results():
+    index = FuzzyIndex(LABELS)
+    previous = index.search("tx")
+
+    assert 0 not in previous
+    assert index.search("txrraform", within=previous) == [0]
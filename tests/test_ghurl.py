@@ -1,3 +1,5 @@
+import base64
+import json
 import subprocess
 from types import SimpleNamespace
 from urllib.error import HTTPError, URLError
@@ -6,7 +8,7 @@ from urllib.request import urlopen
 
 import pytest
 
-from yaxai.ghurl import GitHubFile, GitHubTokenFinder
+from yaxai.ghurl import GitHubFile, GitHubTokenFinder, resolve_commit_sha
 
 
 def test_find_returns_stripped_github_token_env(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -197,3 +199,117 @@ def test_parse_rejects_non_string_input() -> None:
 def test_parse_rejects_unsupported_scheme() -> None:
     with pytest.raises(ValueError):
         GitHubFile.parse("ftp://github.com/acme/widgets/blob/main/docs/AGENTS.md")
+
+
+def test_download_conditional_returns_not_modified_on_304(monkeypatch: pytest.MonkeyPatch) -> None:
+    seen_headers = {}
+
+    def fake_urlopen(request, timeout: float = 10.0):
+        seen_headers.update(request.headers)
+        raise HTTPError(request.full_url, 304, "Not Modified", hdrs=None, fp=None)
+
+    monkeypatch.setattr("yaxai.ghurl.urlopen", fake_urlopen)
+
+    instance = GitHubFile.parse("https://github.com/acme/widgets/blob/main/catalog.json")
+    result = instance.download_conditional(etag='"abc"')
+
+    assert result.not_modified
+    assert result.etag == '"abc"'
+    assert seen_headers["If-none-match"] == '"abc"'
+
+
+def test_download_conditional_returns_content_and_validators(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _Response:
+        headers = {"ETag": '"def"', "Last-Modified": "Tue, 02 Jan 2024 00:00:00 GMT"}
+
+        def read(self):
+            return b"{}"
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+    requested = []
+
+    def fake_urlopen(request):
+        requested.append(request.get_method())
+        return _Response()
+
+    monkeypatch.setattr("yaxai.ghurl.urlopen", fake_urlopen)
+
+    result = GitHubFile.parse("https://github.com/acme/widgets/blob/main/catalog.json").download_conditional()
+
+    assert result.content == "{}"
+    assert result.etag == '"def"'
+    assert result.last_modified == "Tue, 02 Jan 2024 00:00:00 GMT"
+    assert requested == ["GET"]
+
+
+def test_download_conditional_uses_api_only_after_raw_404(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _Response:
+        headers = {"ETag": '"api"'}
+
+        def read(self):
+            return json.dumps({"encoding": "base64", "content": base64.b64encode(b"private").decode()}).encode()
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+    requested = []
+
+    def fake_urlopen(request):
+        requested.append(request.full_url)
+        if "raw.githubusercontent.com" in request.full_url:
+            raise HTTPError(request.full_url, 404, "Not Found", hdrs=None, fp=None)
+        return _Response()
+
+    monkeypatch.setattr("yaxai.ghurl.urlopen", fake_urlopen)
+
+    result = GitHubFile.parse("https://github.com/acme/widgets/blob/main/catalog.json").download_conditional()
+
+    assert result.content == "private"
+    assert result.etag == '"api"'
+    assert [url.split("/")[2] for url in requested] == ["raw.githubusercontent.com", "api.github.com"]
+
+
+def test_resolve_commit_sha_asks_commits_api_for_bare_sha(monkeypatch: pytest.MonkeyPatch) -> None:
+    requests = []
+
+    class _Response:
+        def read(self):
+            return b"ABCDEF0123456789ABCDEF0123456789ABCDEF01\n"
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+    def fake_urlopen(request, timeout: float = 10.0):
+        requests.append(request)
+        return _Response()
+
+    monkeypatch.setenv("GITHUB_TOKEN", "token")
+    monkeypatch.setattr("yaxai.ghurl.urlopen", fake_urlopen)
+
+    assert resolve_commit_sha("acme", "widgets", "release/1.0") == "abcdef0123456789abcdef0123456789abcdef01"
+    assert resolve_commit_sha("acme", "widgets", "a" * 40) == "a" * 40
+    assert len(requests) == 1
+    assert requests[0].full_url.endswith("/repos/acme/widgets/commits/release%2F1.0")
+    assert requests[0].headers["Accept"] == "application/vnd.github.sha"
+
+
+def test_resolve_commit_sha_wraps_timeouts(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fake_urlopen(request, timeout: float = 10.0):
+        raise TimeoutError("timed out")
+
+    monkeypatch.setattr("yaxai.ghurl.GitHubTokenFinder.find", lambda self: None)
+    monkeypatch.setattr("yaxai.ghurl.urlopen", fake_urlopen)
+
+    with pytest.raises(RuntimeError, match="Failed to resolve 'main'"):
+        resolve_commit_sha("acme", "widgets", "main")
@@ -0,0 +1,102 @@
+import subprocess
+
+import pytest
+
+from yaxai import gitmirror
+from yaxai.gitmirror import GitMirrorStore, GitSource
+from yaxai.sources import SourceFetcher, SourceResolver
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=yax", "-c", "user.email=yax@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _commit(repo, files, message="update"):
+    for name, text in files.items():
+        path = repo / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", message)
+
+
+@pytest.fixture
+def origin(tmp_path):
+    repo = tmp_path / "rules"
+    repo.mkdir()
+    _git(repo, "init", "-q", "-b", "main")
+    _commit(repo, {"core.md": "# Core\n", "docs/python.md": "# Python\n"})
+    _git(repo, "tag", "v1")
+    return repo
+
+
+def test_parse_git_sources():
+    source = GitSource.parse("git+ssh://git@github.com:22/acme/rules.git@release/2.0:docs/@types.md")
+
+    assert source == GitSource("ssh://git@github.com:22/acme/rules.git", "release/2.0", "docs/@types.md")
+    with pytest.raises(ValueError, match="must look like"):
+        GitSource.parse("git+https://github.com/acme/rules.git")
+    with pytest.raises(ValueError, match="must use one of"):
+        GitSource.parse("git+ftp://example.com/rules.git@main:core.md")
+
+
+def test_store_reads_files_at_any_ref_with_one_fetch_and_one_process(tmp_path, origin):
+    store = GitMirrorStore(tmp_path / "mirrors")
+    repo_url = f"file://{origin}"
+    _commit(origin, {"core.md": "# Core v2\n"})
+
+    try:
+        assert store.read(f"git+{repo_url}@main:core.md") == "# Core v2\n"
+        process = store.mirror(repo_url)._process
+        assert store.read(f"git+{repo_url}@v1:core.md") == "# Core\n"
+        assert store.read(f"git+{repo_url}@main:/docs/python.md") == "# Python\n"
+
+        mirror = store.mirror(repo_url)
+        assert mirror.fetches == 1
+        assert mirror._process is process
+        with pytest.raises(RuntimeError, match="not found"):
+            store.read(f"git+{repo_url}@main:missing.md")
+        with pytest.raises(RuntimeError, match="is a tree"):
+            store.read(f"git+{repo_url}@main:docs")
+    finally:
+        store.close()
+
+
+def test_existing_mirror_is_updated_incrementally(tmp_path, origin):
+    repo_url = f"file://{origin}"
+    first = GitMirrorStore(tmp_path / "mirrors")
+    assert first.read(f"git+{repo_url}@main:core.md") == "# Core\n"
+    first.close()
+
+    _commit(origin, {"core.md": "# Core v2\n"})
+    second = GitMirrorStore(tmp_path / "mirrors", fetch_interval=0)
+    try:
+        assert second.read(f"git+{repo_url}@main:core.md") == "# Core v2\n"
+        assert second.mirror(repo_url).path == first.mirror(repo_url).path
+    finally:
+        second.close()
+
+
+def test_resolver_reads_git_sources_and_nested_configs(tmp_path, origin, monkeypatch):
+    repo_url = f"file://{origin}"
+    _commit(origin, {"team/yax.yml": f"build:\n  agentsmd:\n    from:\n      - git+{repo_url}@main:core.md\n"})
+    store = GitMirrorStore(tmp_path / "mirrors")
+    monkeypatch.setattr(gitmirror, "_default_store", store)
+
+    try:
+        with SourceFetcher() as fetcher:
+            graph = SourceResolver(fetcher, base_dir=tmp_path).resolve(
+                [f"git+{repo_url}@main:team/yax.yml", f"git+{repo_url}@v1:docs/python.md"]
+            )
+            keys = graph.fragments()
+            texts = fetcher.fetch_all(keys)
+    finally:
+        store.close()
+
+    assert [texts[key] for key in keys] == ["# Core\n", "# Python\n"]
+    assert store.mirror(repo_url).fetches == 1
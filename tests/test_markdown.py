@@ -0,0 +1,48 @@
+from yaxai.dedupe import split_blocks
+from yaxai.markdown import FenceTracker, heading_match
+from yaxai.minify import minify_markdown
+from yaxai.sections import scan_sections
+
+
+# The "``` not a close" line has text after the marker, so the block stays open.
+DOCUMENT = (
+    "# Setup\n"
+    "```sh\n"
+    "``` not a close\n"
+    "# inside code\n"
+    "```\n"
+    "# Usage\n"
+    "Run it.\n"
+)
+
+
+def test_fence_tracker_closes_only_on_a_bare_marker_of_the_same_kind():
+    fences = FenceTracker()
+
+    kinds = [fences.feed(line) for line in DOCUMENT.splitlines(keepends=True)]
+
+    assert kinds == [False, True, True, True, True, False, False]
+    assert fences.fence == ""
+
+
+def test_fence_tracker_needs_a_long_enough_marker_to_close():
+    fences = FenceTracker()
+
+    for line in ["~~~~\n", "~~~\n", "```\n"]:
+        fences.feed(line)
+
+    assert fences.fence == "~~~~"
+
+
+def test_heading_match_ignores_line_endings_and_closing_hashes():
+    match = heading_match("## Networking ##\r\n")
+
+    assert match.group(1) == "##"
+    assert match.group(2) == "Networking"
+    assert heading_match("#hashtag\n") is None
+
+
+def test_stages_agree_on_fenced_code():
+    assert [section.title for section in scan_sections(DOCUMENT.splitlines(keepends=True))] == ["Setup", "Usage"]
+    assert [block.splitlines()[0] for block in split_blocks(DOCUMENT)] == ["# Setup", "# Usage"]
+    assert "# inside code\n" in minify_markdown(DOCUMENT)
@@ -0,0 +1,77 @@
+from yaxai.minify import minify_fragments, minify_markdown
+
+
+def test_minify_keeps_fenced_code_byte_for_byte():
+    code = "```yaml\n<!-- kept -->\nkey: value   \n\n\n\n[ref]: https://example.com\n```\n"
+
+    assert minify_markdown("# Config\n\n" + code) == "# Config\n\n" + code
+
+
+def test_minify_strips_comments_badges_and_trailing_whitespace():
+    text = (
+        "# Project <!-- title -->\n"
+        "[![Build](https://ci.example.com/badge.svg)](https://ci.example.com)\n"
+        "![PyPI](https://img.shields.io/pypi/v/yaxai)\n"
+        "Run the tests. \t\n"
+        "![Diagram](docs/diagram.png)\n"
+        "[![Architecture](docs/arch.png)](docs/arch.md)\n"
+    )
+
+    assert minify_markdown(text) == (
+        "# Project\nRun the tests.\n![Diagram](docs/diagram.png)\n[![Architecture](docs/arch.png)](docs/arch.md)\n"
+    )
+
+
+def test_minify_keeps_hard_line_breaks():
+    text = "# Title   \nFirst line    \n<!-- note -->\nsecond line\t\nthird line  \n\nLast line  \n"
+
+    # Breaks before a blank line or the end of the text break nothing.
+    assert minify_markdown(text) == "# Title\nFirst line  \nsecond line\nthird line\n\nLast line\n"
+
+
+def test_minify_removes_multi_line_comments():
+    text = "Before\n<!--\nhidden\nlines\n-->\nAfter <!-- a\nb --> tail\n"
+
+    # Only comments starting a line open an HTML comment block.
+    assert minify_markdown(text) == "Before\nAfter <!-- a\nb --> tail\n"
+
+
+def test_minify_inlines_reference_links_and_drops_definitions():
+    text = (
+        "See the [guide][docs], the [FAQ][] and [Docs].\n"
+        "Check [x] stays.\n\n"
+        "[docs]: https://example.com/docs \"Docs\"\n"
+        "[faq]: https://example.com/faq\n"
+    )
+
+    assert minify_markdown(text) == (
+        "See the [guide](https://example.com/docs), the [FAQ](https://example.com/faq)"
+        " and [Docs](https://example.com/docs).\n"
+        "Check [x] stays.\n"
+    )
+
+
+def test_minify_collapses_blank_lines_and_keeps_inline_code():
+    text = "\n\nUse `<!-- not a comment -->` here.\n\n\n\n    indented code  \n"
+
+    assert minify_markdown(text) == "Use `<!-- not a comment -->` here.\n\n    indented code  \n"
+
+
+def test_minify_fragments_counts_bytes():
+    result = minify_fragments(["a  \n\n\n\nb\n", "c\n"])
+
+    assert result.fragments == ["a\n\nb\n", "c\n"]
+    assert (result.bytes_before, result.bytes_after) == (11, 7)
+    assert result.describe() == "11 -> 7 bytes (-36%)"
+
+
+def test_minify_keeps_text_after_a_lone_comment_opener():
+    text = "Use <!-- to start comments.\n\n## Next\n\n```\ncode  \n```\n"
+
+    assert minify_markdown(text) == "Use <!-- to start comments.\n\n## Next\n\n```\ncode  \n```\n"
+
+
+def test_minify_never_swallows_fences_into_an_unclosed_comment():
+    text = "<!-- draft\nnotes\n```\ncode\n```\n"
+
+    assert minify_markdown(text) == text
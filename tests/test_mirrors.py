@@ -0,0 +1,113 @@
+from urllib.error import HTTPError, URLError
+
+import pytest
+
+from yaxai.ghurl import GitHubFile
+from yaxai.mirrors import MirrorPool, configured_mirrors, mirror_pool
+
+
+URL = "https://github.com/acme/rules/blob/main/docs/core.md"
+
+
+class _Response:
+    def __init__(self, body):
+        self.body = body
+
+    def read(self):
+        return self.body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+def test_configured_mirrors_combines_env_and_user_config(tmp_path, monkeypatch):
+    config = tmp_path / "config.yml"
+    config.write_text(
+        "github:\n  mirrors:\n    - https://proxy.internal/github-raw/\n    - https://backup.internal/raw\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("YAX_GITHUB_MIRRORS", "https://fast.internal/raw, https://proxy.internal/github-raw")
+
+    assert configured_mirrors(config) == [
+        "https://fast.internal/raw",
+        "https://proxy.internal/github-raw",
+        "https://backup.internal/raw",
+    ]
+
+
+def test_configured_mirrors_rejects_non_http_urls(tmp_path, monkeypatch):
+    monkeypatch.setenv("YAX_GITHUB_MIRRORS", "ftp://mirror.internal")
+
+    with pytest.raises(ValueError, match="must start with http"):
+        configured_mirrors(tmp_path / "missing.yml")
+
+
+def test_pool_skips_failed_mirrors_until_cooldown_passes(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("yaxai.mirrors.time.monotonic", lambda: clock[0])
+    pool = MirrorPool(["https://a", "https://b"], cooldown=60)
+
+    pool.mark_failed("https://a")
+    assert pool.candidates() == ["https://b"]
+
+    clock[0] += 61
+    assert pool.candidates() == ["https://a", "https://b"]
+
+    pool.mark_failed("https://b")
+    pool.mark_ok("https://b")
+    assert pool.candidates() == ["https://a", "https://b"]
+
+
+def test_mirror_pool_reads_configuration_once(monkeypatch):
+    calls = []
+    monkeypatch.setattr("yaxai.mirrors._pool", None)
+    monkeypatch.setattr("yaxai.mirrors.configured_mirrors", lambda: calls.append(1) or ["https://a"])
+
+    assert mirror_pool() is mirror_pool()
+    assert mirror_pool().urls == ["https://a"]
+    assert calls == [1]
+
+
+def test_download_prefers_healthy_mirror_and_keeps_canonical_url(monkeypatch):
+    requested = []
+
+    def fake_urlopen(request, timeout=None):
+        requested.append(request.full_url)
+        if request.full_url.startswith("https://down.internal"):
+            raise URLError("connection refused")
+        return _Response(b"# Core\n")
+
+    monkeypatch.setattr("yaxai.ghurl.urlopen", fake_urlopen)
+    pool = MirrorPool(["https://down.internal", "https://proxy.internal/raw"])
+    github_file = GitHubFile.parse(URL)
+
+    assert github_file.download(mirrors=pool) == "# Core\n"
+    assert github_file.download(mirrors=pool) == "# Core\n"
+    assert requested == [
+        "https://down.internal/acme/rules/main/docs/core.md",
+        "https://proxy.internal/raw/acme/rules/main/docs/core.md",
+        "https://proxy.internal/raw/acme/rules/main/docs/core.md",
+    ]
+    assert github_file.url == URL
+    assert github_file.raw() == "https://raw.githubusercontent.com/acme/rules/main/docs/core.md"
+
+
+def test_download_falls_back_to_public_host_when_mirrors_miss(monkeypatch):
+    requested = []
+
+    def fake_urlopen(request, timeout=None):
+        requested.append(request.full_url)
+        if "mirror.internal" in request.full_url:
+            raise HTTPError(request.full_url, 404, "Not Found", hdrs=None, fp=None)
+        return _Response(b"public")
+
+    monkeypatch.setattr("yaxai.ghurl.urlopen", fake_urlopen)
+    monkeypatch.setattr(GitHubFile, "is_visible", lambda self: True)
+    pool = MirrorPool(["https://mirror.internal"])
+
+    assert GitHubFile.parse(URL).download(mirrors=pool) == "public"
+    assert requested[-1] == "https://raw.githubusercontent.com/acme/rules/main/docs/core.md"
+    assert pool.candidates() == ["https://mirror.internal"]
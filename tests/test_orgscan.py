@@ -0,0 +1,132 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+import pytest
+
+from yaxai.orgscan import OrganizationScanner, is_config_path
+
+
+class FakeGitHubApi:
+    def __init__(self):
+        self.heads = {"acme/service": "sha-1", "acme/docs": "sha-2", "acme/empty": None}
+        self.trees = {
+            "sha-1": ["yax.yml", "README.md", "tools/lint-yax.yml"],
+            "sha-2": ["docs/yax.yml"],
+            "sha-3": ["yax.yml"],
+        }
+        self.requests = []
+
+    def route(self, path, base_url):
+        parsed = urlparse(path)
+        self.requests.append(parsed.path)
+        parts = [part for part in parsed.path.split("/") if part]
+
+        if parts == ["orgs", "acme", "repos"]:
+            if "page=2" in parsed.query:
+                return 200, [_repo("acme/empty"), dict(_repo("acme/old"), archived=True)], {}
+            link = f'<{base_url}/orgs/acme/repos?per_page=100&page=2>; rel="next"'
+            return 200, [_repo("acme/service"), _repo("acme/docs")], {"Link": link}
+
+        if len(parts) == 5 and parts[3] == "branches":
+            sha = self.heads.get(f"{parts[1]}/{parts[2]}")
+            if sha is None:
+                return 404, {"message": "Branch not found"}, {}
+            return 200, {"name": parts[4], "commit": {"sha": sha}}, {}
+
+        if len(parts) == 6 and parts[3:5] == ["git", "trees"]:
+            tree = [{"path": path, "type": "blob"} for path in self.trees[parts[5]]]
+            return 200, {"sha": parts[5], "tree": tree + [{"path": "docs", "type": "tree"}]}, {}
+
+        return 404, {"message": "Not Found"}, {}
+
+
+def _repo(full_name):
+    return {"full_name": full_name, "default_branch": "main", "archived": False}
+
+
+@pytest.fixture(name="api")
+def fixture_api():
+    fake = FakeGitHubApi()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            status, body, headers = fake.route(self.path, base_url)
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    fake.base_url = base_url
+    yield fake
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_is_config_path_matches_yax_configs():
+    assert is_config_path("yax.yml")
+    assert is_config_path("nested/dir/frontend-yax.yml")
+    assert not is_config_path("-yax.yml")
+    assert not is_config_path("yax-catalog.yml")
+    assert not is_config_path("notyax.yml")
+
+
+def test_scan_lists_configs_across_paginated_repositories(api, tmp_path):
+    scanner = OrganizationScanner("acme", state_path=tmp_path / "scan.json", api_url=api.base_url, token="")
+
+    sources = scanner.scan()
+
+    assert sources == [
+        "https://github.com/acme/service/blob/main/tools/lint-yax.yml",
+        "https://github.com/acme/service/blob/main/yax.yml",
+        "https://github.com/acme/docs/blob/main/docs/yax.yml",
+    ]
+    assert not any("acme/old" in path for path in api.requests)
+
+    state = json.loads((tmp_path / "scan.json").read_text(encoding="utf-8"))
+    assert state["repositories"]["acme/service"]["sha"] == "sha-1"
+
+
+def test_scan_skips_tree_listing_for_unchanged_repositories(api, tmp_path):
+    state_path = tmp_path / "scan.json"
+    OrganizationScanner("acme", state_path=state_path, api_url=api.base_url, token="").scan()
+
+    api.requests.clear()
+    api.heads["acme/docs"] = "sha-3"
+    sources = OrganizationScanner("acme", state_path=state_path, api_url=api.base_url, token="").scan()
+
+    tree_requests = [path for path in api.requests if "/git/trees/" in path]
+    assert tree_requests == ["/repos/acme/docs/git/trees/sha-3"]
+    assert "https://github.com/acme/docs/blob/main/yax.yml" in sources
+    assert "https://github.com/acme/service/blob/main/yax.yml" in sources
+
+
+def test_scan_honours_api_url_environment_override(api, monkeypatch):
+    monkeypatch.setenv("YAX_GITHUB_API_URL", api.base_url + "/")
+
+    sources = OrganizationScanner("acme", token="").scan()
+
+    assert len(sources) == 3
+
+
+def test_scan_reports_unknown_organization(api):
+    with pytest.raises(FileNotFoundError):
+        OrganizationScanner("missing", api_url=api.base_url, token="").scan()
+
+
+def test_scanner_requires_organization():
+    with pytest.raises(ValueError):
+        OrganizationScanner("  ", token="")
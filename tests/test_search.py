@@ -0,0 +1,49 @@
+import pytest
+
+from yaxai.search import SearchDocument, SearchIndex, tokenize
+
+
+def _documents():
+    return [
+        SearchDocument("acme", "https://example.com/tf/_agents.md", "Terraform", "Always enable state locking with DynamoDB. State files live in S3."),
+        SearchDocument("acme", "https://example.com/aws/_agents.md", "AWS", "Tag every AWS resource with an owner."),
+        SearchDocument("acme", "https://example.com/py/_agents.md", None, "Use ruff and pytest. Keep state out of module globals."),
+    ]
+
+
+def test_tokenize_lowercases_and_drops_stopwords():
+    assert tokenize("The Terraform state-locking, in S3!") == ["terraform", "state", "locking", "s3"]
+
+
+def test_search_ranks_documents_with_bm25():
+    index = SearchIndex.build(_documents())
+
+    hits = index.search("terraform state locking")
+
+    assert [hit.document.name for hit in hits] == ["Terraform", None]
+    assert hits[0].score > hits[1].score
+    assert "state locking" in hits[0].snippet
+
+
+def test_search_returns_empty_for_unknown_terms():
+    index = SearchIndex.build(_documents())
+
+    assert index.search("kubernetes") == []
+    assert index.search("the") == []
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = SearchIndex.path_for(tmp_path / "yax-catalog.json")
+    SearchIndex.build(_documents()).save(path)
+
+    assert path == tmp_path / "yax-catalog.search.sqlite"
+    hits = SearchIndex.load(path).search("owner", limit=1)
+    assert [hit.document.url for hit in hits] == ["https://example.com/aws/_agents.md"]
+
+
+def test_load_rejects_invalid_index(tmp_path):
+    path = tmp_path / "broken.search.sqlite"
+    path.write_text("not json", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        SearchIndex.load(path)
@@ -0,0 +1,74 @@
+from yaxai.sections import (
+    SectionIndexCache,
+    heading_anchor,
+    scan_sections,
+    select_sections,
+    split_section_selector,
+    with_section_selector,
+)
+
+
+DOCUMENT = (
+    "Intro\n"
+    "# Infra\n"
+    "## Terraform State\n"
+    "Use remote state.\n"
+    "```sh\n"
+    "# not a heading\n"
+    "```\n"
+    "## Networking ##\n"
+    "VPCs.\n"
+    "# Notes\n"
+    "## Networking\n"
+    "More.\n"
+)
+
+
+def test_heading_anchor_matches_github():
+    assert heading_anchor("Terraform State") == "terraform-state"
+    assert heading_anchor("C++ & Rust: FAQ!") == "c--rust-faq"
+
+
+def test_scan_sections_records_subtree_offsets():
+    sections = scan_sections(DOCUMENT.splitlines(keepends=True))
+
+    assert [(section.level, section.anchor) for section in sections] == [
+        (1, "infra"),
+        (2, "terraform-state"),
+        (2, "networking"),
+        (1, "notes"),
+        (2, "networking-1"),
+    ]
+    infra = sections[0]
+    assert DOCUMENT[infra.start:infra.end].startswith("# Infra\n")
+    assert DOCUMENT[infra.start:infra.end].endswith("VPCs.\n")
+    assert sections[-1].end == len(DOCUMENT)
+
+
+def test_select_sections_merges_nested_selections():
+    selected = select_sections(DOCUMENT, ["terraform-state", "Infra", "networking-1"])
+
+    assert selected == DOCUMENT[DOCUMENT.index("# Infra"):DOCUMENT.index("# Notes")] + "\n## Networking\nMore.\n"
+
+
+def test_section_index_is_cached_by_content():
+    cache = SectionIndexCache()
+
+    select_sections(DOCUMENT, ["infra"], cache=cache)
+    select_sections(str(DOCUMENT), ["notes"], cache=cache)
+
+    assert cache.parses == 1
+
+
+def test_selector_round_trip():
+    assert split_section_selector("file:a.md#yax:x, y") == ("file:a.md", ["x", "y"])
+    assert split_section_selector("file:a.md") == ("file:a.md", [])
+    assert with_section_selector("file:a.md#yax:old", ["x", "y"]) == "file:a.md#yax:x,y"
+
+
+def test_plain_url_fragments_are_not_selectors():
+    url = "https://github.com/acme/rules/blob/main/org.md#L10"
+
+    assert split_section_selector(url) == (url, [])
+    assert split_section_selector("https://github.com/acme/rules#readme") == ("https://github.com/acme/rules#readme", [])
+    assert with_section_selector(url, ["python"]) == f"{url}#yax:python"
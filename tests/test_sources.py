@@ -0,0 +1,148 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+from yaxai.sources import SourceFetcher, SourceResolver, is_config_source
+
+
+SHARED = "https://github.com/acme/shared/blob/main/yax.yml"
+BASE = "https://github.com/acme/shared/blob/main/base.md"
+STYLE = "https://github.com/acme/shared/blob/main/style.md"
+
+
+class FakeRemote:
+    def __init__(self, files):
+        self.files = files
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, key):
+        with self.lock:
+            self.calls.append(key)
+        if key.startswith("file:"):
+            return Path(key[len("file:"):]).read_text(encoding="utf-8")
+        return self.files[key]
+
+
+def _config(*entries):
+    lines = "".join(f"      - {entry}\n" for entry in entries)
+    return f"build:\n  agentsmd:\n    from:\n{lines}"
+
+
+def test_is_config_source():
+    assert is_config_source(SHARED)
+    assert is_config_source("file:team/frontend-yax.yaml")
+    assert not is_config_source(BASE)
+
+
+def test_resolve_expands_nested_configs_once(tmp_path):
+    team = tmp_path / "team"
+    team.mkdir()
+    (team / "yax.yml").write_text(_config(SHARED, "file:team.md"), encoding="utf-8")
+    (team / "team.md").write_text("team", encoding="utf-8")
+    remote = FakeRemote({SHARED: _config(BASE, STYLE), BASE: "base", STYLE: "style"})
+
+    with SourceFetcher(download=remote) as fetcher:
+        graph = SourceResolver(fetcher, base_dir=tmp_path).resolve([SHARED, "file:team/yax.yml"])
+        keys = graph.fragments()
+        texts = fetcher.fetch_all(keys)
+
+    assert [texts[key] for key in keys] == ["base", "style", "base", "style", "team"]
+    assert sorted(remote.calls) == sorted(
+        [SHARED, BASE, STYLE, f"file:{team / 'yax.yml'}", f"file:{team / 'team.md'}"]
+    )
+
+
+def test_resolve_detects_cycles(tmp_path):
+    (tmp_path / "a-yax.yml").write_text(_config("file:b-yax.yml"), encoding="utf-8")
+    (tmp_path / "b-yax.yml").write_text(_config("file:a-yax.yml"), encoding="utf-8")
+
+    with SourceFetcher(download=FakeRemote({})) as fetcher:
+        with pytest.raises(ValueError, match="cycle"):
+            SourceResolver(fetcher, base_dir=tmp_path).resolve(["file:a-yax.yml"])
+
+
+def test_remote_configs_cannot_reference_local_files():
+    remote = FakeRemote({SHARED: _config("file:secrets.md")})
+
+    with SourceFetcher(download=remote) as fetcher:
+        with pytest.raises(RuntimeError, match="cannot reference local file"):
+            SourceResolver(fetcher).resolve([SHARED])
+
+
+def test_render_marks_shared_configs(tmp_path):
+    remote = FakeRemote({SHARED: _config(BASE), BASE: "base"})
+    (tmp_path / "yax.yml").write_text(_config(SHARED), encoding="utf-8")
+
+    with SourceFetcher(download=remote) as fetcher:
+        graph = SourceResolver(fetcher, base_dir=tmp_path).resolve([SHARED, "file:yax.yml"], root="project")
+
+    assert graph.render().splitlines() == [
+        "project",
+        f"- {SHARED}",
+        f"  - {BASE}",
+        f"- file:{tmp_path / 'yax.yml'}",
+        f"  - {SHARED} (shown above)",
+    ]
+
+
+def test_origin_fragments_attribute_nested_fragments_to_top_level_entries(tmp_path):
+    (tmp_path / "local.md").write_text("local", encoding="utf-8")
+    remote = FakeRemote(
+        {
+            SHARED: "build:\n  agentsmd:\n    from:\n      - url: " + BASE + "\n        priority: 3\n      - " + STYLE + "\n",
+            BASE: "base",
+            STYLE: "style",
+        }
+    )
+
+    with SourceFetcher(download=remote) as fetcher:
+        graph = SourceResolver(fetcher, tmp_path).resolve(["file:*.md", SHARED])
+
+    assert graph.origin_fragments() == [
+        ("file:*.md", f"file:{tmp_path / 'local.md'}"),
+        (SHARED, BASE),
+        (SHARED, STYLE),
+    ]
+
+
+def test_section_selectors_share_one_download(tmp_path):
+    guide = "# Guide\nIntro\n## Terraform State\nUse remote state.\n### Locking\nLock it.\n## Python\nUse pytest.\n"
+    (tmp_path / "guide.md").write_text(guide, encoding="utf-8")
+    remote = FakeRemote(
+        {
+            SHARED: "build:\n  agentsmd:\n    from:\n      - url: " + BASE + "\n        sections: [python]\n",
+            BASE: guide,
+        }
+    )
+
+    with SourceFetcher(download=remote) as fetcher:
+        graph = SourceResolver(fetcher, base_dir=tmp_path).resolve(
+            [BASE + "#yax:terraform-state", "file:guide.md#yax:Locking,python", SHARED]
+        )
+        keys = graph.fragments()
+        texts = fetcher.fetch_all(keys)
+
+    assert [texts[key] for key in keys] == [
+        "## Terraform State\nUse remote state.\n### Locking\nLock it.\n",
+        "### Locking\nLock it.\n## Python\nUse pytest.\n",
+        "## Python\nUse pytest.\n",
+    ]
+    assert sorted(remote.calls) == sorted([BASE, SHARED, f"file:{tmp_path / 'guide.md'}"])
+
+
+def test_missing_section_is_reported(tmp_path):
+    (tmp_path / "guide.md").write_text("# Guide\n", encoding="utf-8")
+
+    with SourceFetcher(download=FakeRemote({})) as fetcher:
+        with pytest.raises(ValueError, match="Section 'missing' not found"):
+            fetcher.fetch(f"file:{tmp_path / 'guide.md'}#yax:missing")
+
+
+def test_url_fragment_fetches_whole_document():
+    document = "# Guide\nIntro\n## Python\nUse pytest.\n"
+    remote = FakeRemote({BASE + "#L10": document})
+
+    with SourceFetcher(download=remote) as fetcher:
+        assert fetcher.fetch(BASE + "#L10") == document
@@ -0,0 +1,84 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# `import yaxai.cli` may take at most this many times the `typer` import it
+# needs anyway (currently about 2x). Both are measured in the same process,
+# so machine load scales them alike; importing yaxai.yax eagerly would push
+# the ratio to about 8x.
+CLI_IMPORT_BUDGET_RATIO = 3.0
+
+# Modules that `import yaxai.cli` must leave for the commands that need them.
+HEAVY_MODULES = (
+    "pydantic",
+    "yaml",
+    "sqlite3",
+    "urllib.request",
+    "concurrent.futures",
+    "yaxai.yax",
+    "yaxai.agentsmd",
+    "yaxai.sources",
+    "yaxai.daemon",
+)
+
+
+def _run_python(code: str, *args: str, cwd: Path = ROOT) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        cwd=cwd,
+        env={"PYTHONPATH": str(ROOT), "PATH": ""},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cumulative_import_times(module: str) -> dict:
+    result = _run_python(f"import {module}", "-X", "importtime")
+    times = {}
+    for line in result.stderr.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[1].isdigit():
+            times[parts[2]] = int(parts[1])
+    return times
+
+
+def test_cli_import_defers_heavy_modules():
+    code = (
+        "import sys, yaxai.cli\n"
+        f"print(','.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))\n"
+    )
+
+    assert _run_python(code).stdout.strip() == ""
+
+
+def test_cli_import_time_within_budget():
+    ratios = []
+    for _ in range(3):
+        times = _cumulative_import_times("yaxai.cli")
+        ratios.append(times["yaxai.cli"] / times["typer"])
+
+    assert min(ratios) < CLI_IMPORT_BUDGET_RATIO, (
+        f"import yaxai.cli took {min(ratios):.1f}x the typer import (budget {CLI_IMPORT_BUDGET_RATIO}x)"
+    )
+
+
+def test_plain_build_runs_without_pydantic(tmp_path):
+    (tmp_path / "fragment.md").write_text("Fragment", encoding="utf-8")
+    (tmp_path / "yax.yml").write_text(
+        "build:\n  agentsmd:\n    from:\n      - file:fragment.md\n",
+        encoding="utf-8",
+    )
+    code = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from yaxai.cli import app\n"
+        "result = CliRunner().invoke(app, ['build'])\n"
+        "assert result.exit_code == 0, result.output\n"
+        "print('pydantic' in sys.modules)\n"
+    )
+
+    assert _run_python(code, cwd=tmp_path).stdout.strip() == "False"
+    assert (tmp_path / "AGENTS.md").read_text(encoding="utf-8") == "Fragment"
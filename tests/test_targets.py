@@ -0,0 +1,31 @@
+import pytest
+
+from yaxai.targets import infer_target_format, render_target
+
+
+def test_infer_target_format_from_extension():
+    assert infer_target_format(".cursor/rules/project.mdc") == "mdc"
+    assert infer_target_format("CLAUDE.md") == "markdown"
+
+
+def test_render_markdown_returns_content_unchanged():
+    assert render_target("# Rules", "markdown") == "# Rules"
+
+
+def test_render_cursor_rule_adds_front_matter():
+    rendered = render_target("# Rules", "mdc", description="Project rules", globs=["src/**/*.ts", "*.md"])
+
+    assert rendered == (
+        "---\n"
+        "description: Project rules\n"
+        "globs: src/**/*.ts,*.md\n"
+        "alwaysApply: true\n"
+        "---\n"
+        "\n"
+        "# Rules"
+    )
+
+
+def test_render_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        render_target("# Rules", "docx")
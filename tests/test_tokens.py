@@ -0,0 +1,29 @@
+import pytest
+
+from yaxai.tokens import TOKEN_ESTIMATORS, estimate_bpe_tokens, estimate_tokens, register_token_estimator
+
+
+def test_bpe_estimate_counts_common_words_once():
+    assert estimate_bpe_tokens("Use pytest for tests.") == 5
+
+
+def test_bpe_estimate_splits_long_words_and_numbers():
+    assert estimate_bpe_tokens("internationalization") == 4
+    assert estimate_bpe_tokens("1234567") == 3
+
+
+def test_char_estimate():
+    assert estimate_tokens("abcdefgh", "chars") == 2
+
+
+def test_registered_estimators_are_selectable():
+    register_token_estimator("words", lambda text: len(text.split()))
+    try:
+        assert estimate_tokens("one two three", "words") == 3
+    finally:
+        TOKEN_ESTIMATORS.pop("words")
+
+
+def test_unknown_tokenizer_is_rejected():
+    with pytest.raises(ValueError, match="Unknown tokenizer 'nope'"):
+        estimate_tokens("text", "nope")
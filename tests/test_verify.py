@@ -0,0 +1,173 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from yaxai.ghurl import GitHubFile
+from yaxai.verify import LINK_DEAD, LINK_ERROR, LINK_MOVED, LINK_OK, LINK_PRIVATE, LinkCheck, LinkChecker
+
+
+class FakeServer:
+    def __init__(self):
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self.delay = 0.0
+        self.lock = threading.Lock()
+
+    def respond(self, handler):
+        with self.lock:
+            self.requests.append((handler.command, handler.path, dict(handler.headers)))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            path = handler.path
+            if path == "/ok":
+                if handler.headers.get("If-None-Match") == '"v1"':
+                    return 304, {}
+                return 200, {"ETag": '"v1"'}
+            if path == "/moved":
+                return 301, {"Location": "/ok"}
+            if path == "/private":
+                return 403, {}
+            if path == "/get-only":
+                return (405, {}) if handler.command == "HEAD" else (206, {})
+            if path == "/api/contents" and handler.headers.get("Authorization") == "token secret":
+                return 200, {}
+            if path.startswith("/slow/"):
+                return 200, {}
+            return 404, {}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+@pytest.fixture(name="server")
+def fixture_server():
+    fake = FakeServer()
+
+    class Handler(BaseHTTPRequestHandler):
+        def _handle(self):
+            status, headers = fake.respond(self)
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        do_HEAD = _handle
+        do_GET = _handle
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    fake.base_url = f"http://127.0.0.1:{httpd.server_port}"
+
+    yield fake
+
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_check_reports_link_states(server):
+    checker = LinkChecker(token="")
+    base = server.base_url
+
+    results = checker.check_all([f"{base}/ok", f"{base}/moved", f"{base}/private", f"{base}/missing"])
+
+    assert results[f"{base}/ok"].status == LINK_OK
+    assert results[f"{base}/ok"].etag == '"v1"'
+    assert results[f"{base}/moved"].status == LINK_MOVED
+    assert results[f"{base}/moved"].location == "/ok"
+    assert results[f"{base}/private"].status == LINK_PRIVATE
+    assert results[f"{base}/missing"].status == LINK_DEAD
+    assert results[f"{base}/missing"].http_status == 404
+    assert all(result.latency >= 0 for result in results.values())
+
+
+def test_check_sends_validators(server):
+    url = f"{server.base_url}/ok"
+
+    result = LinkChecker(token="").check_all([url], {url: {"etag": '"v1"'}})[url]
+
+    assert result == LinkCheck(url, LINK_OK, 304, result.latency, etag='"v1"')
+    assert server.requests[-1][2]["If-None-Match"] == '"v1"'
+
+
+def test_check_falls_back_to_get_when_head_is_not_allowed(server):
+    result = LinkChecker(token="").check(f"{server.base_url}/get-only")
+
+    assert result.status == LINK_OK
+    assert [request[0] for request in server.requests] == ["HEAD", "GET"]
+    assert server.requests[-1][2]["Range"] == "bytes=0-0"
+
+
+def test_check_limits_requests_per_host(server):
+    server.delay = 0.05
+    urls = [f"{server.base_url}/slow/{index}" for index in range(12)]
+
+    results = LinkChecker(max_workers=12, per_host=3, token="").check_all(urls + urls[:2])
+
+    assert len(results) == 12
+    assert len(server.requests) == 12
+    assert server.max_active <= 3
+
+
+def test_check_applies_host_limits_over_per_host(server):
+    server.delay = 0.05
+    urls = [f"{server.base_url}/slow/{index}" for index in range(8)]
+    host = server.base_url.split("://", 1)[1]
+
+    LinkChecker(max_workers=8, per_host=1, token="", host_limits={host: 4}).check_all(urls)
+
+    assert 1 < server.max_active <= 4
+
+
+def test_check_all_resolves_the_token_before_checking(server, monkeypatch):
+    resolved = []
+    monkeypatch.setattr(GitHubFile, "raw", lambda self: f"{server.base_url}/ok")
+    monkeypatch.setattr("yaxai.verify.GitHubTokenFinder.find", lambda self: resolved.append(True) or None)
+    urls = [f"https://github.com/acme/rules/blob/main/{index}.md" for index in range(4)]
+
+    LinkChecker().check_all(urls)
+
+    assert resolved == [True]
+
+
+def test_check_latency_excludes_waiting_for_a_host_slot(server):
+    server.delay = 0.1
+    urls = [f"{server.base_url}/slow/{index}" for index in range(4)]
+
+    results = LinkChecker(max_workers=4, per_host=1, token="").check_all(urls)
+
+    assert all(result.latency < 0.3 for result in results.values())
+
+
+def test_check_reports_private_github_files(server, monkeypatch):
+    monkeypatch.setattr(GitHubFile, "raw", lambda self: f"{server.base_url}/missing")
+    monkeypatch.setattr(GitHubFile, "api_url", lambda self: f"{server.base_url}/api/contents")
+
+    result = LinkChecker(token="secret").check("https://github.com/acme/private/blob/main/AGENTS.md")
+
+    assert result.status == LINK_PRIVATE
+
+
+def test_check_local_files(tmp_path):
+    present = tmp_path / "AGENTS.md"
+    present.write_text("# Agents", encoding="utf-8")
+    checker = LinkChecker(token="")
+
+    assert checker.check(f"file:{present}").status == LINK_OK
+    assert checker.check(f"file:{tmp_path / 'missing.md'}").status == LINK_DEAD
+
+
+def test_check_reports_connection_errors():
+    result = LinkChecker(timeout=1.0, token="").check("http://127.0.0.1:9/unreachable")
+
+    assert result.status == LINK_ERROR
+    assert result.error
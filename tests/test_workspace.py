@@ -0,0 +1,36 @@
+from pathlib import Path
+
+from yaxai.workspace import find_project_configs
+
+
+def _touch(path: Path, contents: str = "") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(contents, encoding="utf-8")
+    return path
+
+
+def test_find_project_configs_walks_nested_directories(tmp_path):
+    expected = [
+        _touch(tmp_path / "services" / "api" / "yax.yml"),
+        _touch(tmp_path / "services" / "web" / "yax.yml"),
+        _touch(tmp_path / "yax.yml"),
+    ]
+    _touch(tmp_path / ".hidden" / "yax.yml")
+    _touch(tmp_path / "services" / "api" / "other.yml")
+
+    assert find_project_configs(tmp_path) == sorted(expected)
+
+
+def test_find_project_configs_honours_ignore_files(tmp_path):
+    _touch(tmp_path / ".gitignore", "node_modules/\n/build\n")
+    _touch(tmp_path / "services" / ".yaxignore", "legacy-*\n!legacy-keep\n")
+    kept = [
+        _touch(tmp_path / "services" / "api" / "yax.yml"),
+        _touch(tmp_path / "services" / "legacy-keep" / "yax.yml"),
+        _touch(tmp_path / "tools" / "build" / "yax.yml"),
+    ]
+    _touch(tmp_path / "node_modules" / "pkg" / "yax.yml")
+    _touch(tmp_path / "build" / "yax.yml")
+    _touch(tmp_path / "services" / "legacy-old" / "yax.yml")
+
+    assert find_project_configs(tmp_path) == sorted(kept)
@@ -1,18 +1,26 @@
+import gzip
+import io
 import json
+from itertools import islice
 from pathlib import Path
 from textwrap import dedent
 
 import pytest
 
+from yaxai.catalogindex import CatalogIndex
 from yaxai.yax import (
     AgentsmdBuildConfig,
+    Catalog,
     CatalogBuildConfig,
+    CatalogOrganization,
+    CatalogShardConfig,
     CatalogSource,
     CatalogCollection,
     DEFAULT_AGENTSMD_OUTPUT,
     DEFAULT_CATALOG_OUTPUT,
     Discovery,
     Yax,
+    _parse_catalog_sources,
 )
 
 
@@ -63,6 +71,22 @@ def test_open_catalog_build_config_defaults(tmp_path):
     assert config.output == DEFAULT_CATALOG_OUTPUT
 
 
+def test_open_catalog_build_config_reads_scan_org(tmp_path):
+    config_file = _write_config(
+        tmp_path,
+        """
+        build:
+          catalog:
+            organization: example
+            scan-org: " acme "
+        """,
+    )
+
+    config = CatalogBuildConfig.open_catalog_build_config(str(config_file))
+
+    assert config.scan_organization == "acme"
+
+
 def test_open_catalog_build_config_with_sources_and_output(tmp_path):
     config_file = _write_config(
         tmp_path,
@@ -190,6 +214,18 @@ def test_build_catalog_writes_expected_json(tmp_path):
     }
 
 
+def test_build_catalog_writes_organization_name_before_collections(tmp_path):
+    output_path = tmp_path / "catalog.json"
+    source_path = tmp_path / "source.yml"
+    source_path.write_text("", encoding="utf-8")
+    config = CatalogBuildConfig(organization="example", sources=["file:" + str(source_path)], output=str(output_path))
+
+    Yax().build_catalog(config)
+
+    organization = json.loads(output_path.read_text(encoding="utf-8"))["organizations"][0]
+    assert list(organization) == ["name", "collections"]
+
+
 def test_build_catalog_includes_metadata(tmp_path):
     output_path = tmp_path / "dir" / "catalog.json"
     source_path = tmp_path / "source.yml"
@@ -418,3 +454,669 @@ def test_discovery_invalid_json(tmp_path):
 
     with pytest.raises(ValueError):
         discovery.discover()
+
+
+def test_build_catalog_writes_index_when_enabled(tmp_path):
+    output_path = tmp_path / "catalog.json"
+    source_path = tmp_path / "source.yml"
+    source_path.write_text(
+        dedent(
+            """
+            build:
+              agentsmd:
+                metadata:
+                  name: Example Catalog
+            """
+        ),
+        encoding="utf-8",
+    )
+    config = CatalogBuildConfig(
+        organization="example",
+        sources=["file:" + str(source_path)],
+        output=str(output_path),
+        index=True,
+    )
+
+    Yax().build_catalog(config)
+
+    index = CatalogIndex.for_catalog(output_path)
+    assert index.is_fresh(output_path)
+    assert [row.name for row in index.query(organization="example")] == ["Example Catalog"]
+
+
+def test_build_catalog_search_skips_collections_whose_output_fails(tmp_path):
+    from yaxai.search import SearchIndex
+
+    sources = []
+    for name in ["terraform", "missing"]:
+        project = tmp_path / name
+        project.mkdir()
+        (project / "yax.yml").write_text(f"build:\n  agentsmd:\n    metadata:\n      name: {name}\n", encoding="utf-8")
+        sources.append("file:" + str(project / "yax.yml"))
+    (tmp_path / "terraform" / "AGENTS.md").write_text("Enable state locking.", encoding="utf-8")
+    output_path = tmp_path / "catalog.json"
+    config = CatalogBuildConfig(organization="example", sources=sources, output=str(output_path), search=True)
+
+    failures = Yax().build_catalog(config)
+
+    assert list(failures) == [sources[1]]
+    assert "Failed to read catalog source" in failures[sources[1]]
+    hits = SearchIndex.load(SearchIndex.path_for(output_path)).search("state locking")
+    assert [hit.document.name for hit in hits] == ["terraform"]
+
+
+def test_discovery_search_merges_hits_of_federated_catalogs(tmp_path):
+    from yaxai.search import SearchDocument, SearchIndex
+
+    catalogs = []
+    for name, text in [("first", "Terraform state locking."), ("second", "Lock the Terraform state twice: state locking.")]:
+        catalog_path = tmp_path / f"{name}.json"
+        catalog_path.write_text('{"organizations": []}', encoding="utf-8")
+        document = SearchDocument("acme", f"https://example.com/{name}/AGENTS.md", name, text)
+        SearchIndex.build([document]).save(SearchIndex.path_for(catalog_path))
+        catalogs.append(catalog_path)
+    catalogs.append(tmp_path / "unindexed.json")
+    catalogs[-1].write_text('{"organizations": []}', encoding="utf-8")
+
+    hits = Discovery(catalogs, cache_dir=tmp_path / "cache").search("state locking")
+
+    assert sorted(hit.document.name for hit in hits) == ["first", "second"]
+    assert hits[0].score >= hits[1].score
+
+
+def test_discovery_find_uses_refreshed_index(tmp_path):
+    catalog_path = tmp_path / "catalog.json"
+    catalog_data = {
+        "organizations": [
+            {
+                "name": "Example Org",
+                "collections": [
+                    {"url": "https://example.com/one/yax.yml", "name": "Terraform"},
+                    {"url": "https://example.com/two/yax.yml", "name": "AWS"},
+                ],
+            },
+            {
+                "name": "Other Org",
+                "collections": [{"url": "https://example.com/three/yax.yml", "name": "Terraform state"}],
+            },
+        ]
+    }
+    catalog_path.write_text(json.dumps(catalog_data), encoding="utf-8")
+
+    discovery = Discovery(catalog_path)
+
+    assert [c.name for c in discovery.find(name_prefix="terra")] == ["Terraform", "Terraform state"]
+    assert [c.name for c in discovery.find(organization="Example Org")] == ["Terraform", "AWS"]
+    assert [c.name for c in discovery.find(url="https://example.com/two/_agents.md")] == ["AWS"]
+    assert CatalogIndex.for_catalog(catalog_path).is_fresh(catalog_path)
+
+    catalog_data["organizations"][0]["collections"].append(
+        {"url": "https://example.com/four/yax.yml", "name": "Terraform modules"}
+    )
+    catalog_path.write_text(json.dumps(catalog_data, indent=2), encoding="utf-8")
+
+    assert [c.name for c in discovery.find(name_prefix="terraform m")] == ["Terraform modules"]
+    assert len(discovery.discover()) == 4
+
+
+def test_open_catalog_build_config_reads_index_flag(tmp_path):
+    config_file = _write_config(
+        tmp_path,
+        """
+        build:
+          catalog:
+            organization: example
+            index: true
+        """,
+    )
+
+    config = CatalogBuildConfig.open_catalog_build_config(str(config_file))
+
+    assert config.index is True
+
+
+def test_discovery_iter_collections_streams_entries(tmp_path):
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text(
+        json.dumps(
+            {
+                "organizations": [
+                    {
+                        "name": "Example Org",
+                        "collections": [
+                            {"url": f"https://example.com/{n}.yml", "name": f"Collection {n}"}
+                            for n in range(100)
+                        ],
+                    }
+                ]
+            },
+            indent=2,
+            sort_keys=True,
+        ),
+        encoding="utf-8",
+    )
+
+    first_three = list(islice(Discovery(catalog_path).iter_collections(), 3))
+
+    assert [collection.name for collection in first_three] == ["Collection 0", "Collection 1", "Collection 2"]
+    assert len(list(Discovery(catalog_path).iter_collections())) == 100
+
+
+def test_discovery_iter_collections_validates_entries(tmp_path):
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text(
+        json.dumps({"organizations": [{"name": "Org", "collections": [{"url": 1}]}]}),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ValueError, match="'url' to be a string"):
+        list(Discovery(catalog_path).iter_collections())
+
+
+def test_discovery_iter_collections_invalid_json(tmp_path):
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text("not json", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Invalid catalog JSON"):
+        list(Discovery(catalog_path).iter_collections())
+
+
+def test_discovery_federates_catalogs_and_dedupes_by_output_url(tmp_path):
+    first = tmp_path / "first.json"
+    second = tmp_path / "second.json"
+    first.write_text(
+        json.dumps(
+            {
+                "organizations": [
+                    {
+                        "name": "Platform",
+                        "collections": [
+                            {"url": "https://github.com/acme/tf/blob/main/yax.yml", "name": "Terraform"},
+                        ],
+                    }
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    second.write_text(
+        json.dumps(
+            {
+                "organizations": [
+                    {
+                        "name": "Platform",
+                        "collections": [
+                            {"url": "https://raw.githubusercontent.com/acme/tf/main/yax.yml", "name": "Duplicate"},
+                            {"url": "https://github.com/acme/aws/blob/main/yax.yml", "name": "AWS"},
+                        ],
+                    },
+                    {
+                        "name": "Data",
+                        "collections": [{"url": "https://github.com/acme/dbt/blob/main/yax.yml", "name": "dbt"}],
+                    },
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    cache_dir = tmp_path / "cache"
+
+    discovery = Discovery([first, second], cache_dir=cache_dir)
+
+    assert [collection.name for collection in discovery.discover()] == ["Terraform", "AWS", "dbt"]
+    merged_path = discovery.catalog_path
+    assert merged_path.parent == cache_dir / "federated"
+
+    merged_mtime = merged_path.stat().st_mtime_ns
+    assert Discovery([first, second], cache_dir=cache_dir).catalog_path.stat().st_mtime_ns == merged_mtime
+
+    first.write_text(json.dumps({"organizations": []}), encoding="utf-8")
+
+    names = [collection.name for collection in Discovery([first, second], cache_dir=cache_dir).discover()]
+    assert names == ["Duplicate", "AWS", "dbt"]
+
+
+def test_discovery_federates_remote_catalogs_through_cache(tmp_path, monkeypatch):
+    local = tmp_path / "local.json"
+    local.write_text(
+        json.dumps({"organizations": [{"name": "Local", "collections": [{"url": "https://example.com/a/yax.yml"}]}]}),
+        encoding="utf-8",
+    )
+    remote_url = "https://github.com/acme/catalogs/blob/main/yax-catalog.json"
+
+    def fake_fetch(self, url, refresh=False):
+        assert url == remote_url
+        path = tmp_path / "remote.json"
+        path.write_text(
+            json.dumps({"organizations": [{"name": "Remote", "collections": [{"url": "https://example.com/b/yax.yml"}]}]}),
+            encoding="utf-8",
+        )
+        return path
+
+    monkeypatch.setattr("yaxai.catalogcache.RemoteCatalogCache.fetch", fake_fetch)
+
+    collections = Discovery([str(local), remote_url], cache_dir=tmp_path / "cache").discover()
+
+    assert [collection.url for collection in collections] == [
+        "https://example.com/a/yax.yml",
+        "https://example.com/b/yax.yml",
+    ]
+
+
+def test_discovery_fetches_remote_shards_relative_to_manifest(tmp_path, monkeypatch):
+    remote_url = "https://github.com/acme/catalogs/blob/main/yax-catalog.json"
+    shard_base = "https://github.com/acme/catalogs/blob/main/yax-catalog.shards/"
+
+    def shard(name):
+        catalog = {"organizations": [{"name": name, "collections": [{"url": f"https://example.com/{name}/yax.yml"}]}]}
+        return json.dumps(catalog).encode("utf-8")
+
+    files = {
+        remote_url: json.dumps(
+            {
+                "shards": [
+                    {"organization": "Remote", "path": "yax-catalog.shards/remote-0.json.gz"},
+                    {"organization": "Other", "path": "yax-catalog.shards/other-0.json"},
+                ]
+            }
+        ).encode("utf-8"),
+        shard_base + "remote-0.json.gz": gzip.compress(shard("Remote")),
+        shard_base + "other-0.json": shard("Other"),
+    }
+    fetched = []
+
+    def fake_fetch(self, url, refresh=False):
+        fetched.append(url)
+        path = tmp_path / "remote" / url.rsplit("/", 1)[-1]
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(files[url])
+        return path
+
+    monkeypatch.setattr("yaxai.catalogcache.RemoteCatalogCache.fetch", fake_fetch)
+
+    collections = Discovery(remote_url, cache_dir=tmp_path / "cache", organizations=["Remote"]).discover()
+
+    assert [collection.url for collection in collections] == ["https://example.com/Remote/yax.yml"]
+    assert fetched == [remote_url, shard_base + "remote-0.json.gz"]
+
+
+def test_discovery_reads_default_catalogs_from_user_config(tmp_path, monkeypatch):
+    catalog_path = tmp_path / "team.json"
+    catalog_path.write_text(
+        json.dumps({"organizations": [{"name": "Team", "collections": [{"url": "https://example.com/a/yax.yml"}]}]}),
+        encoding="utf-8",
+    )
+    user_config = tmp_path / "config.yml"
+    user_config.write_text(f"discover:\n  catalogs:\n    - {catalog_path}\n", encoding="utf-8")
+    monkeypatch.setattr(Discovery, "USER_CONFIG_PATH", user_config)
+
+    discovery = Discovery()
+
+    assert discovery.catalog_path == catalog_path
+    assert [collection.url for collection in discovery.discover()] == ["https://example.com/a/yax.yml"]
+
+
+def test_discovery_federation_reports_missing_catalog(tmp_path):
+    existing = tmp_path / "catalog.json"
+    existing.write_text("{}", encoding="utf-8")
+
+    with pytest.raises(FileNotFoundError):
+        Discovery([existing, tmp_path / "missing.json"], cache_dir=tmp_path / "cache").discover()
+
+
+def _sharded_catalog(tmp_path, buckets=1, compress=False):
+    catalog = Catalog(
+        organizations=[
+            CatalogOrganization(
+                name="Platform Team",
+                collections=[CatalogCollection(url=f"https://example.com/p{n}/yax.yml", name=f"P{n}") for n in range(6)],
+            ),
+            CatalogOrganization(
+                name="Data",
+                collections=[CatalogCollection(url="https://example.com/d/yax.yml", name="D")],
+            ),
+        ]
+    )
+    manifest_path = tmp_path / "catalog.json"
+    Yax()._write_sharded_catalog(catalog, manifest_path, CatalogShardConfig(buckets=buckets, gzip=compress))
+    return manifest_path
+
+
+def test_build_catalog_writes_sharded_manifest(tmp_path):
+    source_path = tmp_path / "source.yml"
+    source_path.write_text("build:\n  agentsmd:\n    metadata:\n      name: Example\n", encoding="utf-8")
+    output_path = tmp_path / "catalog.json"
+    config = CatalogBuildConfig(
+        organization="example",
+        sources=["file:" + str(source_path)],
+        output=str(output_path),
+        shards=CatalogShardConfig(gzip=True),
+    )
+
+    Yax().build_catalog(config)
+
+    manifest = json.loads(output_path.read_text(encoding="utf-8"))
+    [entry] = manifest["shards"]
+    assert entry["organization"] == "example"
+    assert entry["collections"] == 1
+    assert entry["path"].startswith("catalog.shards/") and entry["path"].endswith(".json.gz")
+    assert [c.name for c in Discovery(output_path).discover()] == ["Example"]
+
+
+def test_sharded_catalog_buckets_collections_by_hash(tmp_path):
+    manifest_path = _sharded_catalog(tmp_path, buckets=3, compress=True)
+
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    platform_entries = [entry for entry in manifest["shards"] if entry["organization"] == "Platform Team"]
+
+    assert len(platform_entries) > 1
+    assert sum(entry["collections"] for entry in platform_entries) == 6
+    names = sorted(c.name for c in Discovery(manifest_path).discover())
+    assert names == ["D", "P0", "P1", "P2", "P3", "P4", "P5"]
+
+
+def test_sharded_catalog_loads_only_selected_organization_shards(tmp_path):
+    manifest_path = _sharded_catalog(tmp_path)
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    for entry in manifest["shards"]:
+        if entry["organization"] == "Platform Team":
+            (tmp_path / entry["path"]).unlink()
+
+    discovery = Discovery(manifest_path, organizations=["Data"])
+
+    assert [c.name for c in discovery.discover()] == ["D"]
+    assert [c.name for c in discovery.iter_collections()] == ["D"]
+
+    output_path = Yax().export_catalog(manifest_path, "markdown", organizations=["Data"])
+    assert output_path.read_text(encoding="utf-8") == "# Catalog\n\n## Data\n\n- [D](https://example.com/d/yax.yml)\n"
+
+    with pytest.raises(FileNotFoundError):
+        Discovery(manifest_path).discover()
+
+
+def test_discovery_iter_collections_follows_shards(tmp_path):
+    manifest_path = _sharded_catalog(tmp_path, buckets=2, compress=True)
+
+    names = [c.name for c in Discovery(manifest_path).iter_collections()]
+
+    assert sorted(names) == ["D", "P0", "P1", "P2", "P3", "P4", "P5"]
+
+
+def test_discovery_organization_filter_on_monolithic_catalog(tmp_path):
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text(
+        json.dumps(
+            {
+                "organizations": [
+                    {"name": "A", "collections": [{"url": "https://example.com/a/yax.yml"}]},
+                    {"name": "B", "collections": [{"url": "https://example.com/b/yax.yml"}]},
+                ]
+            },
+            sort_keys=True,
+        ),
+        encoding="utf-8",
+    )
+
+    discovery = Discovery(catalog_path, organizations=["B"])
+
+    assert [c.url for c in discovery.iter_collections()] == ["https://example.com/b/yax.yml"]
+    assert [c.url for c in discovery.discover()] == ["https://example.com/b/yax.yml"]
+
+
+def test_open_catalog_build_config_reads_shards(tmp_path):
+    config_file = _write_config(
+        tmp_path,
+        """
+        build:
+          catalog:
+            organization: example
+            shards:
+              buckets: 4
+              gzip: true
+        """,
+    )
+
+    config = CatalogBuildConfig.open_catalog_build_config(str(config_file))
+
+    assert config.shards == CatalogShardConfig(buckets=4, gzip=True)
+
+
+def test_open_catalog_build_config_rejects_invalid_shards(tmp_path):
+    config_file = _write_config(
+        tmp_path,
+        """
+        build:
+          catalog:
+            organization: example
+            shards:
+              buckets: 0
+        """,
+    )
+
+    with pytest.raises(ValueError):
+        CatalogBuildConfig.open_catalog_build_config(str(config_file))
+
+
+def test_export_catalog_streams_formats_to_custom_outputs(tmp_path):
+    source = tmp_path / "catalog.json"
+    source.write_text(
+        json.dumps(
+            {
+                "organizations": [
+                    {"collections": [{"url": "https://example.com/a/yax.yml", "name": "A"}], "name": "Org A"},
+                    {"name": "Org B", "collections": [{"url": "https://example.com/b/yax.yml"}]},
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    jsonl_path = Yax().export_catalog(source, "jsonl")
+    csv_path = Yax().export_catalog(source, "csv", output=tmp_path / "out" / "catalog.csv")
+    stream = io.StringIO()
+    result = Yax().export_catalog(source, "markdown", output=stream)
+
+    assert jsonl_path == source.with_suffix(".jsonl")
+    assert [json.loads(line)["organization"] for line in jsonl_path.read_text(encoding="utf-8").splitlines()] == [
+        "Org A",
+        "Org B",
+    ]
+    assert csv_path.read_text(encoding="utf-8").splitlines()[0] == "organization,name,url,output,output_url"
+    assert result is None
+    assert stream.getvalue() == (
+        "# Catalog\n\n## Org A\n\n- [A](https://example.com/a/yax.yml)\n\n## Org B\n\n- https://example.com/b/yax.yml\n"
+    )
+
+
+def test_export_catalog_leaves_no_partial_output_on_invalid_entry(tmp_path):
+    source = tmp_path / "catalog.json"
+    source.write_text(
+        json.dumps({"organizations": [{"name": "Org", "collections": [{"url": "https://example.com/a.yml"}, {"url": 1}]}]}),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ValueError):
+        Yax().export_catalog(source, "jsonl")
+
+    assert list(tmp_path.iterdir()) == [source]
+
+
+def test_catalog_collection_from_mappings_matches_from_mapping():
+    entries = [
+        {"url": " https://example.com/a/yax.yml ", "name": " A ", "output": " docs/AGENTS.md "},
+        {"url": "https://example.com/b/yax.yml"},
+        {"url": "https://example.com/c/yax.yml", "metadata": {"name": "Legacy"}},
+        {"url": "https://example.com/d/yax.yml", "name": None, "output": None},
+    ]
+
+    assert CatalogCollection.from_mappings(entries) == [CatalogCollection.from_mapping(entry) for entry in entries]
+    assert CatalogCollection.from_mappings(entries)[0].to_dict() == {
+        "url": "https://example.com/a/yax.yml",
+        "name": "A",
+        "output": "docs/AGENTS.md",
+    }
+
+
+def test_catalog_collection_from_mappings_skips_post_init_for_normalized_entries(monkeypatch):
+    calls = []
+    original = CatalogCollection.__post_init__
+
+    def counting_post_init(self):
+        calls.append(self)
+        original(self)
+
+    monkeypatch.setattr(CatalogCollection, "__post_init__", counting_post_init)
+    entries = [
+        {"url": "https://example.com/a/yax.yml", "name": "A", "output": "AGENTS.md"},
+        {"url": "https://example.com/b/yax.yml"},
+        {"url": "https://example.com/c/yax.yml", "name": " C "},
+    ]
+
+    collections = CatalogCollection.from_mappings(entries)
+
+    assert [collection.to_dict() for collection in collections] == [
+        {"url": "https://example.com/a/yax.yml", "name": "A", "output": "AGENTS.md"},
+        {"url": "https://example.com/b/yax.yml"},
+        {"url": "https://example.com/c/yax.yml", "name": "C"},
+    ]
+    assert calls == [collections[2]]
+
+
+@pytest.mark.parametrize(
+    "entry, message",
+    [
+        ("not-a-mapping", "to be an object"),
+        ({"url": 1}, "'url' to be a string"),
+        ({"url": "https://example.com/x.yml", "name": "  "}, "'name' must be a non-empty string"),
+        ({"url": "https://example.com/x.yml", "output": 5}, "'output' to be a string"),
+    ],
+)
+def test_catalog_collection_from_mappings_reports_invalid_entries(entry, message):
+    with pytest.raises(ValueError, match=message):
+        CatalogCollection.from_mappings([{"url": "https://example.com/ok.yml"}, entry])
+
+
+def test_catalog_model_instances_are_slotted():
+    collection = CatalogCollection(url="https://example.com/a/yax.yml")
+
+    assert not hasattr(collection, "__dict__")
+    assert not hasattr(CatalogOrganization(name="org"), "__dict__")
+    assert not hasattr(Catalog(), "__dict__")
+
+
+def test_build_catalog_adds_scanned_sources(tmp_path, monkeypatch):
+    listed = tmp_path / "listed.yml"
+    scanned = tmp_path / "scanned.yml"
+    listed.write_text("", encoding="utf-8")
+    scanned.write_text("build:\n  agentsmd:\n    metadata:\n      name: Scanned\n", encoding="utf-8")
+    output_path = tmp_path / "catalog.json"
+    scans = []
+
+    def fake_scan(self):
+        scans.append((self._organization, self._state_path))
+        return ["file:" + str(listed), "file:" + str(scanned)]
+
+    monkeypatch.setattr("yaxai.orgscan.OrganizationScanner.scan", fake_scan)
+    config = CatalogBuildConfig(
+        organization="example",
+        sources=["file:" + str(listed)],
+        output=str(output_path),
+        scan_organization="acme",
+    )
+
+    Yax().build_catalog(config)
+
+    result = json.loads(output_path.read_text(encoding="utf-8"))
+    assert result["organizations"][0]["collections"] == [
+        {"url": "file:" + str(listed)},
+        {"name": "Scanned", "output": "AGENTS.md", "url": "file:" + str(scanned)},
+    ]
+    assert scans == [("acme", tmp_path / "catalog.scan.json")]
+
+
+def test_verify_catalog_checks_outputs_and_writes_results(tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "AGENTS.md").write_text("# Agents", encoding="utf-8")
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text(
+        json.dumps(
+            {
+                "organizations": [
+                    {
+                        "name": "example",
+                        "collections": [
+                            {"url": f"file:{project}/yax.yml", "name": "Present", "output": "AGENTS.md"},
+                            {"url": f"file:{tmp_path}/gone/yax.yml", "name": "Gone"},
+                        ],
+                    },
+                    {"name": "other", "collections": [{"url": f"file:{tmp_path}/other/yax.yml"}]},
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    results = Yax().verify_catalog(catalog_path, organizations={"example"}, write=True)
+
+    assert [(result.collection.name, result.check.status) for result in results] == [
+        ("Present", "ok"),
+        ("Gone", "dead"),
+    ]
+
+    written = json.loads(catalog_path.read_text(encoding="utf-8"))
+    collections = written["organizations"][0]["collections"]
+    assert collections[0]["verification"]["status"] == "ok"
+    assert collections[1]["verification"]["status"] == "dead"
+    assert "checked_at" in collections[0]["verification"]
+    assert "verification" not in written["organizations"][1]["collections"][0]
+    assert Catalog.load(catalog_path).organizations[0].collections[0].name == "Present"
+
+
+def test_verify_catalog_writes_results_into_shards(tmp_path):
+    source_path = tmp_path / "source.yml"
+    source_path.write_text("build:\n  agentsmd:\n    from: []\n", encoding="utf-8")
+    (tmp_path / "AGENTS.md").write_text("# Agents", encoding="utf-8")
+    output_path = tmp_path / "catalog.json"
+    Yax().build_catalog(
+        CatalogBuildConfig(
+            organization="example",
+            sources=["file:" + str(source_path)],
+            output=str(output_path),
+            shards=CatalogShardConfig(gzip=True),
+        )
+    )
+
+    results = Yax().verify_catalog(output_path, write=True)
+
+    assert [result.check.status for result in results] == ["ok"]
+    again = Yax().verify_catalog(output_path)
+    assert [result.check.status for result in again] == ["ok"]
+    shard_entry = json.loads(output_path.read_text(encoding="utf-8"))["shards"][0]
+    shard = json.loads(gzip.decompress((tmp_path / shard_entry["path"]).read_bytes()))
+    assert shard["organizations"][0]["collections"][0]["verification"]["status"] == "ok"
+
+
+def test_parse_catalog_sources_in_process_pool_keeps_order(monkeypatch):
+    monkeypatch.setattr("yaxai.yax._PARALLEL_PARSE_MIN_BYTES", 0)
+    sources = [
+        (f"build:\n  agentsmd:\n    metadata:\n      name: Project {index}\n    output: OUT{index}.md\n", f"file:{index}.yml")
+        for index in range(80)
+    ]
+    sources.append(("", "file:empty.yml"))
+
+    details = _parse_catalog_sources(sources, max_workers=2)
+
+    assert details == _parse_catalog_sources(sources, max_workers=1)
+    assert details[0] == ("Project 0", "OUT0.md")
+    assert details[79] == ("Project 79", "OUT79.md")
+    assert details[80] == (None, None)
+
+
+def test_parse_catalog_sources_in_process_pool_reports_invalid_source(monkeypatch):
+    monkeypatch.setattr("yaxai.yax._PARALLEL_PARSE_MIN_BYTES", 0)
+    sources = [("build: {}\n", f"file:{index}.yml") for index in range(70)]
+    sources[42] = ("build:\n  agentsmd:\n    output: [1]\n", "file:broken.yml")
+
+    with pytest.raises(ValueError, match="file:broken.yml"):
+        _parse_catalog_sources(sources, max_workers=2)
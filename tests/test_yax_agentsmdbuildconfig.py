@@ -7,6 +7,7 @@ from urllib.error import HTTPError, URLError
 
 from pydantic import ValidationError
 
+from yaxai.sources import SourceFetcher
 from yaxai.yax import (
     AgentsmdBuildConfig,
     DEFAULT_AGENTSMD_CONFIG_FILENAME,
@@ -244,3 +245,396 @@ def test_build_agentsmd_errors_when_glob_matches_nothing(tmp_path, monkeypatch):
     with pytest.raises(RuntimeError):
         Yax().build_agentsmd(config)
 
+
+
+def test_save_updates_existing_config_and_keeps_other_sections(tmp_path):
+    config_file = _write_config(
+        tmp_path,
+        """
+        build:
+          agentsmd:
+            from:
+              - https://example.com/source.md
+            metadata:
+              name: Example
+          catalog:
+            organization: example
+        other: value
+        """,
+    )
+
+    config = AgentsmdBuildConfig.parse_yml(config_file)
+    config.urls.append("https://example.com/added.md")
+    config.save(config_file)
+
+    reloaded = AgentsmdBuildConfig.parse_yml(config_file)
+    assert reloaded.urls == ["https://example.com/source.md", "https://example.com/added.md"]
+    assert reloaded.metadata == {"name": "Example"}
+
+    text = config_file.read_text(encoding="utf-8")
+    assert "organization: example" in text
+    assert "other: value" in text
+    assert "output:" not in text
+
+
+def test_build_agentsmd_expands_nested_local_configs(tmp_path, monkeypatch):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    (shared / "rules.md").write_text("shared rules", encoding="utf-8")
+    (shared / "yax.yml").write_text(
+        "build:\n  agentsmd:\n    from:\n      - file:rules.md\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "local.md").write_text("local rules", encoding="utf-8")
+
+    config = AgentsmdBuildConfig(
+        urls=["file:shared/yax.yml", "file:local.md"],
+        output=str(tmp_path / "AGENTS.md"),
+    )
+
+    monkeypatch.chdir(tmp_path)
+    Yax().build_agentsmd(config)
+
+    assert (tmp_path / "AGENTS.md").read_text(encoding="utf-8") == "shared rules\n\nlocal rules"
+
+
+def test_parse_yml_reads_targets(tmp_path):
+    config_file = _write_config(
+        tmp_path,
+        """
+        build:
+          agentsmd:
+            from:
+              - https://example.com/source.md
+            targets:
+              - output: CLAUDE.md
+              - output: .cursor/rules/project.mdc
+                from:
+                  - https://example.com/cursor.md
+                description: Project rules
+                globs: "src/**, tests/**"
+                alwaysApply: false
+        """,
+    )
+
+    config = AgentsmdBuildConfig.parse_yml(config_file)
+    targets = config.build_targets()
+
+    assert [target.output for target in targets] == [DEFAULT_AGENTSMD_OUTPUT, "CLAUDE.md", ".cursor/rules/project.mdc"]
+    assert targets[1].urls == ["https://example.com/source.md"]
+    assert targets[2].urls == ["https://example.com/cursor.md"]
+    assert targets[2].globs == ["src/**", "tests/**"]
+    assert targets[2].always_apply is False
+
+
+def test_parse_yml_rejects_unknown_target_format(tmp_path):
+    config_file = _write_config(
+        tmp_path,
+        """
+        build:
+          agentsmd:
+            from:
+              - https://example.com/source.md
+            targets:
+              - output: out.docx
+                format: docx
+        """,
+    )
+
+    with pytest.raises(ValidationError):
+        AgentsmdBuildConfig.parse_yml(config_file)
+
+
+def test_build_agentsmd_writes_all_targets_from_one_fetch(tmp_path):
+    (tmp_path / "shared.md").write_text("shared", encoding="utf-8")
+    (tmp_path / "cursor.md").write_text("cursor only", encoding="utf-8")
+    config = AgentsmdBuildConfig.model_validate(
+        {
+            "from": [f"file:{tmp_path / 'shared.md'}"],
+            "output": str(tmp_path / "AGENTS.md"),
+            "targets": [
+                {"output": str(tmp_path / "CLAUDE.md")},
+                {"output": str(tmp_path / ".github" / "copilot-instructions.md")},
+                {
+                    "output": str(tmp_path / ".cursor" / "rules" / "project.mdc"),
+                    "from": [f"file:{tmp_path / 'shared.md'}", f"file:{tmp_path / 'cursor.md'}"],
+                    "description": "Project rules",
+                },
+            ],
+        }
+    )
+    downloads = []
+
+    def download(key):
+        downloads.append(key)
+        return Path(key[len("file:"):]).read_text(encoding="utf-8")
+
+    with SourceFetcher(download=download) as fetcher:
+        written = Yax().build_agentsmd(config, fetcher=fetcher)
+
+    assert len(written) == 4
+    assert sorted(downloads) == [f"file:{tmp_path / 'cursor.md'}", f"file:{tmp_path / 'shared.md'}"]
+    assert (tmp_path / "AGENTS.md").read_text(encoding="utf-8") == "shared"
+    assert (tmp_path / "CLAUDE.md").read_text(encoding="utf-8") == "shared"
+    assert (tmp_path / ".github" / "copilot-instructions.md").read_text(encoding="utf-8") == "shared"
+    assert (tmp_path / ".cursor" / "rules" / "project.mdc").read_text(encoding="utf-8") == (
+        "---\ndescription: Project rules\nglobs:\nalwaysApply: true\n---\n\nshared\n\ncursor only"
+    )
+
+
+def test_build_agentsmd_dedupes_shared_blocks_per_target(tmp_path):
+    shared = "## General rules\nBe concise.\n"
+    (tmp_path / "a.md").write_text("# A\nAlpha\n" + shared, encoding="utf-8")
+    (tmp_path / "b.md").write_text("# B\nBeta\n" + shared, encoding="utf-8")
+    config = AgentsmdBuildConfig.model_validate(
+        {
+            "from": [f"file:{tmp_path / 'a.md'}", f"file:{tmp_path / 'b.md'}"],
+            "output": str(tmp_path / "AGENTS.md"),
+            "dedupe": True,
+            "targets": [{"output": str(tmp_path / "CLAUDE.md"), "dedupe": False}],
+        }
+    )
+
+    Yax().build_agentsmd(config)
+
+    assert (tmp_path / "AGENTS.md").read_text(encoding="utf-8") == "# A\nAlpha\n" + shared + "\n\n# B\nBeta\n"
+    assert (tmp_path / "CLAUDE.md").read_text(encoding="utf-8").count("General rules") == 2
+
+
+def test_build_all_shares_fetches_and_skips_unchanged_projects(tmp_path, monkeypatch):
+    (tmp_path / "shared.md").write_text("shared", encoding="utf-8")
+    for name in ("api", "web"):
+        project = tmp_path / "services" / name
+        project.mkdir(parents=True)
+        (project / "local.md").write_text(name, encoding="utf-8")
+        (project / "yax.yml").write_text(
+            "build:\n  agentsmd:\n    from:\n      - file:../../shared.md\n      - file:local.md\n",
+            encoding="utf-8",
+        )
+    broken = tmp_path / "services" / "broken"
+    broken.mkdir()
+    (broken / "yax.yml").write_text("build:\n  agentsmd:\n    from:\n      - file:missing.md\n", encoding="utf-8")
+
+    downloads = []
+    original_init = SourceFetcher.__init__
+
+    def counting_init(self, max_workers=16, download=None):
+        def download_and_count(key):
+            downloads.append(key)
+            return Path(key[len("file:"):]).read_text(encoding="utf-8")
+
+        original_init(self, max_workers, download_and_count)
+
+    monkeypatch.setattr(SourceFetcher, "__init__", counting_init)
+    monkeypatch.chdir(tmp_path)
+
+    results = {result.config_path.parent.name: result for result in Yax().build_all(tmp_path)}
+
+    assert results["api"].status == "built"
+    assert results["web"].status == "built"
+    assert results["broken"].status == "failed"
+    assert "No files matched" in results["broken"].error
+    assert (tmp_path / "services" / "api" / "AGENTS.md").read_text(encoding="utf-8") == "shared\n\napi"
+    assert downloads.count(f"file:{tmp_path / 'shared.md'}") == 1
+
+    downloads.clear()
+    again = {result.config_path.parent.name: result.status for result in Yax().build_all(tmp_path)}
+    assert again == {"api": "unchanged", "web": "unchanged", "broken": "failed"}
+    assert downloads == []
+
+
+def test_parse_yml_reads_source_priorities_and_saves_them_back(tmp_path):
+    config_path = _write_config(
+        tmp_path,
+        """
+        build:
+          agentsmd:
+            max_tokens: 500
+            from:
+              - https://github.com/acme/rules/blob/main/core.md
+              - url: https://github.com/acme/rules/blob/main/extra.md
+                priority: -1
+        """,
+    )
+
+    config = AgentsmdBuildConfig.parse_yml(config_path)
+
+    assert config.urls == [
+        "https://github.com/acme/rules/blob/main/core.md",
+        "https://github.com/acme/rules/blob/main/extra.md",
+    ]
+    assert config.priorities == {"https://github.com/acme/rules/blob/main/extra.md": -1}
+    assert config.build_targets()[0].max_tokens == 500
+
+    config.save(config_path)
+    saved = AgentsmdBuildConfig.parse_yml(config_path)
+    assert saved.priorities == config.priorities
+    assert saved.max_tokens == 500
+
+
+def test_parse_yml_reads_priorities_in_target_sources(tmp_path):
+    config_path = _write_config(
+        tmp_path,
+        """
+        build:
+          agentsmd:
+            from:
+              - https://github.com/acme/rules/blob/main/core.md
+            targets:
+              - output: CLAUDE.md
+                max_tokens: 200
+                from:
+                  - https://github.com/acme/rules/blob/main/core.md
+                  - url: https://github.com/acme/rules/blob/main/extra.md
+                    priority: -1
+        """,
+    )
+
+    config = AgentsmdBuildConfig.parse_yml(config_path)
+    target = config.build_targets()[1]
+
+    assert target.urls == [
+        "https://github.com/acme/rules/blob/main/core.md",
+        "https://github.com/acme/rules/blob/main/extra.md",
+    ]
+    assert target.priorities == {"https://github.com/acme/rules/blob/main/extra.md": -1}
+
+    config.save(config_path)
+    assert AgentsmdBuildConfig.parse_yml(config_path).build_targets()[1].priorities == target.priorities
+
+
+TF_URL = "https://github.com/acme/rules/blob/main/tf.md"
+
+
+@pytest.mark.parametrize(
+    "sources",
+    [
+        [{"url": TF_URL, "scope": "infra"}, {"url": TF_URL, "scope": "services"}],
+        [TF_URL, {"url": TF_URL, "scope": "infra"}],
+    ],
+)
+def test_rejects_url_listed_with_conflicting_scopes(sources):
+    with pytest.raises(ValidationError, match="listed with different scopes"):
+        AgentsmdBuildConfig.model_validate({"from": sources})
+
+
+def test_accepts_url_repeated_with_the_same_scope():
+    config = AgentsmdBuildConfig.model_validate({"from": [{"url": TF_URL, "scope": "infra/"}, {"url": TF_URL, "scope": "infra"}]})
+
+    assert config.scopes == {TF_URL: "infra"}
+
+
+def test_parse_yml_rejects_scope_in_target_sources(tmp_path):
+    config_path = _write_config(
+        tmp_path,
+        """
+        build:
+          agentsmd:
+            from:
+              - https://github.com/acme/rules/blob/main/core.md
+            targets:
+              - output: CLAUDE.md
+                from:
+                  - url: https://github.com/acme/rules/blob/main/extra.md
+                    scope: services/api
+        """,
+    )
+
+    with pytest.raises(ValidationError, match="only supported in the main 'from' list"):
+        AgentsmdBuildConfig.parse_yml(config_path)
+
+
+def test_parse_yml_rejects_unknown_tokenizer(tmp_path):
+    config_path = _write_config(
+        tmp_path,
+        """
+        build:
+          agentsmd:
+            tokenizer: unknown
+            from:
+              - https://github.com/acme/rules/blob/main/core.md
+        """,
+    )
+
+    with pytest.raises(ValidationError):
+        AgentsmdBuildConfig.parse_yml(config_path)
+
+
+def test_scoped_sources_build_nested_outputs(tmp_path):
+    config_path = _write_config(
+        tmp_path,
+        """
+        build:
+          agentsmd:
+            dedupe: true
+            from:
+              - https://github.com/acme/rules/blob/main/core.md
+              - url: https://github.com/acme/rules/blob/main/terraform.md
+                scope: infra/
+              - url: https://github.com/acme/rules/blob/main/react.md
+                scope: frontend
+                priority: 2
+              - url: https://github.com/acme/rules/blob/main/helm.md
+                scope: infra
+            targets:
+              - output: CLAUDE.md
+        """,
+    )
+
+    config = AgentsmdBuildConfig.parse_yml(config_path)
+    targets = config.build_targets()
+
+    assert [(target.output, target.urls) for target in targets] == [
+        ("AGENTS.md", ["https://github.com/acme/rules/blob/main/core.md"]),
+        (
+            "infra/AGENTS.md",
+            [
+                "https://github.com/acme/rules/blob/main/terraform.md",
+                "https://github.com/acme/rules/blob/main/helm.md",
+            ],
+        ),
+        ("frontend/AGENTS.md", ["https://github.com/acme/rules/blob/main/react.md"]),
+        ("CLAUDE.md", ["https://github.com/acme/rules/blob/main/core.md"]),
+    ]
+    assert all(target.dedupe for target in targets)
+
+    config.save(config_path)
+    saved = AgentsmdBuildConfig.parse_yml(config_path)
+    assert saved.scopes == config.scopes
+    assert saved.priorities == {"https://github.com/acme/rules/blob/main/react.md": 2}
+
+
+@pytest.mark.parametrize("scope", ["/etc", "../outside", "."])
+def test_parse_yml_rejects_scope_outside_project(tmp_path, scope):
+    config_path = _write_config(
+        tmp_path,
+        f"""
+        build:
+          agentsmd:
+            from:
+              - url: https://github.com/acme/rules/blob/main/core.md
+                scope: "{scope}"
+        """,
+    )
+
+    with pytest.raises(ValidationError):
+        AgentsmdBuildConfig.parse_yml(config_path)
+
+
+def test_parse_yml_turns_sections_into_selectors(tmp_path):
+    config_path = _write_config(
+        tmp_path,
+        """
+        build:
+          agentsmd:
+            from:
+              - url: https://github.com/acme/rules/blob/main/org.md
+                sections: [terraform-state, Python]
+                priority: 1
+        """,
+    )
+
+    config = AgentsmdBuildConfig.parse_yml(config_path)
+
+    assert config.urls == ["https://github.com/acme/rules/blob/main/org.md#yax:terraform-state,Python"]
+    assert config.priorities == {"https://github.com/acme/rules/blob/main/org.md#yax:terraform-state,Python": 1}
@@ -1,9 +1,24 @@
 """Top-level package for the yaxai project."""
 
-from .yax import AgentsmdBuildConfig, CatalogBuildConfig, Yax
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - imported for annotations only
+    from .yax import AgentsmdBuildConfig, CatalogBuildConfig, Yax
 
 __all__ = [
     "AgentsmdBuildConfig",
     "CatalogBuildConfig",
     "Yax",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Importing yaxai.yax loads pydantic; defer it until a public name is used
+    # so that `yaxai.cli` and the light helper modules import quickly.
+    if name in __all__:
+        from . import yax
+
+        return getattr(yax, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,289 @@
+"""Agentsmd build pipeline.
+
+Kept free of pydantic so that ``yax build`` with a plain configuration
+starts quickly; configs using advanced options are validated by
+``yaxai.yax.AgentsmdBuildConfig`` and built through the same functions.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Protocol, Sequence, Tuple, Union
+
+from yaxai.budget import DEFAULT_PRIORITY, BudgetFragment, BudgetResult, apply_budget
+from yaxai.configio import load_yaml_file
+from yaxai.dedupe import DedupeResult, dedupe_fragments
+from yaxai.defaults import DEFAULT_AGENTSMD_CONFIG_FILENAME, DEFAULT_AGENTSMD_OUTPUT
+from yaxai.minify import MinifyResult, minify_fragments
+from yaxai.sources import SourceFetcher, SourceGraph, SourceResolver
+from yaxai.targets import infer_target_format, render_target
+from yaxai.tokens import DEFAULT_TOKENIZER
+
+if TYPE_CHECKING:  # pragma: no cover - imported for annotations only
+    from yaxai.yax import AgentsmdBuildConfig
+
+
+_PLAIN_CONFIG_KEYS = {"from", "output", "metadata", "dedupe", "minify"}
+
+
+class BuildTarget(Protocol):
+    output: str
+    urls: Optional[List[str]]
+    dedupe: Optional[bool]
+    minify: Optional[bool]
+    max_tokens: Optional[int]
+    tokenizer: Optional[str]
+    priorities: Dict[str, int]
+
+    def render(self, content: str) -> str: ...
+
+
+@dataclass
+class PlainTarget:
+    output: str
+    urls: Optional[List[str]]
+    dedupe: bool = False
+    minify: bool = False
+    max_tokens: Optional[int] = None
+    tokenizer: Optional[str] = None
+    priorities: Dict[str, int] = field(default_factory=dict)
+
+    def render(self, content: str) -> str:
+        return render_target(content, infer_target_format(self.output))
+
+
+@dataclass
+class BuildReport:
+    """What the optional build stages changed in one output."""
+
+    minify: Optional[MinifyResult] = None
+    dedupe: Optional[DedupeResult] = None
+    budget: Optional[BudgetResult] = None
+
+    def describe(self) -> List[str]:
+        lines: List[str] = []
+        if self.minify is not None:
+            lines.append(f"Minified: {self.minify.describe()}")
+        if self.dedupe is not None:
+            lines.append(f"Deduplicated: {self.dedupe.describe()}")
+        if self.budget is not None:
+            lines.extend(self.budget.describe())
+        return lines
+
+
+@dataclass
+class PlainAgentsmdConfig:
+    """Agentsmd config limited to ``from``, ``output``, ``metadata`` and the dedupe/minify switches."""
+
+    urls: List[str]
+    output: str = DEFAULT_AGENTSMD_OUTPUT
+    metadata: Optional[Dict[str, Any]] = field(default=None)
+    dedupe: bool = False
+    minify: bool = False
+
+    def build_targets(self) -> List[PlainTarget]:
+        return [PlainTarget(output=self.output, urls=list(self.urls), dedupe=self.dedupe, minify=self.minify)]
+
+
+AgentsmdConfig = Union[PlainAgentsmdConfig, "AgentsmdBuildConfig"]
+
+
+def load_plain_config(config_path: Path | str) -> Optional[PlainAgentsmdConfig]:
+    """Load the agentsmd section when it only uses the plain options.
+
+    Returns ``None`` for anything else (extra options, invalid values), so the
+    caller can fall back to full validation with ``AgentsmdBuildConfig``.
+    """
+
+    data = load_yaml_file(config_path) or {}
+    build_section = data.get("build") if isinstance(data, dict) else None
+    section = build_section.get("agentsmd") if isinstance(build_section, dict) else None
+    if not isinstance(section, dict) or not set(section) <= _PLAIN_CONFIG_KEYS:
+        return None
+
+    urls = section.get("from")
+    if not isinstance(urls, list) or not urls:
+        return None
+    if not all(isinstance(url, str) and url.strip() for url in urls):
+        return None
+
+    output = section.get("output", DEFAULT_AGENTSMD_OUTPUT)
+    metadata = section.get("metadata")
+    dedupe = section.get("dedupe", False)
+    minify = section.get("minify", False)
+    if not isinstance(output, str) or (metadata is not None and not isinstance(metadata, dict)):
+        return None
+    if not isinstance(dedupe, bool) or not isinstance(minify, bool):
+        return None
+
+    return PlainAgentsmdConfig(urls=urls, output=output, metadata=metadata, dedupe=dedupe, minify=minify)
+
+
+def load_config(config_path: Path | str, output: Optional[str] = None, minify: bool = False) -> AgentsmdConfig:
+    """Load the agentsmd section, validating it with pydantic only when needed.
+
+    ``output`` overrides the configured main output path and ``minify``
+    turns minification on for every target that does not disable it.
+    """
+
+    overrides: Dict[str, Any] = {}
+    if output:
+        overrides["output"] = output
+    if minify:
+        overrides["minify"] = True
+
+    config = load_plain_config(config_path)
+    if config is not None:
+        return replace(config, **overrides)
+
+    from yaxai.yax import AgentsmdBuildConfig
+
+    full_config = AgentsmdBuildConfig.parse_yml(config_path)
+    return full_config.model_copy(update=overrides) if overrides else full_config
+
+
+def resolve_config_path(config_path: Path, cwd: Optional[Path] = None) -> Path:
+    """Resolve the expected config path, allowing parent fallback for defaults.
+
+    ``cwd`` is the directory the default config is looked up from (the
+    process working directory when omitted).
+    """
+
+    cwd = Path(cwd) if cwd is not None else Path.cwd()
+    config_path = Path(config_path)
+    if not config_path.is_absolute():
+        config_path = (cwd / config_path).resolve(strict=False)
+
+    if config_path.exists():
+        return config_path
+
+    is_default_selection = (
+        config_path.name == DEFAULT_AGENTSMD_CONFIG_FILENAME
+        and config_path.parent == cwd
+    )
+
+    if is_default_selection and cwd.parent != cwd and cwd.name:
+        fallback_path = cwd.parent / f"{cwd.name}-{DEFAULT_AGENTSMD_CONFIG_FILENAME}"
+        if fallback_path.exists():
+            return fallback_path
+
+    raise FileNotFoundError(f"Configuration file not found: {config_path}")
+
+
+def resolve_sources(
+    urls: Sequence[str],
+    config_path: Optional[Path] = None,
+    fetcher: Optional[SourceFetcher] = None,
+    base_dir: Optional[Path] = None,
+) -> SourceGraph:
+    """Expand config sources, including nested yax configs, into a source graph."""
+
+    root = f"file:{Path(config_path).resolve()}" if config_path is not None else "<root>"
+
+    with ExitStack() as stack:
+        if fetcher is None:
+            fetcher = stack.enter_context(SourceFetcher())
+        return SourceResolver(fetcher, base_dir).resolve(urls or [], root=root)
+
+
+def render_outputs(
+    targets: Sequence[BuildTarget],
+    config_path: Optional[Path] = None,
+    fetcher: Optional[SourceFetcher] = None,
+    base_dir: Optional[Path] = None,
+    reports: Optional[Dict[Path, BuildReport]] = None,
+    graphs: Optional[List[SourceGraph]] = None,
+) -> List[Tuple[Path, str]]:
+    """Return the output path and rendered content of every target without writing.
+
+    All targets share one fetch pass. Relative ``file:`` sources and output
+    paths are resolved against ``base_dir`` when given (the working directory
+    otherwise). Targets with ``minify``, ``dedupe`` or ``max_tokens`` set go
+    through those stages; what they changed is recorded in ``reports`` when a
+    dict is passed. The source graph of every target is appended to
+    ``graphs`` when a list is passed.
+    """
+
+    with ExitStack() as stack:
+        if fetcher is None:
+            fetcher = stack.enter_context(SourceFetcher())
+
+        target_graphs = [resolve_sources(target.urls or [], config_path, fetcher, base_dir) for target in targets]
+        if graphs is not None:
+            graphs.extend(target_graphs)
+        fragment_origins = [graph.origin_fragments() for graph in target_graphs]
+        texts = fetcher.fetch_all(key for pairs in fragment_origins for _, key in pairs)
+
+    outputs: List[Tuple[Path, str]] = []
+    for target, pairs in zip(targets, fragment_origins):
+        output_path = Path(target.output)
+        if base_dir is not None:
+            output_path = base_dir / output_path
+        report = BuildReport()
+        content = _assemble(target, [(origin, texts[key]) for origin, key in pairs], report)
+        if reports is not None and report.describe():
+            reports[output_path] = report
+        outputs.append((output_path, target.render(content)))
+
+    return outputs
+
+
+def _assemble(target: BuildTarget, fragments: List[Tuple[str, str]], report: BuildReport) -> str:
+    """Join the fragments of a target, applying minify, dedupe and the token budget."""
+
+    tokenizer = target.tokenizer or DEFAULT_TOKENIZER
+    if target.minify:
+        report.minify = minify_fragments([text for _, text in fragments])
+        # Fragments holding nothing but removed content are left out entirely.
+        fragments = [
+            (origin, minified)
+            for (origin, text), minified in zip(fragments, report.minify.fragments)
+            if minified.strip() or not text.strip()
+        ]
+
+    if target.dedupe:
+        report.dedupe = dedupe_fragments([text for _, text in fragments], tokenizer=tokenizer)
+        fragments = [
+            (origin, text)
+            for (origin, _), text in zip(fragments, report.dedupe.fragments)
+            if text is not None
+        ]
+
+    if target.max_tokens is not None:
+        report.budget = apply_budget(
+            [
+                BudgetFragment(origin, target.priorities.get(origin, DEFAULT_PRIORITY), text)
+                for origin, text in fragments
+            ],
+            target.max_tokens,
+            tokenizer=tokenizer,
+        )
+        return report.budget.content
+
+    return "\n\n".join(text for _, text in fragments)
+
+
+def output_matches(path: Path, content: str) -> bool:
+    try:
+        return path.read_text(encoding="utf-8") == content
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
+def write_outputs(outputs: Sequence[Tuple[Path, str]]) -> List[Path]:
+    """Write rendered outputs, in parallel when there are several."""
+
+    def write(output: Tuple[Path, str]) -> Path:
+        output_path, content = output
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(content, encoding="utf-8")
+        return output_path
+
+    if len(outputs) <= 1:
+        return [write(output) for output in outputs]
+
+    with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+        return list(executor.map(write, outputs))
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from typing import List, NamedTuple, Optional, Sequence
+
+from yaxai.dedupe import join_blocks, split_blocks
+from yaxai.markdown import FenceTracker
+from yaxai.tokens import DEFAULT_TOKENIZER, TokenEstimator, get_token_estimator
+
+
+DEFAULT_PRIORITY = 0
+TRUNCATION_MARKER = "<!-- truncated by yax to fit max_tokens -->\n"
+
+
+class BudgetFragment(NamedTuple):
+    source: str
+    priority: int
+    text: str
+
+
+class BudgetCut(NamedTuple):
+    source: str
+    heading: str
+    tokens: int
+    truncated: bool
+
+
+class BudgetResult(NamedTuple):
+    content: str
+    max_tokens: int
+    tokens_before: int
+    tokens_after: int
+    cuts: List[BudgetCut]
+
+    def describe(self) -> List[str]:
+        if not self.cuts:
+            return [f"Token budget: {self.tokens_after} of {self.max_tokens} tokens"]
+
+        lines = [f"Token budget: {self.tokens_before} -> {self.tokens_after} tokens (max {self.max_tokens})"]
+        for cut in self.cuts:
+            action = "truncated" if cut.truncated else "dropped"
+            lines.append(f"  {action} '{cut.heading}' from {cut.source} (-{cut.tokens} tokens)")
+        return lines
+
+
+def apply_budget(
+    fragments: Sequence[BudgetFragment],
+    max_tokens: int,
+    tokenizer: str = DEFAULT_TOKENIZER,
+    separator: str = "\n\n",
+) -> BudgetResult:
+    """Join fragments, cutting the lowest-priority sections until they fit max_tokens.
+
+    Fragments are split into heading-delimited sections that inherit the
+    fragment's priority. Sections are removed lowest priority first and, for
+    equal priorities, from the end of the output backwards. The last section
+    cut is truncated instead of dropped when part of it still fits.
+    """
+
+    estimate = get_token_estimator(tokenizer)
+    separator_cost = estimate(separator)
+    blocks = [split_blocks(fragment.text) for fragment in fragments]
+    costs = [[estimate(block) for block in fragment_blocks] for fragment_blocks in blocks]
+    alive = [any(fragment_blocks) for fragment_blocks in blocks]
+    # Separators between surviving fragments are part of the output too.
+    total = sum(sum(fragment_costs) for fragment_costs in costs) + separator_cost * max(sum(alive) - 1, 0)
+
+    cuts: List[BudgetCut] = []
+    order = sorted(
+        (fragment.priority, -fragment_index, -block_index)
+        for fragment_index, fragment in enumerate(fragments)
+        for block_index in range(len(blocks[fragment_index]))
+    )
+    position = 0
+    # Tokens the joined text costs beyond the per-block estimates, for
+    # tokenizers that merge characters across block boundaries.
+    overhead = 0
+    while True:
+        while position < len(order) and total + overhead > max_tokens:
+            _, negative_fragment, negative_block = order[position]
+            position += 1
+            fragment_index, block_index = -negative_fragment, -negative_block
+            block = blocks[fragment_index][block_index]
+            if not block:
+                continue
+
+            cost = costs[fragment_index][block_index]
+            remaining = max_tokens - overhead - (total - cost)
+            kept = _truncate(block, remaining, estimate) if remaining > 0 else None
+            kept_cost = estimate(kept) if kept else 0
+
+            blocks[fragment_index][block_index] = kept or ""
+            costs[fragment_index][block_index] = kept_cost
+            total -= cost - kept_cost
+            if not any(blocks[fragment_index]):
+                alive[fragment_index] = False
+                if any(alive):
+                    total -= separator_cost
+            cuts.append(BudgetCut(fragments[fragment_index].source, _heading(block), cost - kept_cost, kept is not None))
+
+        content = _join(fragments, blocks, alive, separator)
+        tokens_after = estimate(content)
+        if tokens_after <= max_tokens or position >= len(order):
+            break
+        overhead = max(overhead + 1, tokens_after - total)
+
+    original = separator.join(fragment.text for fragment in fragments)
+
+    return BudgetResult(
+        content=content,
+        max_tokens=max_tokens,
+        tokens_before=estimate(original),
+        tokens_after=tokens_after,
+        cuts=cuts,
+    )
+
+
+def _join(
+    fragments: Sequence[BudgetFragment],
+    blocks: List[List[str]],
+    alive: List[bool],
+    separator: str,
+) -> str:
+    texts = [
+        join_blocks(fragment.text, [block for block in fragment_blocks if block])
+        for fragment, fragment_blocks, fragment_alive in zip(fragments, blocks, alive)
+        if fragment_alive
+    ]
+    return separator.join(text for text in texts if text is not None)
+
+
+def _truncate(block: str, budget: int, estimate: TokenEstimator) -> Optional[str]:
+    """Keep the leading lines of block that fit budget, or None if only the heading would."""
+
+    used = estimate(TRUNCATION_MARKER)
+    kept: List[str] = []
+    fences = FenceTracker()
+    for line in block.splitlines(keepends=True):
+        cost = estimate(line)
+        if used + cost > budget:
+            break
+        kept.append(line)
+        used += cost
+
+        # While a code block is open, room is reserved for closing it.
+        fence = fences.fence
+        fences.feed(line)
+        if fences.fence and not fence:
+            used += estimate(fences.fence + "\n")
+        elif fence and not fences.fence:
+            used -= estimate(fence + "\n")
+
+    if len(kept) <= 1:
+        return None
+
+    text = "".join(kept)
+    if not text.endswith("\n"):
+        text += "\n"
+    if fences.fence:
+        # Close a code block cut in the middle so the marker and the following
+        # sections are not rendered as code.
+        text += fences.fence + "\n"
+    return text + TRUNCATION_MARKER
+
+
+def _heading(block: str) -> str:
+    first_line = block.lstrip("\n").split("\n", 1)[0].strip()
+    return first_line if first_line.startswith("#") else "(text before the first heading)"
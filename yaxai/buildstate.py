@@ -0,0 +1,160 @@
+"""Input fingerprints of projects built with ``yax build --all``.
+
+After a successful build the fingerprint of a project's inputs is stored:
+its config file, the files its ``file:`` globs match, a version of every
+source and the hash of every output. Local files are versioned by content
+hash and GitHub files by the commit their ref resolves to, so checking a
+fingerprint downloads nothing. Projects whose fingerprint still matches are
+neither fetched nor rendered again. ``git+`` and other sources without a
+cheap version always rebuild.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from yaxai.configio import write_text_atomic
+from yaxai.contentcache import CommitResolver
+from yaxai.ghurl import GitHubFile
+from yaxai.gitmirror import is_git_source
+from yaxai.sections import split_section_selector
+from yaxai.sources import SourceGraph, expand_entries, is_config_source, local_config_sources
+
+
+_STATE_VERSION = 1
+
+
+class BuildState:
+    """Fingerprints of the last successful build of each project, kept in one JSON file."""
+
+    def __init__(self, path: Path, commits: Optional[CommitResolver] = None) -> None:
+        self.path = path
+        self.commits = commits or CommitResolver()
+        self._projects: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == _STATE_VERSION and isinstance(data.get("projects"), dict):
+            self._projects = data["projects"]
+
+    def is_unchanged(self, config_path: Path, target_sources: Sequence[Sequence[str]]) -> bool:
+        """Return True when no input or output of the project changed since it was recorded."""
+
+        with self._lock:
+            entry = self._projects.get(str(config_path))
+        if not isinstance(entry, dict) or not isinstance(entry.get("sources"), list):
+            return False
+
+        outputs = entry.get("outputs")
+        if not isinstance(outputs, dict) or not all(
+            _file_digest(Path(output)) == digest for output, digest in outputs.items()
+        ):
+            return False
+
+        fingerprint = self.fingerprint(config_path, target_sources, entry["sources"])
+        return fingerprint is not None and fingerprint == entry.get("fingerprint")
+
+    def record(
+        self,
+        config_path: Path,
+        target_sources: Sequence[Sequence[str]],
+        sources: Sequence[str],
+        outputs: Dict[Path, str],
+    ) -> None:
+        """Remember the inputs and outputs of a successful build."""
+
+        fingerprint = self.fingerprint(config_path, target_sources, sources)
+        with self._lock:
+            if fingerprint is None:
+                self._projects.pop(str(config_path), None)
+                return
+            self._projects[str(config_path)] = {
+                "fingerprint": fingerprint,
+                "sources": sorted(sources),
+                "outputs": {
+                    str(path): hashlib.sha256(content.encode("utf-8")).hexdigest()
+                    for path, content in outputs.items()
+                },
+            }
+
+    def forget(self, config_path: Path) -> None:
+        with self._lock:
+            self._projects.pop(str(config_path), None)
+
+    def save(self) -> None:
+        with self._lock:
+            payload = json.dumps({"version": _STATE_VERSION, "projects": self._projects}, sort_keys=True)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            write_text_atomic(self.path, payload)
+        except OSError:
+            # Without saved state the next build simply renders everything.
+            pass
+
+    def fingerprint(
+        self,
+        config_path: Path,
+        target_sources: Sequence[Sequence[str]],
+        sources: Sequence[str],
+    ) -> Optional[str]:
+        """Return a digest of everything the project's outputs depend on, or None if unknown.
+
+        ``target_sources`` are the ``from`` entries of each target and
+        ``sources`` every source key reached while resolving them. Local
+        configs are expanded again, so files newly matching a glob change the
+        fingerprint.
+        """
+
+        config_digest = _file_digest(config_path)
+        if config_digest is None:
+            return None
+
+        try:
+            expansions = [expand_entries(entries, config_path.parent) for entries in target_sources]
+            for key in sorted(sources):
+                if key.startswith("file:") and is_config_source(key):
+                    expansions.append(local_config_sources(key))
+        except (OSError, RuntimeError, ValueError):
+            return None
+
+        versions: Dict[str, str] = {}
+        for key in sorted(sources):
+            version = self._source_version(key)
+            if version is None:
+                return None
+            versions[key] = version
+
+        payload = json.dumps([config_digest, expansions, versions], sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _source_version(self, key: str) -> Optional[str]:
+        location, _ = split_section_selector(key)
+        if location.startswith("file:"):
+            return _file_digest(Path(location[len("file:"):]))
+        if is_git_source(location):
+            return None
+        try:
+            owner, repository, ref, _ = GitHubFile(location).components()
+        except ValueError:
+            return None
+        return self.commits.resolve(owner, repository, ref)
+
+
+def project_sources(graphs: Sequence[SourceGraph]) -> List[str]:
+    """Return every source key of the given source graphs, without their roots."""
+
+    return sorted({key for graph in graphs for key in graph.nodes if key != graph.root})
+
+
+def _file_digest(path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
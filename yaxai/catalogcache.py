@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict
+from urllib.parse import urlparse
+
+from yaxai.configio import write_bytes_atomic, write_text_atomic
+from yaxai.ghurl import GitHubFile
+
+
+DEFAULT_REVALIDATE_AFTER = 300.0
+
+
+class RemoteCatalogCache:
+    """Local copies of remote catalog JSON files, revalidated with ETags.
+
+    A cached copy younger than ``revalidate_after`` seconds is used without any
+    network traffic; older copies are revalidated with a conditional request
+    and only rewritten when the remote catalog actually changed. Files ending
+    in ``.gz`` (gzipped catalog shards) are kept compressed.
+    """
+
+    def __init__(self, cache_dir: Path | str, revalidate_after: float = DEFAULT_REVALIDATE_AFTER) -> None:
+        self._cache_dir = Path(cache_dir)
+        self._revalidate_after = revalidate_after
+
+    def fetch(self, url: str, refresh: bool = False) -> Path:
+        """Return path of an up-to-date local copy of the remote catalog."""
+
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+        binary = urlparse(url).path.endswith(".gz")
+        body_path = self._cache_dir / (f"{key}.json.gz" if binary else f"{key}.json")
+        meta_path = self._cache_dir / f"{key}.meta.json"
+
+        meta = self._read_meta(meta_path) if body_path.exists() else {}
+        checked_at = meta.get("checked_at", 0.0)
+        if meta and not refresh and time.time() - checked_at < self._revalidate_after:
+            return body_path
+
+        try:
+            result = GitHubFile.parse(url).download_conditional(
+                etag=meta.get("etag"),
+                last_modified=meta.get("last_modified"),
+                binary=binary,
+            )
+        except RuntimeError:
+            if body_path.exists():
+                # Keep working offline with the last known copy.
+                return body_path
+            raise
+
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        if isinstance(result.content, bytes):
+            write_bytes_atomic(body_path, result.content)
+        elif result.content is not None:
+            write_text_atomic(body_path, result.content)
+
+        write_text_atomic(
+            meta_path,
+            json.dumps(
+                {
+                    "url": url,
+                    "etag": result.etag,
+                    "last_modified": result.last_modified,
+                    "checked_at": time.time(),
+                }
+            ),
+        )
+
+        return body_path
+
+    @staticmethod
+    def _read_meta(meta_path: Path) -> Dict[str, Any]:
+        try:
+            data = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+        return data if isinstance(data, dict) else {}
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Iterator, List, NamedTuple, Optional
+
+
+INDEX_SUFFIX = ".index.sqlite"
+
+_SCHEMA_VERSION = "1"
+# LIKE is case-insensitive already; an explicit COLLATE on the expression
+# would stop SQLite from using the NOCASE ``collections_name`` index.
+_NAME_PREFIX_CLAUSE = "name LIKE ? ESCAPE '\\'"
+
+
+class CatalogIndexRow(NamedTuple):
+    organization: str
+    url: str
+    name: Optional[str]
+    output: Optional[str]
+    output_url: Optional[str]
+
+
+class CatalogIndex:
+    """SQLite index compiled from a catalog JSON file.
+
+    The index stores one row per collection together with the size and
+    modification time of the catalog it was compiled from, so callers can
+    detect when the JSON changed and the index has to be rebuilt.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+
+    @classmethod
+    def for_catalog(cls, catalog_path: Path | str) -> "CatalogIndex":
+        """Return the index located next to the provided catalog JSON file."""
+
+        catalog_path = Path(catalog_path)
+        return cls(catalog_path.with_suffix(INDEX_SUFFIX))
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def is_fresh(self, catalog_path: Path | str) -> bool:
+        """Check whether the index was compiled from the current catalog contents."""
+
+        if not self.path.exists():
+            return False
+
+        try:
+            expected = _catalog_fingerprint(Path(catalog_path))
+        except OSError:
+            return False
+
+        try:
+            connection = self._connect()
+            try:
+                rows = dict(connection.execute("SELECT key, value FROM meta").fetchall())
+            finally:
+                connection.close()
+        except sqlite3.Error:
+            return False
+
+        return rows.get("schema") == _SCHEMA_VERSION and rows.get("fingerprint") == expected
+
+    def write(self, catalog_path: Path | str, rows: Iterable[CatalogIndexRow]) -> None:
+        """Compile rows into a fresh index, replacing any previous one atomically."""
+
+        fingerprint = _catalog_fingerprint(Path(catalog_path))
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        temp_path.unlink(missing_ok=True)
+
+        try:
+            connection = sqlite3.connect(temp_path)
+            try:
+                connection.executescript(
+                    """
+                    CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+                    CREATE TABLE collections (
+                        position INTEGER PRIMARY KEY,
+                        organization TEXT NOT NULL,
+                        url TEXT NOT NULL,
+                        name TEXT,
+                        output TEXT,
+                        output_url TEXT
+                    );
+                    """
+                )
+                connection.executemany(
+                    "INSERT INTO collections (organization, url, name, output, output_url) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                connection.executescript(
+                    """
+                    CREATE INDEX collections_organization ON collections (organization);
+                    CREATE INDEX collections_name ON collections (name COLLATE NOCASE);
+                    CREATE INDEX collections_url ON collections (url);
+                    CREATE INDEX collections_output_url ON collections (output_url);
+                    """
+                )
+                connection.executemany(
+                    "INSERT INTO meta (key, value) VALUES (?, ?)",
+                    [("schema", _SCHEMA_VERSION), ("fingerprint", fingerprint)],
+                )
+                connection.commit()
+            finally:
+                connection.close()
+
+            os.replace(temp_path, self.path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    def query(
+        self,
+        organization: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        url: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CatalogIndexRow]:
+        """Yield collections matching all provided criteria in catalog order.
+
+        ``url`` matches both the collection source URL and its output URL,
+        ``name_prefix`` is matched case-insensitively.
+        """
+
+        clauses: List[str] = []
+        params: List[object] = []
+
+        if organization is not None:
+            clauses.append("organization = ?")
+            params.append(organization)
+
+        if name_prefix:
+            clauses.append(_NAME_PREFIX_CLAUSE)
+            params.append(_escape_like(name_prefix) + "%")
+
+        if url is not None:
+            clauses.append("(url = ? OR output_url = ?)")
+            params.extend([url, url])
+
+        statement = "SELECT organization, url, name, output, output_url FROM collections"
+        if clauses:
+            statement += " WHERE " + " AND ".join(clauses)
+        statement += " ORDER BY position"
+        if limit is not None:
+            statement += " LIMIT ?"
+            params.append(limit)
+
+        connection = self._connect()
+        try:
+            for row in connection.execute(statement, params):
+                yield CatalogIndexRow(*row)
+        finally:
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self.path.exists():
+            raise FileNotFoundError(f"Catalog index not found: {self.path}")
+
+        return sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+
+
+def _catalog_fingerprint(catalog_path: Path) -> str:
+    stat = catalog_path.stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Dict, Iterator, NamedTuple, TextIO
+
+
+_CHUNK_SIZE = 1 << 16
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JsonStreamReader:
+    """Incremental JSON reader consuming a text stream in fixed-size chunks.
+
+    Containers are walked token by token, while leaf values (and any subtree
+    the caller is not interested in) are decoded with the standard library
+    decoder, so only the currently parsed value has to fit in memory.
+    """
+
+    def __init__(self, stream: TextIO, chunk_size: int = _CHUNK_SIZE) -> None:
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ('' at end)."""
+
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def read_value(self) -> Any:
+        """Decode and return the next complete JSON value."""
+
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as exc:
+                if self._fill():
+                    continue
+                raise json.JSONDecodeError(exc.msg, self._buffer, exc.pos) from None
+
+            # A number at the very end of the buffer may continue in the next chunk.
+            if end == len(self._buffer) and self._fill():
+                continue
+
+            self._pos = end
+            return value
+
+    def iter_object_keys(self) -> Iterator[str]:
+        """Walk an object, yielding each key; the caller must consume its value."""
+
+        self._expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            if self.peek() != '"':
+                self._fail("Expecting property name enclosed in double quotes")
+            key = self.read_value()
+            self._expect(":")
+            yield key
+
+            if self.peek() == ",":
+                self._pos += 1
+                continue
+            self._expect("}")
+            return
+
+    def iter_array(self) -> Iterator[int]:
+        """Walk an array, yielding element positions; the caller must consume each element."""
+
+        self._expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+
+        position = 0
+        while True:
+            yield position
+            position += 1
+
+            if self.peek() == ",":
+                self._pos += 1
+                continue
+            self._expect("]")
+            return
+
+    def expect_end(self) -> None:
+        if self.peek() != "":
+            self._fail("Extra data")
+
+    def _expect(self, char: str) -> None:
+        if self.peek() != char:
+            self._fail(f"Expecting '{char}' delimiter")
+        self._pos += 1
+
+    def _fail(self, message: str) -> None:
+        raise json.JSONDecodeError(message, self._buffer, self._pos)
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+
+        chunk = self._stream.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+
+class CatalogEvent(NamedTuple):
+    """Item produced while streaming a catalog.
+
+    ``kind`` is ``"collection"`` for every collection mapping,
+    ``"organization_start"`` right before the collections of an organization
+    (carrying the fields parsed so far), ``"organization"`` once an
+    organization object is complete, carrying all its remaining fields (such
+    as ``name``), and ``"shard"`` for every entry of a sharded catalog manifest.
+    """
+
+    kind: str
+    organization: int
+    value: Dict[str, Any]
+
+
+def iter_catalog_events(stream: TextIO) -> Iterator[CatalogEvent]:
+    """Stream raw collection and organization mappings from catalog JSON."""
+
+    reader = JsonStreamReader(stream)
+
+    if reader.peek() != "{":
+        reader.read_value()
+        raise ValueError("Catalog JSON must be an object")
+
+    for key in reader.iter_object_keys():
+        if key == "shards":
+            if reader.peek() != "[":
+                reader.read_value()
+                raise ValueError("Catalog manifest 'shards' must be a list")
+            for position in reader.iter_array():
+                shard = reader.read_value()
+                if not isinstance(shard, dict):
+                    raise ValueError("Expected catalog shard entry to be an object")
+                yield CatalogEvent("shard", position, shard)
+            continue
+
+        if key != "organizations":
+            reader.read_value()
+            continue
+
+        if reader.peek() != "[":
+            reader.read_value()
+            raise ValueError("Catalog 'organizations' must be a list")
+
+        for position in reader.iter_array():
+            if reader.peek() != "{":
+                reader.read_value()
+                raise ValueError("Expected organization entry to be an object")
+
+            fields: Dict[str, Any] = {}
+            for organization_key in reader.iter_object_keys():
+                if organization_key != "collections":
+                    fields[organization_key] = reader.read_value()
+                    continue
+
+                if reader.peek() != "[":
+                    reader.read_value()
+                    raise ValueError("Expected organization 'collections' to be a list")
+
+                yield CatalogEvent("organization_start", position, dict(fields))
+                for _ in reader.iter_array():
+                    yield CatalogEvent("collection", position, reader.read_value())
+
+            yield CatalogEvent("organization", position, fields)
+
+    reader.expect_end()
@@ -2,20 +2,24 @@
 
 from __future__ import annotations
 
+import re
+import sys
+import time
 from dataclasses import replace
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 import typer
 
-from .yax import (
-    DEFAULT_AGENTSMD_CONFIG_FILENAME,
-    DEFAULT_CATALOG_OUTPUT,
-    AgentsmdBuildConfig,
-    CatalogBuildConfig,
-    Discovery,
-    Yax,
-)
+from .defaults import DEFAULT_AGENTSMD_CONFIG_FILENAME, DEFAULT_CATALOG_OUTPUT
+
+# The core modules pull in pydantic, YAML, SQLite and HTTP clients; they are
+# imported inside the commands that need them so `yax --help` and plain
+# `yax build` runs start quickly.
+if TYPE_CHECKING:  # pragma: no cover - imported for annotations only
+    from .agentsmd import AgentsmdConfig, BuildReport
+    from .yax import AgentsmdBuildConfig, CatalogCollection
 
 
 def _green(text: str | Path) -> str:
@@ -25,6 +29,9 @@ def _green(text: str | Path) -> str:
 DEFAULT_CONFIG_FILENAME = DEFAULT_AGENTSMD_CONFIG_FILENAME
 DEFAULT_CATALOG_CONFIG_FILENAME = "yax-catalog.yml"
 DEFAULT_CATALOG_SOURCE_FILENAME = DEFAULT_CATALOG_OUTPUT
+DISCOVER_PAGE_SIZE = 20
+
+_SELECTION_PATTERN = re.compile(r"^[\d\s,-]+$")
 
 app = typer.Typer(help="Interact with Yax features from the command line.", no_args_is_help=True)
 
@@ -63,11 +70,19 @@ def _collection_target_url(collection: CatalogCollection) -> str:
 
     return url
 
-def _load_agentsmd_config(config_path: Path) -> AgentsmdBuildConfig:
-    """Load and return the agentsmd build configuration from the provided path."""
+def _load_agentsmd_config(
+    config_path: Path, output: Optional[Path] = None, minify: bool = False
+) -> Tuple[Path, AgentsmdConfig]:
+    """Load the agentsmd build configuration, returning it with the resolved path.
+
+    Configs using only ``from``, ``output`` and ``metadata`` are loaded without
+    pydantic; anything else is validated by ``AgentsmdBuildConfig``.
+    """
+
+    from .agentsmd import load_config, resolve_config_path
 
     try:
-        resolved_config_path = AgentsmdBuildConfig.resolve_config_path(config_path)
+        resolved_config_path = resolve_config_path(config_path)
     except FileNotFoundError as exc:
         typer.echo(str(exc))
         raise typer.Exit(code=1)
@@ -75,43 +90,136 @@ def _load_agentsmd_config(config_path: Path) -> AgentsmdBuildConfig:
     if resolved_config_path != config_path:
         typer.echo(f"Using fallback configuration file: {_green(resolved_config_path)}")
 
-    return AgentsmdBuildConfig.parse_yml(str(resolved_config_path))
+    return resolved_config_path, load_config(
+        resolved_config_path, str(output) if output is not None else None, minify=minify
+    )
 
-def _build_agentsmd(config: Path, output: Optional[Path]) -> None:
+def _build_agentsmd(config: Path, output: Optional[Path], graph: bool = False, minify: bool = False) -> None:
     """Execute the agentsmd build workflow."""
 
-    build_config = _load_agentsmd_config(config)
+    if not graph and _build_agentsmd_via_daemon(config, output, minify):
+        return
 
-    if output is not None:
-        build_config = build_config.model_copy(update={"output": str(output)})
+    from .agentsmd import render_outputs, resolve_sources, write_outputs
 
-    yax = Yax()
+    config_path, build_config = _load_agentsmd_config(config, output, minify)
 
+    if graph:
+        try:
+            source_graph = resolve_sources(build_config.urls or [], config_path)
+        except Exception as exc:  # pragma: no cover - relies on network errors
+            typer.echo(f"Error resolving sources: {exc}")
+            raise typer.Exit(code=1)
+        typer.echo(source_graph.render())
+        return
+
+    reports: dict[Path, BuildReport] = {}
     try:
-        yax.build_agentsmd(build_config)
+        outputs = render_outputs(build_config.build_targets(), config_path, reports=reports)
+        output_paths = write_outputs(outputs)
     except Exception as exc:  # pragma: no cover - relies on network errors
         typer.echo(f"Error building agentsmd: {exc}")
         raise typer.Exit(code=1)
 
-    typer.echo(f"Generated agents markdown: {_green(build_config.output)}")
+    for output_path in output_paths:
+        typer.echo(f"Generated agents markdown: {_green(output_path)}")
+        if output_path in reports:
+            for line in reports[output_path].describe():
+                typer.echo(f"  {line}")
+
+
+def _build_agentsmd_via_daemon(config: Path, output: Optional[Path], minify: bool = False) -> bool:
+    """Build through a running `yax serve` daemon; return False when none answers."""
+
+    from .daemon import send_request
+
+    response = send_request(
+        {
+            "command": "build",
+            "cwd": str(Path.cwd()),
+            "config": str(config),
+            "output": str(output) if output is not None else None,
+            "minify": minify,
+        }
+    )
+    if response is None:
+        return False
+
+    if response.get("fallback"):
+        typer.echo(f"Using fallback configuration file: {_green(response['config'])}")
+    if not response.get("ok"):
+        typer.echo(response.get("error", "Error building agentsmd"))
+        raise typer.Exit(code=1)
+
+    reports = response.get("reports", {})
+    for output_path in response.get("outputs", []):
+        typer.echo(f"Generated agents markdown: {_green(output_path)}")
+        for line in reports.get(output_path, []):
+            typer.echo(f"  {line}")
+    return True
 
 
-def _export_catalog(source: Path, format_name: str) -> None:
+def _build_all_projects(root: Path) -> None:
+    """Build every project below root and report the status of each one."""
+
+    from .yax import PROJECT_FAILED, Yax
+
+    if not root.is_dir():
+        typer.echo(f"Directory not found: {root}")
+        raise typer.Exit(code=1)
+
+    results = Yax().build_all(root)
+    if not results:
+        typer.echo(f"No {DEFAULT_CONFIG_FILENAME} files found below {root}.")
+        return
+
+    counts: dict[str, int] = {}
+    for result in results:
+        counts[result.status] = counts.get(result.status, 0) + 1
+        try:
+            label = result.config_path.relative_to(root.resolve())
+        except ValueError:
+            label = result.config_path
+        detail = result.error if result.error else ", ".join(str(path.name) for path in result.outputs)
+        typer.echo(f"{result.status:9} {label} ({result.duration:.2f}s) {detail}")
+
+    summary = ", ".join(f"{count} {status}" for status, count in sorted(counts.items()))
+    typer.echo(f"Processed {len(results)} projects: {summary}")
+
+    if counts.get(PROJECT_FAILED):
+        raise typer.Exit(code=1)
+
+
+def _export_catalog(
+    source: Path,
+    format_name: str,
+    organizations: Optional[List[str]] = None,
+    output: Optional[str] = None,
+) -> None:
     """Export catalog JSON into the requested format."""
 
+    from .yax import Yax
+
     if not source.exists():
         typer.echo(f"Catalog source file not found: {source}")
         raise typer.Exit(code=1)
 
     yax = Yax()
+    to_stdout = output == "-"
 
     try:
-        output_path = yax.export_catalog(source, format_name)
+        output_path = yax.export_catalog(
+            source,
+            format_name,
+            organizations=organizations,
+            output=sys.stdout if to_stdout else (Path(output) if output else None),
+        )
     except Exception as exc:  # pragma: no cover - relies on filesystem and parsing errors
-        typer.echo(f"Error exporting catalog: {exc}")
+        typer.echo(f"Error exporting catalog: {exc}", err=to_stdout)
         raise typer.Exit(code=1)
 
-    typer.echo(f"Exported catalog to: {_green(output_path)}")
+    if output_path is not None:
+        typer.echo(f"Exported catalog to: {_green(output_path)}")
 
 
 @agentsmd_app.command("build")
@@ -130,10 +238,37 @@ def agentsmd_build(
         "-o",
         help="Override the output file path for the generated AGENTS.md.",
     ),
+    graph: bool = typer.Option(
+        False,
+        "--graph",
+        help="Print the resolved source graph, including nested configs, instead of building.",
+    ),
+    minify: bool = typer.Option(
+        False,
+        "--minify",
+        help="Strip comments, badges, link references and extra blank lines from the output.",
+    ),
+    build_all: bool = typer.Option(
+        False,
+        "--all",
+        help="Build every yax.yml project below ROOT, sharing downloads between projects.",
+    ),
+    root: Optional[Path] = typer.Argument(
+        None,
+        help="Directory searched by --all (defaults to the current directory).",
+        show_default=False,
+    ),
 ):
     """Load the agentsmd build configuration and report its status."""
 
-    _build_agentsmd(config, output)
+    if build_all:
+        _build_all_projects(root or Path.cwd())
+        return
+    if root is not None:
+        typer.echo("The ROOT argument can only be used together with --all.")
+        raise typer.Exit(code=1)
+
+    _build_agentsmd(config, output, graph, minify)
 
 
 @app.command("build")
@@ -152,31 +287,162 @@ def build_alias(
         "-o",
         help="Override the output file path for the generated AGENTS.md.",
     ),
+    graph: bool = typer.Option(
+        False,
+        "--graph",
+        help="Print the resolved source graph, including nested configs, instead of building.",
+    ),
+    minify: bool = typer.Option(
+        False,
+        "--minify",
+        help="Strip comments, badges, link references and extra blank lines from the output.",
+    ),
+    build_all: bool = typer.Option(
+        False,
+        "--all",
+        help="Build every yax.yml project below ROOT, sharing downloads between projects.",
+    ),
+    root: Optional[Path] = typer.Argument(
+        None,
+        help="Directory searched by --all (defaults to the current directory).",
+        show_default=False,
+    ),
 ):
     """Shorter alias for `yax agentsmd build`."""
 
-    _build_agentsmd(config, output)
+    if build_all:
+        _build_all_projects(root or Path.cwd())
+        return
+    if root is not None:
+        typer.echo("The ROOT argument can only be used together with --all.")
+        raise typer.Exit(code=1)
+
+    _build_agentsmd(config, output, graph, minify)
+
+
+@app.command("serve")
+def serve(
+    socket_path: Optional[Path] = typer.Option(
+        None,
+        "--socket",
+        help="Unix socket to listen on. Defaults to $YAX_SOCKET or ~/.yax/yax.sock.",
+        show_default=False,
+    ),
+    cache_ttl: float = typer.Option(
+        60.0,
+        "--cache-ttl",
+        min=0.0,
+        help="Seconds to reuse downloaded fragments and discovered catalogs.",
+        show_default=True,
+    ),
+    stop: bool = typer.Option(False, "--stop", help="Stop the daemon listening on the socket."),
+) -> None:
+    """Run a daemon that answers `yax build` and `yax agentsmd discover` with warm caches.
+
+    While it runs, those commands send their work to the daemon instead of
+    starting cold; set YAX_NO_DAEMON=1 to bypass it.
+    """
+
+    from .daemon import YaxServer, default_socket_path, send_request
+
+    socket_path = socket_path or default_socket_path()
+
+    if stop:
+        if send_request({"command": "shutdown"}, socket_path) is None:
+            typer.echo(f"No yax daemon is listening on {socket_path}.")
+            raise typer.Exit(code=1)
+        typer.echo(f"Stopped yax daemon on {_green(socket_path)}")
+        return
+
+    try:
+        server = YaxServer(socket_path, cache_ttl=cache_ttl)
+    except (OSError, RuntimeError) as exc:
+        typer.echo(f"Error starting yax daemon: {exc}")
+        raise typer.Exit(code=1)
+
+    with server:
+        server.warm_up()
+        typer.echo(f"Serving yax on {_green(socket_path)} (press Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:  # pragma: no cover - interactive
+            pass
 
 
 @agentsmd_app.command("discover")
 def agentsmd_discover(
-    catalog: Optional[Path] = typer.Option(
+    catalogs: Optional[List[str]] = typer.Option(
         None,
         "--catalog",
         "-c",
-        resolve_path=True,
-        help="Path to the catalog JSON file. Defaults to ~/.yax/yax-catalog.json.",
+        help=(
+            "Catalog JSON path or GitHub URL; repeat to federate several catalogs. "
+            "Defaults to 'discover.catalogs' from ~/.yax/config.yml or ~/.yax/yax-catalog.json."
+        ),
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Revalidate cached remote catalogs even if they were checked recently.",
+    ),
+    organizations: Optional[List[str]] = typer.Option(
+        None,
+        "--organization",
+        help="Only list collections of this organization; repeat for several.",
+    ),
+    limit: Optional[int] = typer.Option(
+        None,
+        "--limit",
+        "-n",
+        min=1,
+        help="List at most this many collections.",
+    ),
+    add: Optional[List[str]] = typer.Option(
+        None,
+        "--add",
+        help="Add the best match for this query without prompting; repeat for several.",
     ),
 ) -> None:
     """List collections discovered from the catalog JSON."""
 
-    discovery = Discovery(catalog)
-
-    try:
-        collections = discovery.discover()
-    except Exception as exc:
-        typer.echo(f"Error discovering catalogs: {exc}")
-        raise typer.Exit(code=1)
+    from .daemon import send_request
+    from .fuzzy import FuzzyIndex
+    from .yax import AgentsmdBuildConfig, CatalogCollection, Discovery
+
+    # Only the first page is printed while the catalog loads; the rest is
+    # reachable through filtering and paging.
+    listing = not add
+    collections: List[CatalogCollection] = []
+
+    def collect(collection: CatalogCollection) -> None:
+        collections.append(collection)
+        if listing and len(collections) <= DISCOVER_PAGE_SIZE:
+            typer.echo(f"{len(collections)}. {_format_collection_label(collection)}")
+
+    response = send_request(
+        {
+            "command": "discover",
+            "cwd": str(Path.cwd()),
+            "catalogs": catalogs or None,
+            "organizations": organizations or None,
+            "refresh": refresh,
+            "limit": limit,
+        }
+    )
+    if response is not None:
+        if not response.get("ok"):
+            typer.echo(response.get("error", "Error discovering catalogs"))
+            raise typer.Exit(code=1)
+        for entry in response.get("collections", []):
+            collect(CatalogCollection(**entry))
+    else:
+        discovery = Discovery(catalogs or None, refresh=refresh, organizations=organizations or None)
+        try:
+            for collection in islice(discovery.iter_collections(), limit):
+                collect(collection)
+        except Exception as exc:
+            typer.echo(f"Error discovering catalogs: {exc}")
+            raise typer.Exit(code=1)
 
     if not collections:
         typer.echo("No catalog collections found.")
@@ -188,48 +454,174 @@ def agentsmd_discover(
     except FileNotFoundError as exc:
         build_config = AgentsmdBuildConfig()
 
-    while True:
-        for index, collection in enumerate(collections, start=1):
-            label = _format_collection_label(collection)
-            typer.echo(f"{index}. {label}")
+    index = FuzzyIndex(
+        [f"{_format_collection_label(collection)} {collection.url}" for collection in collections]
+    )
+
+    if add:
+        chosen: List[CatalogCollection] = []
+        for query in add:
+            matches = index.search(query)
+            if not matches:
+                typer.echo(f"No collection matches '{query}'.")
+                raise typer.Exit(code=1)
+            chosen.append(collections[matches[0]])
+        _add_collections(build_config, config_path, chosen)
+        return
+
+    matches = list(range(len(collections)))
+    query = ""
+    page = 0
+    selected: List[CatalogCollection] = []
+    if len(collections) > DISCOVER_PAGE_SIZE:
+        _echo_page_footer(0, len(collections))
 
-        selection = typer.prompt(
-            "Select a collection number (press Enter to exit)",
+    while True:
+        answer = typer.prompt(
+            "Filter, select (e.g. 3,7-9), '>'/'<' to page, '/' to clear (press Enter to finish)",
             default="",
             show_default=False,
         ).strip()
 
-        if not selection:
-            return
+        if not answer:
+            break
+
+        if answer in (">", "<"):
+            last_page = (len(matches) - 1) // DISCOVER_PAGE_SIZE
+            page = min(page + 1, last_page) if answer == ">" else max(page - 1, 0)
+        elif _SELECTION_PATTERN.match(answer):
+            try:
+                positions = _parse_selection(answer, len(matches))
+            except ValueError as exc:
+                typer.echo(f"Invalid selection: {exc}")
+                continue
+            for position in positions:
+                collection = collections[matches[position]]
+                if collection not in selected:
+                    selected.append(collection)
+                    typer.echo(f"Selected {_format_collection_label(collection)}")
+            continue
+        else:
+            new_query = "" if answer == "/" else answer
+            # Substring matches of a longer query are among the previous results;
+            # typo matches are still looked up in the whole index.
+            within = matches if query and new_query.lower().startswith(query.lower()) else None
+            matches = index.search(new_query, within)
+            query = new_query
+            page = 0
+
+        if not matches:
+            typer.echo(f"No collections match '{query}'.")
+            continue
+        _echo_page(collections, matches, page)
 
+    _add_collections(build_config, config_path, selected)
+
+
+def _parse_selection(selection: str, count: int) -> List[int]:
+    """Parse numbers and ranges like ``3,7-9`` into zero-based positions."""
+
+    positions: List[int] = []
+    for part in selection.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        start, separator, end = part.partition("-")
         try:
-            index = int(selection)
+            first = int(start)
+            last = int(end) if separator else first
         except ValueError:
-            typer.echo("Invalid selection. Enter a number from the list or press Enter to exit.")
-            continue
+            raise ValueError(f"'{part}' is not a number or range") from None
+        if not 1 <= first <= last <= count:
+            raise ValueError(f"'{part}' is outside 1-{count}")
+        positions.extend(range(first - 1, last))
+
+    if not positions:
+        raise ValueError("no collections selected")
+    return list(dict.fromkeys(positions))
+
+
+def _echo_page(collections: List[CatalogCollection], matches: List[int], page: int) -> None:
+    start = page * DISCOVER_PAGE_SIZE
+    for number, position in enumerate(matches[start:start + DISCOVER_PAGE_SIZE], start=start + 1):
+        typer.echo(f"{number}. {_format_collection_label(collections[position])}")
+    if len(matches) > DISCOVER_PAGE_SIZE:
+        _echo_page_footer(page, len(matches))
+
+
+def _echo_page_footer(page: int, total: int) -> None:
+    start = page * DISCOVER_PAGE_SIZE
+    typer.echo(f"Showing {start + 1}-{min(start + DISCOVER_PAGE_SIZE, total)} of {total} collections.")
 
-        if not 1 <= index <= len(collections):
-            typer.echo("Invalid selection. Enter a number from the list or press Enter to exit.")
-            continue
 
-        chosen = collections[index - 1]
+def _add_collections(build_config: AgentsmdBuildConfig, config_path: Path, chosen: List[CatalogCollection]) -> None:
+    """Add the chosen collections to the config, writing it once."""
 
+    added: List[str] = []
+    for collection in chosen:
         try:
-            target_url = _collection_target_url(chosen)
+            target_url = _collection_target_url(collection)
         except ValueError as exc:
             typer.echo(f"Unable to add selection: {exc}")
             continue
 
-        try:
-            if target_url not in build_config.urls:
-                build_config.urls.append(target_url)
-                build_config.save(config_path)
-                typer.echo(f"Added {target_url} to {config_path}.")
-            else:
-                typer.echo(f"{target_url} is already present in {config_path}.")
-        except Exception as exc:
-            typer.echo(f"Failed to update configuration: {exc}")
-            raise typer.Exit(code=1)
+        if target_url in build_config.urls or target_url in added:
+            typer.echo(f"{target_url} is already present in {config_path}.")
+        else:
+            added.append(target_url)
+
+    if not added:
+        return
+
+    try:
+        build_config.urls.extend(added)
+        build_config.save(config_path)
+    except Exception as exc:
+        typer.echo(f"Failed to update configuration: {exc}")
+        raise typer.Exit(code=1)
+
+    for target_url in added:
+        typer.echo(f"Added {target_url} to {config_path}.")
+
+
+@agentsmd_app.command("search")
+def agentsmd_search(
+    query: str = typer.Argument(..., help="Words to look for in collection contents."),
+    catalog: Optional[Path] = typer.Option(
+        None,
+        "--catalog",
+        "-c",
+        resolve_path=True,
+        help="Path to the catalog JSON file. Defaults to ~/.yax/yax-catalog.json.",
+    ),
+    limit: int = typer.Option(
+        10,
+        "--limit",
+        "-n",
+        min=1,
+        help="Maximum number of results to show.",
+        show_default=True,
+    ),
+) -> None:
+    """Search collection contents indexed by `yax catalog build --search`."""
+
+    from .yax import Discovery
+
+    try:
+        hits = Discovery(catalog).search(query, limit=limit)
+    except Exception as exc:
+        typer.echo(f"Error searching catalog: {exc}")
+        raise typer.Exit(code=1)
+
+    if not hits:
+        typer.echo("No matching collections found.")
+        return
+
+    for position, hit in enumerate(hits, start=1):
+        label = hit.document.name or hit.document.url
+        typer.echo(f"{position}. {label} ({_green(hit.document.url)})")
+        typer.echo(f"   {hit.snippet}")
+
 
 @catalog_app.command("build")
 def catalog_build(
@@ -247,19 +639,76 @@ def catalog_build(
         "-o",
         help="Override the output file path for the generated catalog JSON.",
     ),
+    index: Optional[bool] = typer.Option(
+        None,
+        "--index/--no-index",
+        help="Compile a SQLite lookup index next to the generated catalog JSON.",
+    ),
+    search: Optional[bool] = typer.Option(
+        None,
+        "--search/--no-search",
+        help="Fetch collection outputs and build a full-text search index next to the catalog.",
+    ),
+    shards: Optional[bool] = typer.Option(
+        None,
+        "--shards/--no-shards",
+        help="Write a manifest plus per-organization shard files instead of a single JSON.",
+    ),
+    shard_buckets: Optional[int] = typer.Option(
+        None,
+        "--shard-buckets",
+        min=1,
+        help="Split each organization into this many hash buckets (implies --shards).",
+    ),
+    shard_gzip: Optional[bool] = typer.Option(
+        None,
+        "--gzip/--no-gzip",
+        help="Gzip shard files (implies --shards).",
+    ),
+    scan_org: Optional[str] = typer.Option(
+        None,
+        "--scan-org",
+        help="Also collect yax.yml and *-yax.yml files from every repository of this GitHub organization.",
+    ),
 ):
     """Build the catalog JSON artifact."""
+
+    from .yax import CatalogBuildConfig, CatalogShardConfig, Yax
+
     try:
-        build_config = CatalogBuildConfig.open_catalog_build_config(config)
+        if scan_org and not config.exists():
+            build_config = CatalogBuildConfig(organization=scan_org)
+        else:
+            build_config = CatalogBuildConfig.open_catalog_build_config(config)
+        if scan_org:
+            build_config = replace(build_config, scan_organization=scan_org)
         if output:
             build_config = replace(build_config, output=str(output))
-
-        Yax().build_catalog(build_config)
+        if index is not None:
+            build_config = replace(build_config, index=index)
+        if search is not None:
+            build_config = replace(build_config, search=search)
+        if shards is False:
+            build_config = replace(build_config, shards=None)
+        elif shards or shard_buckets is not None or shard_gzip is not None:
+            shard_config = build_config.shards or CatalogShardConfig()
+            if shard_buckets is not None:
+                shard_config = replace(shard_config, buckets=shard_buckets)
+            if shard_gzip is not None:
+                shard_config = replace(shard_config, gzip=shard_gzip)
+            build_config = replace(build_config, shards=shard_config)
+
+        search_failures = Yax().build_catalog(build_config)
 
         typer.echo(f"Generated catalog at: {_green(build_config.output)}")
+        for collection_url, reason in search_failures.items():
+            typer.echo(f"Left out of the search index: {collection_url} ({reason})")
     except FileNotFoundError:
         typer.echo(f"Catalog configuration file not found: {config}")
         raise typer.Exit(code=1)
+    except RuntimeError as exc:
+        typer.echo(f"Error building catalog: {exc}")
+        raise typer.Exit(code=1)
 
 
 @catalog_app.command("export")
@@ -276,13 +725,105 @@ def catalog_export(
         "markdown",
         "--format",
         "-f",
-        help="Output format for the exported catalog.",
+        help="Output format for the exported catalog (markdown, jsonl, csv or html).",
         show_default=True,
     ),
+    organizations: Optional[List[str]] = typer.Option(
+        None,
+        "--organization",
+        help="Only export this organization; repeat for several.",
+    ),
+    output: Optional[str] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Output file path, or '-' for stdout. Defaults to the source path with the format extension.",
+    ),
 ):
     """Export the catalog JSON into alternative formats."""
 
-    _export_catalog(source, format_name)
+    _export_catalog(source, format_name, organizations or None, output)
+
+
+@catalog_app.command("verify")
+def catalog_verify(
+    source: Path = typer.Option(
+        Path(DEFAULT_CATALOG_SOURCE_FILENAME),
+        "--source",
+        "-s",
+        resolve_path=True,
+        help="Path to the catalog JSON file to verify.",
+        show_default=True,
+    ),
+    organizations: Optional[List[str]] = typer.Option(
+        None,
+        "--organization",
+        help="Only verify this organization; repeat for several.",
+    ),
+    concurrency: int = typer.Option(32, "--concurrency", min=1, help="Maximum number of parallel checks."),
+    per_host: int = typer.Option(8, "--per-host", min=1, help="Maximum number of parallel checks per host."),
+    host_limits: Optional[List[str]] = typer.Option(
+        None,
+        "--host-limit",
+        help="Override --per-host for one host as HOST=N; repeat for several (raw.githubusercontent.com defaults to 32).",
+    ),
+    timeout: float = typer.Option(10.0, "--timeout", min=0.1, help="Timeout in seconds for each request."),
+    write: bool = typer.Option(
+        False,
+        "--write/--no-write",
+        help="Store the results in the catalog so later runs can use conditional requests.",
+    ),
+):
+    """Check that every catalog collection output still resolves."""
+
+    from .verify import LINK_DEAD, LINK_ERROR, LINK_OK, LinkChecker
+    from .yax import Yax
+
+    if not source.exists():
+        typer.echo(f"Catalog source file not found: {source}")
+        raise typer.Exit(code=1)
+
+    limits: dict[str, int] = {}
+    for entry in host_limits or []:
+        host, _, limit = entry.partition("=")
+        if not host.strip() or not limit.strip().isdigit() or int(limit) < 1:
+            typer.echo(f"Invalid --host-limit '{entry}': expected HOST=N with a positive N")
+            raise typer.Exit(code=1)
+        limits[host.strip()] = int(limit)
+
+    checker = LinkChecker(max_workers=concurrency, per_host=per_host, timeout=timeout, host_limits=limits)
+    started = time.perf_counter()
+    try:
+        results = Yax().verify_catalog(source, organizations=organizations or None, checker=checker, write=write)
+    except Exception as exc:  # pragma: no cover - relies on filesystem and parsing errors
+        typer.echo(f"Error verifying catalog: {exc}")
+        raise typer.Exit(code=1)
+    elapsed = time.perf_counter() - started
+
+    counts: dict[str, int] = {}
+    for result in results:
+        check = result.check
+        counts[check.status] = counts.get(check.status, 0) + 1
+        if check.status == LINK_OK:
+            continue
+
+        details = [f"{round(check.latency * 1000)}ms"]
+        if check.http_status is not None:
+            details.insert(0, str(check.http_status))
+        if check.location:
+            details.append(f"-> {check.location}")
+        if check.error:
+            details.append(check.error)
+        typer.echo(
+            f"{check.status.upper():8} {_format_collection_label(result.collection)} "
+            f"({check.url}) {' '.join(details)}"
+        )
+
+    summary = ", ".join(f"{count} {status}" for status, count in sorted(counts.items())) or "nothing to check"
+    typer.echo(f"Checked {len(results)} collections in {elapsed:.1f}s: {summary}")
+
+    if counts.get(LINK_DEAD) or counts.get(LINK_ERROR):
+        raise typer.Exit(code=1)
 
 
 if __name__ == "__main__":  # pragma: no cover - manual execution helper
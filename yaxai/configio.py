@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import copy
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Tuple
+
+import yaml
+
+
+# libyaml's loader and dumper are several times faster than the pure-Python ones.
+SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SAFE_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+_CACHE_SIZE = 256
+
+_cache: "OrderedDict[Path, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def parse_yaml(text: str) -> Any:
+    """Parse YAML text with the fastest available safe loader."""
+
+    return yaml.load(text, Loader=SAFE_LOADER)
+
+
+def dump_yaml(data: Any, sort_keys: bool = False) -> str:
+    """Serialize data to YAML with the fastest available safe dumper."""
+
+    return yaml.dump(data, Dumper=SAFE_DUMPER, sort_keys=sort_keys, allow_unicode=True)
+
+
+def load_yaml_file(path: Path | str) -> Any:
+    """Load a YAML file, reusing the parsed document while the file is unchanged.
+
+    Parsed documents are cached by path, modification time and size. Every
+    call returns its own copy, so callers are free to modify the result.
+    """
+
+    path = Path(path).resolve()
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached is not None and cached[0] == signature:
+            _cache.move_to_end(path)
+            return copy.deepcopy(cached[1])
+
+    data = parse_yaml(path.read_text(encoding="utf-8"))
+    _remember(path, signature, data)
+
+    return copy.deepcopy(data)
+
+
+def write_yaml_file(path: Path | str, data: Any, sort_keys: bool = False) -> None:
+    """Atomically write data as YAML and keep the cache in sync with the new file."""
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_text_atomic(path, dump_yaml(data, sort_keys=sort_keys))
+
+    resolved = path.resolve()
+    stat = resolved.stat()
+    _remember(resolved, (stat.st_mtime_ns, stat.st_size), copy.deepcopy(data))
+
+
+def write_text_atomic(path: Path, content: str) -> None:
+    """Write content through a temporary file so readers never see partial files."""
+
+    write_bytes_atomic(path, content.encode("utf-8"))
+
+
+def write_bytes_atomic(path: Path, content: bytes) -> None:
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        temp_path.write_bytes(content)
+        os.replace(temp_path, path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def clear_yaml_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
+
+
+def _remember(path: Path, signature: Tuple[int, int], data: Any) -> None:
+    with _cache_lock:
+        _cache[path] = (signature, data)
+        _cache.move_to_end(path)
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
@@ -0,0 +1,135 @@
+"""Content cache for GitHub sources keyed by resolved commit SHAs.
+
+Branch and tag refs are resolved to a commit once per build; file contents
+are stored under ``owner/repo@sha:path``, which never changes, so unchanged
+repositories are served from disk without revalidating each file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from yaxai.configio import write_text_atomic
+from yaxai.ghurl import GitHubFile, GitHubTokenFinder, resolve_commit_sha
+
+
+DEFAULT_CONTENT_CACHE_DIR = Path.home() / ".yax" / "cache" / "content"
+CONTENT_CACHE_DIR_ENV = "YAX_CONTENT_CACHE_DIR"
+
+CommitLookup = Callable[[str, str, str], str]
+
+
+def default_content_cache_dir() -> Path:
+    """Return the content cache directory, honouring the YAX_CONTENT_CACHE_DIR override."""
+
+    override = os.getenv(CONTENT_CACHE_DIR_ENV)
+    return Path(override).expanduser() if override else DEFAULT_CONTENT_CACHE_DIR
+
+
+class CommitResolver:
+    """Resolve each distinct owner/repo/ref to a commit SHA once.
+
+    Concurrent lookups of the same ref share one request. Results (including
+    failures, as None) are kept for ``ttl`` seconds, or for the resolver's
+    lifetime when ``ttl`` is None. The default lookup finds the GitHub token
+    once, on the first ref that needs a request.
+    """
+
+    def __init__(self, lookup: Optional[CommitLookup] = None, ttl: Optional[float] = None) -> None:
+        self._lookup = lookup or self._resolve_commit_sha
+        self._ttl = ttl
+        self._resolved: Dict[Tuple[str, str, str], Tuple[float, Future[Optional[str]]]] = {}
+        self._lock = threading.Lock()
+        self._token: Optional[str] = None
+        self._token_lock = threading.Lock()
+
+    def resolve(self, owner: str, repository: str, ref: str) -> Optional[str]:
+        key = (owner.lower(), repository.lower(), ref)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._resolved.get(key)
+            owner_of_lookup = entry is None or (self._ttl is not None and now - entry[0] >= self._ttl)
+            if owner_of_lookup:
+                entry = self._resolved[key] = (now, Future())
+        assert entry is not None
+        future = entry[1]
+
+        if owner_of_lookup:
+            try:
+                future.set_result(self._lookup(owner, repository, ref))
+            except Exception:
+                # Unresolvable refs fall back to downloading by ref name. The
+                # future is always completed so waiting callers never hang.
+                future.set_result(None)
+        return future.result()
+
+    def _resolve_commit_sha(self, owner: str, repository: str, ref: str) -> str:
+        return resolve_commit_sha(owner, repository, ref, token=self._github_token())
+
+    def _github_token(self) -> str:
+        # Finding the token may run `gh auth token`; do it once, not per ref.
+        # An empty string records that no token is available.
+        with self._token_lock:
+            if self._token is None:
+                self._token = GitHubTokenFinder().find() or ""
+            return self._token
+
+
+class ContentCache:
+    """Texts stored on disk under an immutable identity."""
+
+    def __init__(self, cache_dir: Optional[Path | str] = None) -> None:
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else default_content_cache_dir()
+
+    def get(self, identity: str) -> Optional[str]:
+        try:
+            return self._path(identity).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def put(self, identity: str, text: str) -> None:
+        path = self._path(identity)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write_text_atomic(path, text)
+        except OSError:
+            # The cache is an optimization; a read-only home must not fail builds.
+            pass
+
+    def _path(self, identity: str) -> Path:
+        digest = hashlib.sha256(identity.encode("utf-8")).hexdigest()
+        return self._cache_dir / digest[:2] / digest[2:]
+
+
+class PinnedGitHubDownloader:
+    """Download GitHub files by commit SHA, serving unchanged commits from the cache."""
+
+    def __init__(
+        self,
+        commits: Optional[CommitResolver] = None,
+        cache: Optional[ContentCache] = None,
+        download: Optional[Callable[[GitHubFile], str]] = None,
+    ) -> None:
+        self.commits = commits or CommitResolver()
+        self.cache = cache or ContentCache()
+        self._download = download or GitHubFile.download
+
+    def download(self, url: str) -> str:
+        github_file = GitHubFile(url)
+        owner, repository, ref, path = github_file.components()
+        sha = self.commits.resolve(owner, repository, ref)
+        if sha is None:
+            return self._download(github_file)
+
+        identity = f"{owner.lower()}/{repository.lower()}@{sha}:{path}"
+        text = self.cache.get(identity)
+        if text is None:
+            text = self._download(github_file.at_ref(sha))
+            self.cache.put(identity, text)
+        return text
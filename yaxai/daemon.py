@@ -0,0 +1,329 @@
+"""Long-running build server (``yax serve``) and its Unix socket client.
+
+The server keeps imported modules, parsed configs and downloaded
+fragments in memory, so builds requested by the CLI skip the
+start-up work. Requests and responses are single JSON lines.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from dataclasses import asdict
+from itertools import islice
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
+
+
+DEFAULT_SOCKET_PATH = Path.home() / ".yax" / "yax.sock"
+SOCKET_PATH_ENV = "YAX_SOCKET"
+NO_DAEMON_ENV = "YAX_NO_DAEMON"
+DEFAULT_CACHE_TTL = 60.0
+# Covers connecting and the daemon accepting the request. A daemon that
+# does not accept in time is treated like a missing one and the client
+# builds in-process; once accepted, the client waits for the build however
+# long it takes.
+HANDSHAKE_TIMEOUT = 5.0
+# Environment that changes what a build fetches or with which credentials.
+# Requests are only served when the client's values match the daemon's.
+CLIENT_ENVIRONMENT = (
+    "GITHUB_TOKEN",
+    "GH_TOKEN",
+    "YAX_GITHUB_API_URL",
+    "YAX_GITHUB_MIRRORS",
+    "YAX_CONTENT_CACHE_DIR",
+    "YAX_MIRROR_DIR",
+)
+
+
+_ACCEPTED = {"accepted": True}
+
+
+def default_socket_path() -> Path:
+    """Return the daemon socket path, honouring the YAX_SOCKET override."""
+
+    override = os.getenv(SOCKET_PATH_ENV)
+    return Path(override).expanduser() if override else DEFAULT_SOCKET_PATH
+
+
+def environment_fingerprint() -> str:
+    """Return a digest of the environment variables that affect builds."""
+
+    values = {name: os.getenv(name) for name in CLIENT_ENVIRONMENT}
+    return hashlib.sha256(json.dumps(values, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def send_request(payload: Dict[str, Any], socket_path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Send one request to a running daemon.
+
+    Returns ``None`` when no daemon is listening (or YAX_NO_DAEMON is set),
+    when it does not accept the request within HANDSHAKE_TIMEOUT, or when it
+    runs with a different token or endpoint environment, so callers can fall
+    back to doing the work in-process. Once the daemon has accepted a request
+    the client never falls back, since the daemon may already be writing
+    outputs; a lost connection is returned as a failed response instead.
+    """
+
+    if os.getenv(NO_DAEMON_ENV) or not hasattr(socket, "AF_UNIX"):
+        return None
+
+    socket_path = socket_path or default_socket_path()
+    if not socket_path.exists():
+        return None
+
+    request = {**payload, "environment": environment_fingerprint()}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.settimeout(HANDSHAKE_TIMEOUT)
+            client.connect(str(socket_path))
+            client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            stream = client.makefile("rb")
+            reply = _read_reply(stream)
+        except OSError:
+            return None
+
+        if reply is None or reply.get("environment_mismatch"):
+            return None
+        if not reply.get("accepted"):
+            return reply
+
+        try:
+            client.settimeout(None)
+            response = _read_reply(stream)
+        except OSError:
+            response = None
+        finally:
+            stream.close()
+
+    if response is None:
+        return {"ok": False, "error": f"The yax daemon on {socket_path} stopped before finishing the request"}
+    return response
+
+
+def _read_reply(stream: BinaryIO) -> Optional[Dict[str, Any]]:
+    line = stream.readline()
+    try:
+        reply = json.loads(line) if line.endswith(b"\n") else None
+    except ValueError:
+        return None
+    return reply if isinstance(reply, dict) else None
+
+
+class FragmentCache:
+    """Memoize downloaded fragments for ``ttl`` seconds.
+
+    Local ``file:`` sources are always read again, so edits show up in the
+    next build.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_CACHE_TTL, download: Optional[Callable[[str], str]] = None) -> None:
+        from yaxai.contentcache import CommitResolver, PinnedGitHubDownloader
+        from yaxai.sources import SourceDownloader
+
+        self._ttl = ttl
+        # Refs are re-resolved once the TTL has passed, so new commits show up.
+        self._download = download or SourceDownloader(PinnedGitHubDownloader(CommitResolver(ttl=ttl)))
+        self._entries: Dict[str, Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def download(self, key: str) -> str:
+        if key.startswith("file:"):
+            return self._download(key)
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and now - entry[0] < self._ttl:
+            return entry[1]
+
+        text = self._download(key)
+        with self._lock:
+            self._entries[key] = (now, text)
+        return text
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            payload = json.loads(line)
+        except ValueError as exc:
+            response: Optional[Dict[str, Any]] = {"ok": False, "error": f"Invalid request: {exc}"}
+        else:
+            response = self.server.reject(payload)  # type: ignore[attr-defined]
+            if response is None:
+                # Tell the client the work has started before doing it, so it
+                # can wait without a timeout instead of building in parallel.
+                self._reply(_ACCEPTED)
+                response = self.server.dispatch(payload)  # type: ignore[attr-defined]
+        self._reply(response)
+
+    def _reply(self, response: Dict[str, Any]) -> None:
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+
+class YaxServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Answer ``build`` and ``discover`` requests over a Unix socket with warm caches."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Optional[Path] = None, cache_ttl: float = DEFAULT_CACHE_TTL) -> None:
+        self.socket_path = Path(socket_path or default_socket_path())
+        self.cache_ttl = cache_ttl
+        self.fragments = FragmentCache(cache_ttl)
+        self.requests_served = 0
+        self.environment = environment_fingerprint()
+        self._discoveries: Dict[Tuple[Any, ...], Tuple[float, List[Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        _remove_stale_socket(self.socket_path)
+        # The socket is created owner-only instead of being restricted after
+        # bind, so other users never get a window to connect.
+        previous_umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.socket_path), _RequestHandler)
+        finally:
+            os.umask(previous_umask)
+
+    def warm_up(self) -> None:
+        """Import the build modules ahead of the first request."""
+
+        import yaxai.yax  # noqa: F401 - loads pydantic and the catalog model
+
+    def dispatch(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        rejection = self.reject(payload)
+        if rejection is not None:
+            return rejection
+
+        with self._lock:
+            self.requests_served += 1
+        try:
+            return self._handlers()[payload["command"]](payload)
+        except Exception as exc:
+            return {"ok": False, "error": f"Unexpected error: {exc}"}
+
+    def reject(self, payload: Any) -> Optional[Dict[str, Any]]:
+        """Return the error response for a request the daemon will not serve, or None."""
+
+        command = payload.get("command") if isinstance(payload, dict) else None
+        if not isinstance(command, str) or command not in self._handlers():
+            return {"ok": False, "error": f"Unknown command: {command!r}"}
+        if command in {"build", "discover"} and payload.get("environment") != self.environment:
+            return {
+                "ok": False,
+                "environment_mismatch": True,
+                "error": "The daemon runs with a different GitHub token or endpoint configuration",
+            }
+        return None
+
+    def _handlers(self) -> Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]]:
+        return {
+            "ping": lambda _: {"ok": True, "pid": os.getpid()},
+            "build": self._build,
+            "discover": self._discover,
+            "shutdown": self._shutdown,
+        }
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+    def _build(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        from yaxai.agentsmd import load_config, render_outputs, resolve_config_path, write_outputs
+        from yaxai.sources import SourceFetcher
+
+        cwd = Path(payload["cwd"])
+        requested = cwd / payload["config"]
+        try:
+            config_path = resolve_config_path(requested, cwd=cwd)
+        except FileNotFoundError as exc:
+            return {"ok": False, "error": str(exc)}
+
+        response: Dict[str, Any] = {"config": str(config_path), "fallback": config_path != requested}
+        reports: Dict[Path, Any] = {}
+        try:
+            config = load_config(config_path, payload.get("output"), minify=bool(payload.get("minify")))
+            with SourceFetcher(download=self.fragments.download) as fetcher:
+                outputs = render_outputs(
+                    config.build_targets(), config_path, fetcher, base_dir=cwd, reports=reports
+                )
+            output_paths = write_outputs(outputs)
+        except Exception as exc:
+            return {**response, "ok": False, "error": f"Error building agentsmd: {exc}"}
+
+        return {
+            **response,
+            "ok": True,
+            "outputs": [_display_path(path, cwd) for path in output_paths],
+            "reports": {_display_path(path, cwd): report.describe() for path, report in reports.items()},
+        }
+
+    def _discover(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        from yaxai.yax import Discovery
+
+        cwd = Path(payload["cwd"])
+        catalogs = [
+            catalog if "://" in catalog else str(cwd / catalog)
+            for catalog in payload.get("catalogs") or []
+        ]
+        organizations = payload.get("organizations") or None
+        refresh = bool(payload.get("refresh"))
+        key = (tuple(catalogs), tuple(sorted(organizations)) if organizations else None)
+
+        limit = payload.get("limit")
+        now = time.monotonic()
+        with self._lock:
+            cached = self._discoveries.get(key)
+        if cached is not None and not refresh and now - cached[0] < self.cache_ttl:
+            return {"ok": True, "collections": cached[1][:limit] if limit else cached[1]}
+
+        try:
+            discovery = Discovery(catalogs or None, refresh=refresh, organizations=organizations)
+            # With a limit the catalog stream stops early; the partial result is not cached.
+            collections = [asdict(collection) for collection in islice(discovery.iter_collections(), limit or None)]
+        except Exception as exc:
+            return {"ok": False, "error": f"Error discovering catalogs: {exc}"}
+        if not limit:
+            with self._lock:
+                self._discoveries[key] = (now, collections)
+        return {"ok": True, "collections": collections}
+
+    def _shutdown(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        # shutdown() waits for serve_forever() to return, so it cannot run on
+        # the handler thread that is still answering this request.
+        threading.Thread(target=self.shutdown, daemon=True).start()
+        return {"ok": True}
+
+
+def _remove_stale_socket(socket_path: Path) -> None:
+    if not socket_path.exists():
+        return
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            socket_path.unlink(missing_ok=True)
+            return
+
+    raise RuntimeError(f"A yax daemon is already listening on {socket_path}")
+
+
+def _display_path(path: Path, cwd: Path) -> str:
+    try:
+        return str(path.relative_to(cwd))
+    except ValueError:
+        return str(path)
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import hashlib
+from typing import List, NamedTuple, Optional, Sequence
+
+from yaxai.markdown import FenceTracker, heading_match
+from yaxai.tokens import DEFAULT_TOKENIZER, estimate_tokens
+
+
+class DedupeResult(NamedTuple):
+    content: str
+    blocks_removed: int
+    bytes_saved: int
+    tokens_saved: int
+    # Remaining text of each input fragment; None for fragments left empty.
+    fragments: List[Optional[str]]
+
+    def describe(self) -> str:
+        return (
+            f"removed {self.blocks_removed} duplicate block{'' if self.blocks_removed == 1 else 's'}, "
+            f"saved {self.bytes_saved} bytes (~{self.tokens_saved} tokens)"
+        )
+
+
+def split_blocks(text: str) -> List[str]:
+    """Split markdown into heading-delimited blocks.
+
+    Text before the first heading forms its own block. Headings inside fenced
+    code blocks do not start a new block. Joining the blocks gives back the
+    original text.
+    """
+
+    blocks: List[str] = []
+    current: List[str] = []
+    fences = FenceTracker()
+
+    for line in text.splitlines(keepends=True):
+        if not fences.feed(line) and heading_match(line) and current:
+            blocks.append("".join(current))
+            current = []
+        current.append(line)
+
+    if current:
+        blocks.append("".join(current))
+    return blocks
+
+
+def normalize_block(block: str) -> str:
+    """Collapse whitespace and blank lines so formatting differences do not hide duplicates."""
+
+    return "\n".join(" ".join(line.split()) for line in block.splitlines() if line.strip())
+
+
+def dedupe_fragments(
+    fragments: Sequence[str],
+    separator: str = "\n\n",
+    tokenizer: str = DEFAULT_TOKENIZER,
+) -> DedupeResult:
+    """Join fragments, emitting every heading-delimited block only once.
+
+    The first occurrence of a block keeps its position; later copies (equal
+    after normalization) are dropped, and fragments left empty are skipped.
+    Blocks holding nothing but a heading are always kept, since they group
+    the blocks below them.
+    """
+
+    seen: set[bytes] = set()
+    kept_fragments: List[Optional[str]] = []
+    blocks_removed = 0
+
+    for fragment in fragments:
+        kept: List[str] = []
+        for block in split_blocks(fragment):
+            normalized = normalize_block(block)
+            if normalized and not _is_heading_only(normalized):
+                digest = hashlib.sha256(normalized.encode("utf-8")).digest()
+                if digest in seen:
+                    blocks_removed += 1
+                    continue
+                seen.add(digest)
+            kept.append(block)
+
+        kept_fragments.append(join_blocks(fragment, kept))
+
+    original = separator.join(fragments)
+    content = separator.join(fragment for fragment in kept_fragments if fragment is not None)
+    return DedupeResult(
+        content=content,
+        blocks_removed=blocks_removed,
+        bytes_saved=len(original.encode("utf-8")) - len(content.encode("utf-8")),
+        tokens_saved=estimate_tokens(original, tokenizer) - estimate_tokens(content, tokenizer),
+        fragments=kept_fragments,
+    )
+
+
+def join_blocks(fragment: str, blocks: Sequence[str]) -> Optional[str]:
+    """Rebuild a fragment from the blocks kept out of it.
+
+    Returns None when nothing but whitespace is left. The fragment keeps its
+    original trailing newlines, so separators between fragments stay the same.
+    """
+
+    text = "".join(blocks)
+    if text == fragment:
+        return fragment
+    if not text.strip():
+        return None
+    trailing = fragment[len(fragment.rstrip("\n")):]
+    return text.rstrip("\n") + trailing
+
+
+def _is_heading_only(normalized: str) -> bool:
+    return "\n" not in normalized and heading_match(normalized) is not None
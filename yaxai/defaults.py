@@ -0,0 +1,5 @@
+"""Default file names shared by the CLI and the core without importing either."""
+
+DEFAULT_AGENTSMD_OUTPUT = "AGENTS.md"
+DEFAULT_AGENTSMD_CONFIG_FILENAME = "yax.yml"
+DEFAULT_CATALOG_OUTPUT = "yax-catalog.json"
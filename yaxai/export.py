@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import csv
+import json
+from html import escape
+from typing import TYPE_CHECKING, Dict, Optional, TextIO, Type
+
+if TYPE_CHECKING:  # pragma: no cover - imported for annotations only
+    from yaxai.yax import CatalogCollection
+
+
+class CatalogWriter:
+    """Render catalog rows to a text stream as they are read.
+
+    The export engine calls ``begin_organization`` before the collections of
+    each organization and ``end_organization`` after them, so writers never
+    have to hold more than the current row in memory.
+    """
+
+    extension = ".txt"
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+
+    def begin(self) -> None:
+        pass
+
+    def begin_organization(self, name: str) -> None:
+        pass
+
+    def collection(self, organization: str, collection: CatalogCollection) -> None:
+        pass
+
+    def end_organization(self, name: str, collections: int) -> None:
+        pass
+
+    def end(self, organizations: int) -> None:
+        pass
+
+
+class MarkdownCatalogWriter(CatalogWriter):
+    extension = ".md"
+
+    def begin(self) -> None:
+        self._stream.write("# Catalog")
+
+    def begin_organization(self, name: str) -> None:
+        self._stream.write(f"\n\n## {name or 'Unnamed organization'}\n")
+
+    def collection(self, organization: str, collection: CatalogCollection) -> None:
+        url = collection.url.strip()
+        display_name = collection.name
+
+        if display_name and url:
+            line = f"- [{display_name}]({url})"
+        elif url:
+            line = f"- {url}"
+        elif display_name:
+            line = f"- {display_name}"
+        else:
+            line = "- (missing url)"
+
+        self._stream.write(f"\n{line}")
+
+    def end_organization(self, name: str, collections: int) -> None:
+        if not collections:
+            self._stream.write("\n_No collections defined._")
+
+    def end(self, organizations: int) -> None:
+        if not organizations:
+            self._stream.write("\n\n_No organizations defined._")
+        self._stream.write("\n")
+
+
+def _collection_row(organization: str, collection: CatalogCollection) -> Dict[str, Optional[str]]:
+    try:
+        output_url: Optional[str] = collection.output_url()
+    except ValueError:
+        output_url = None
+
+    return {
+        "organization": organization,
+        "name": collection.name,
+        "url": collection.url,
+        "output": collection.output,
+        "output_url": output_url,
+    }
+
+
+class JsonLinesCatalogWriter(CatalogWriter):
+    extension = ".jsonl"
+
+    def collection(self, organization: str, collection: CatalogCollection) -> None:
+        row = _collection_row(organization, collection)
+        self._stream.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+class CsvCatalogWriter(CatalogWriter):
+    extension = ".csv"
+
+    _FIELDS = ["organization", "name", "url", "output", "output_url"]
+
+    def __init__(self, stream: TextIO) -> None:
+        super().__init__(stream)
+        self._writer = csv.DictWriter(stream, fieldnames=self._FIELDS, lineterminator="\n")
+
+    def begin(self) -> None:
+        self._writer.writeheader()
+
+    def collection(self, organization: str, collection: CatalogCollection) -> None:
+        self._writer.writerow(_collection_row(organization, collection))
+
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Catalog</title>
+<style>
+body { font-family: system-ui, sans-serif; max-width: 60rem; margin: 2rem auto; padding: 0 1rem; }
+input[type=search] { width: 100%; padding: .5rem; font-size: 1rem; }
+li small { color: #666; }
+[hidden] { display: none; }
+</style>
+</head>
+<body>
+<h1>Catalog</h1>
+<input type="search" id="catalog-search" placeholder="Search collections" autofocus>
+"""
+
+# The search index is built in the browser from the rendered rows, so the
+# exporter never has to keep the whole catalog in memory to embed it.
+_HTML_TAIL = """<script>
+(function () {
+  var items = Array.prototype.slice.call(document.querySelectorAll("li[data-search]"));
+  var index = {};
+  items.forEach(function (item, position) {
+    item.getAttribute("data-search").split(/[^a-z0-9]+/).forEach(function (token) {
+      if (token) { (index[token] = index[token] || []).push(position); }
+    });
+  });
+  var tokens = Object.keys(index);
+  function matches(term) {
+    var found = {};
+    tokens.forEach(function (token) {
+      if (token.lastIndexOf(term, 0) === 0) { index[token].forEach(function (p) { found[p] = true; }); }
+    });
+    return found;
+  }
+  document.getElementById("catalog-search").addEventListener("input", function (event) {
+    var terms = event.target.value.toLowerCase().split(/[^a-z0-9]+/).filter(Boolean);
+    var visible = null;
+    terms.forEach(function (term) {
+      var found = matches(term);
+      if (visible === null) { visible = found; return; }
+      Object.keys(visible).forEach(function (p) { if (!found[p]) { delete visible[p]; } });
+    });
+    items.forEach(function (item, position) { item.hidden = visible !== null && !visible[position]; });
+    document.querySelectorAll("section[data-organization]").forEach(function (section) {
+      section.hidden = !section.querySelector("li[data-search]:not([hidden])") && visible !== null;
+    });
+  });
+})();
+</script>
+</body>
+</html>
+"""
+
+
+class HtmlCatalogWriter(CatalogWriter):
+    extension = ".html"
+
+    def begin(self) -> None:
+        self._stream.write(_HTML_HEAD)
+
+    def begin_organization(self, name: str) -> None:
+        label = name or "Unnamed organization"
+        self._stream.write(
+            f'<section data-organization="{escape(name)}">\n<h2>{escape(label)}</h2>\n<ul>\n'
+        )
+
+    def collection(self, organization: str, collection: CatalogCollection) -> None:
+        row = _collection_row(organization, collection)
+        link = row["output_url"] or collection.url
+        label = collection.name or collection.url
+        search_text = " ".join(value for value in row.values() if value).lower()
+
+        self._stream.write(
+            f'<li data-search="{escape(search_text)}"><a href="{escape(link)}">{escape(label)}</a>'
+            f" <small>{escape(collection.url)}</small></li>\n"
+        )
+
+    def end_organization(self, name: str, collections: int) -> None:
+        if not collections:
+            self._stream.write("<li><em>No collections defined.</em></li>\n")
+        self._stream.write("</ul>\n</section>\n")
+
+    def end(self, organizations: int) -> None:
+        if not organizations:
+            self._stream.write("<p><em>No organizations defined.</em></p>\n")
+        self._stream.write(_HTML_TAIL)
+
+
+CATALOG_WRITERS: Dict[str, Type[CatalogWriter]] = {
+    "markdown": MarkdownCatalogWriter,
+    "jsonl": JsonLinesCatalogWriter,
+    "csv": CsvCatalogWriter,
+    "html": HtmlCatalogWriter,
+}
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+DEFAULT_THRESHOLD = 0.5
+
+
+def trigrams(text: str) -> Set[str]:
+    """Return the padded character trigrams of every word in text."""
+
+    grams: Set[str] = set()
+    for word in _WORD_PATTERN.findall(text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[index:index + 3] for index in range(len(padded) - 2))
+    return grams
+
+
+class FuzzyIndex:
+    """Trigram index for typo-tolerant filtering of short labels.
+
+    Entries containing the query as a substring rank first; other entries
+    match when they share at least ``threshold`` of the query trigrams.
+    """
+
+    def __init__(self, texts: Sequence[str], threshold: float = DEFAULT_THRESHOLD) -> None:
+        self._texts = [text.lower() for text in texts]
+        self._threshold = threshold
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        for position, text in enumerate(self._texts):
+            for gram in trigrams(text):
+                self._postings[gram].append(position)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def search(self, query: str, within: Optional[Iterable[int]] = None) -> List[int]:
+        """Return positions of matching entries, best matches first.
+
+        ``within`` may hold the results of a query that this one extends.
+        Only those entries can contain the longer query as a substring, so
+        substring matches are looked for among them; typo-tolerant matches
+        are not monotonic and always come from the whole index.
+        """
+
+        needle = query.strip().lower()
+        if not needle:
+            return list(range(len(self._texts)) if within is None else within)
+
+        candidates = range(len(self._texts)) if within is None else within
+        exact = {position for position in candidates if needle in self._texts[position]}
+
+        query_grams = trigrams(needle)
+        shared: Counter[int] = Counter()
+        for gram in query_grams:
+            for position in self._postings.get(gram, ()):
+                shared[position] += 1
+
+        ranked = []
+        for position in exact | set(shared):
+            score = shared[position] / len(query_grams) if query_grams else 0.0
+            if position in exact or score >= self._threshold:
+                ranked.append((position not in exact, -score, position))
+
+        ranked.sort()
+        return [position for _, _, position in ranked]
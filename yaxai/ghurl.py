@@ -3,13 +3,17 @@ from __future__ import annotations
 import base64
 import json
 import os
+import re
 import subprocess
 from dataclasses import dataclass
+from http.client import HTTPException
 from typing import Optional
 from urllib.error import HTTPError, URLError
 from urllib.parse import quote, urlparse, urlunparse
 from urllib.request import Request, urlopen
 
+from yaxai.mirrors import MirrorPool, mirror_pool
+
 
 class GitHubTokenFinder:
 
@@ -38,8 +42,74 @@ class GitHubTokenFinder:
             return None
     
 
+DEFAULT_GITHUB_API_URL = "https://api.github.com"
+DEFAULT_GITHUB_RAW_URL = "https://raw.githubusercontent.com"
+MIRROR_TIMEOUT = 5.0
+GITHUB_API_URL_ENV = "YAX_GITHUB_API_URL"
+
 _ALLOWED_SCHEMES = {"http", "https"}
 _VALID_HOSTS = {"github.com", "raw.githubusercontent.com"}
+_COMMIT_SHA_PATTERN = re.compile(r"[0-9a-fA-F]{40}")
+
+
+def github_api_url() -> str:
+    """Return the GitHub API base URL, honouring the YAX_GITHUB_API_URL override."""
+
+    return (os.getenv(GITHUB_API_URL_ENV) or DEFAULT_GITHUB_API_URL).rstrip("/")
+
+
+def is_commit_sha(ref: str) -> bool:
+    return _COMMIT_SHA_PATTERN.fullmatch(ref) is not None
+
+
+def resolve_commit_sha(
+    owner: str,
+    repository: str,
+    ref: str,
+    timeout: float = 10.0,
+    token: Optional[str] = None,
+) -> str:
+    """Return the commit SHA a branch, tag or SHA ref points at.
+
+    Uses the commits API with the ``sha`` media type, which answers with the
+    bare 40-character SHA. Full SHAs are returned without a request. The token
+    is looked up when ``token`` is None; pass an empty string to skip auth.
+    """
+
+    if is_commit_sha(ref):
+        return ref.lower()
+
+    headers = {"Accept": "application/vnd.github.sha"}
+    if token is None:
+        token = GitHubTokenFinder().find()
+    if token:
+        headers["Authorization"] = f"token {token}"
+    url = f"{github_api_url()}/repos/{owner}/{repository}/commits/{quote(ref, safe='')}"
+
+    try:
+        with urlopen(Request(url, headers=headers), timeout=timeout) as response:
+            sha = response.read().decode("utf-8").strip()
+    except (OSError, HTTPException, UnicodeDecodeError) as error:
+        # OSError covers HTTPError, URLError, timeouts and connection resets.
+        raise RuntimeError(f"Failed to resolve '{ref}' in {owner}/{repository}: {error}") from error
+
+    if not is_commit_sha(sha):
+        raise RuntimeError(f"Unexpected response when resolving '{ref}' in {owner}/{repository}")
+    return sha.lower()
+
+
+@dataclass(frozen=True)
+class ConditionalDownload:
+    """Result of a download revalidated with ETag/Last-Modified validators."""
+
+    # Text, or bytes for downloads requested with ``binary``; None when not modified.
+    content: Optional[str | bytes]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.content is None
 
 
 @dataclass(frozen=True)
@@ -93,7 +163,9 @@ class GitHubFile:
 
         return cls(normalized_url)
 
-    def raw(self) -> str:
+    def raw(self, base_url: str = DEFAULT_GITHUB_RAW_URL) -> str:
+        """Return the raw content URL, on the public host unless a mirror base is given."""
+
         parsed = urlparse(self.url)
 
         segments = [segment for segment in parsed.path.split("/") if segment]
@@ -101,17 +173,32 @@ class GitHubFile:
         owner, repository, _, ref, *file_segments = segments
         raw_path = "/" + "/".join([owner, repository, ref, *file_segments])
 
+        base = urlparse(base_url.rstrip("/"))
         return urlunparse(
             (
-                "https",
-                "raw.githubusercontent.com",
-                raw_path,
+                base.scheme,
+                base.netloc,
+                base.path + raw_path,
                 parsed.params,
                 parsed.query,
                 parsed.fragment,
             )
         )
 
+    def components(self) -> tuple[str, str, str, str]:
+        """Return owner, repository, ref and file path of the referenced file."""
+
+        owner, repository, ref, file_segments = self._extract_components()
+        return owner, repository, ref, "/".join(file_segments)
+
+    def at_ref(self, ref: str) -> GitHubFile:
+        """Return the same file at another ref (for example a resolved commit SHA)."""
+
+        owner, repository, _, file_segments = self._extract_components()
+        parsed = urlparse(self.url)
+        path = "/" + "/".join([owner, repository, "blob", ref, *file_segments])
+        return GitHubFile(urlunparse(parsed._replace(path=path)))
+
     def is_visible(self, timeout: float = 10.0) -> bool:
         raw_url = self.raw()
         request = Request(raw_url, method="HEAD")
@@ -126,12 +213,36 @@ class GitHubFile:
 
         return status not in {401, 403, 404}
 
-    def download(self) -> str:
+    def download(self, mirrors: Optional[MirrorPool] = None) -> str:
+        """Download the file, trying configured mirrors before the public hosts."""
+
+        text = self._download_from_mirrors(mirror_pool() if mirrors is None else mirrors)
+        if text is not None:
+            return text
+
         if self.is_visible():
             return self._download_raw()
 
         return self._download_via_api()
 
+    def _download_from_mirrors(self, mirrors: MirrorPool) -> Optional[str]:
+        for base_url in mirrors.candidates():
+            try:
+                with urlopen(Request(self.raw(base_url)), timeout=MIRROR_TIMEOUT) as response:
+                    text = response.read().decode("utf-8")
+            except HTTPError as error:
+                # A mirror without the file (or without access to it) is still healthy.
+                if error.code >= 500:
+                    mirrors.mark_failed(base_url)
+                continue
+            except (URLError, OSError, UnicodeDecodeError):
+                mirrors.mark_failed(base_url)
+                continue
+
+            mirrors.mark_ok(base_url)
+            return text
+        return None
+
     def _download_raw(self) -> str:
         request = Request(self.raw())
 
@@ -141,30 +252,117 @@ class GitHubFile:
         except (HTTPError, URLError) as error:
             raise RuntimeError(f"Failed to download '{self.url}': {error}") from error
 
+    def download_conditional(
+        self,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        binary: bool = False,
+    ) -> ConditionalDownload:
+        """Download the file unless it still matches the provided validators.
+
+        The conditional GET goes straight to the raw host; only when that
+        answers 404 (as it does for private repositories) is the API asked.
+        With ``binary`` the content is returned as bytes instead of text.
+        """
+
+        validators = {}
+        if etag:
+            validators["If-None-Match"] = etag
+        if last_modified:
+            validators["If-Modified-Since"] = last_modified
+
+        try:
+            return self._fetch_conditional(
+                Request(self.raw(), headers=validators), False, etag, last_modified, binary
+            )
+        except HTTPError as error:
+            if error.code != 404:
+                raise RuntimeError(f"Failed to download '{self.url}': {error}") from error
+
+        try:
+            return self._fetch_conditional(self._api_request(validators), True, etag, last_modified, binary)
+        except HTTPError as error:
+            raise RuntimeError(f"Failed to download '{self.url}': {error}") from error
+
+    def _fetch_conditional(
+        self,
+        request: Request,
+        via_api: bool,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        binary: bool = False,
+    ) -> ConditionalDownload:
+        try:
+            with urlopen(request) as response:
+                payload = response.read()
+                headers = response.headers
+        except HTTPError as error:
+            if error.code == 304:
+                return ConditionalDownload(content=None, etag=etag, last_modified=last_modified)
+            raise
+        except URLError as error:
+            raise RuntimeError(f"Failed to download '{self.url}': {error}") from error
+
+        if via_api:
+            data = self._decode_api_bytes(payload.decode("utf-8"))
+        else:
+            data = payload
+        try:
+            content = data if binary else data.decode("utf-8")
+        except UnicodeDecodeError as error:
+            raise RuntimeError(f"Failed to decode content for '{self.url}'") from error
+
+        return ConditionalDownload(
+            content=content,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+
     def _download_via_api(self) -> str:
+        request = self._api_request()
+
+        try:
+            with urlopen(request) as response:
+                payload = response.read().decode("utf-8")
+        except (HTTPError, URLError) as error:
+            raise RuntimeError(
+                f"Failed to download '{self.url}' via GitHub API: {error}"
+            ) from error
+
+        return self._decode_api_payload(payload)
+
+    def api_url(self) -> str:
+        """Return the GitHub contents API URL for the referenced file."""
+
         owner, repository, ref, file_segments = self._extract_components()
         encoded_path = "/".join(quote(segment, safe="") for segment in file_segments)
         encoded_ref = quote(ref, safe="")
-        api_url = (
-            f"https://api.github.com/repos/"
+        return (
+            f"{github_api_url()}/repos/"
             f"{owner}/{repository}/contents/{encoded_path}?ref={encoded_ref}"
         )
 
+    def _api_request(self, extra_headers: Optional[dict[str, str]] = None) -> Request:
+        api_url = self.api_url()
+
         headers = {"Accept": "application/vnd.github.v3+json"}
         token = GitHubTokenFinder().find()
         if token:
             headers["Authorization"] = f"token {token}"
+        if extra_headers:
+            headers.update(extra_headers)
 
-        request = Request(api_url, headers=headers)
+        return Request(api_url, headers=headers)
 
+    def _decode_api_payload(self, payload: str) -> str:
         try:
-            with urlopen(request) as response:
-                payload = response.read().decode("utf-8")
-        except (HTTPError, URLError) as error:
+            return self._decode_api_bytes(payload).decode("utf-8")
+        except UnicodeDecodeError as error:
             raise RuntimeError(
-                f"Failed to download '{self.url}' via GitHub API: {error}"
+                f"Failed to decode content for '{self.url}' from GitHub API response"
             ) from error
 
+    def _decode_api_bytes(self, payload: str) -> bytes:
         try:
             descriptor = json.loads(payload)
         except json.JSONDecodeError as error:
@@ -180,8 +378,8 @@ class GitHubFile:
         content = descriptor["content"].replace("\n", "")
 
         try:
-            return base64.b64decode(content).decode("utf-8")
-        except (ValueError, UnicodeDecodeError) as error:
+            return base64.b64decode(content)
+        except ValueError as error:
             raise RuntimeError(
                 f"Failed to decode content for '{self.url}' from GitHub API response"
             ) from error
@@ -0,0 +1,215 @@
+"""Git-backed sources read from local bare mirrors.
+
+``git+<repo>@<ref>:<path>`` sources are served from a mirror of the
+repository under ``~/.yax/mirrors``. Each mirror is fetched once per build
+(at most once per ``fetch_interval`` in a long-running process) and files
+are read through a single ``git cat-file --batch`` process per repository.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Dict, Optional
+from urllib.parse import urlparse
+
+
+DEFAULT_MIRROR_DIR = Path.home() / ".yax" / "mirrors"
+MIRROR_DIR_ENV = "YAX_MIRROR_DIR"
+DEFAULT_FETCH_INTERVAL = 60.0
+
+GIT_SOURCE_PREFIX = "git+"
+_GIT_SCHEMES = {"http", "https", "ssh", "file"}
+# The repository URL is matched greedily, so an ``@`` in ssh user info or in
+# the file path does not end it early.
+_GIT_SOURCE_PATTERN = re.compile(r"^git\+(?P<repo>.+)@(?P<ref>[^@:\s]+):(?P<path>.+)$")
+
+
+def is_git_source(location: str) -> bool:
+    return location.strip().startswith(GIT_SOURCE_PREFIX)
+
+
+def default_mirror_dir() -> Path:
+    """Return the mirror directory, honouring the YAX_MIRROR_DIR override."""
+
+    override = os.getenv(MIRROR_DIR_ENV)
+    return Path(override).expanduser() if override else DEFAULT_MIRROR_DIR
+
+
+@dataclass(frozen=True)
+class GitSource:
+    repo: str
+    ref: str
+    path: str
+
+    @classmethod
+    def parse(cls, value: str) -> GitSource:
+        match = _GIT_SOURCE_PATTERN.match(value.strip())
+        if match is None:
+            raise ValueError(f"Git source '{value}' must look like git+<repository>@<ref>:<path>")
+
+        repo, ref, path = match.group("repo"), match.group("ref"), match.group("path").strip("/")
+        if urlparse(repo).scheme.lower() not in _GIT_SCHEMES:
+            raise ValueError(f"Git source '{value}' must use one of: {', '.join(sorted(_GIT_SCHEMES))}")
+        if not path:
+            raise ValueError(f"Git source '{value}' does not specify a file path")
+        return cls(repo, ref, path)
+
+
+class GitMirror:
+    """A bare mirror of one repository and the ``cat-file`` process reading it."""
+
+    def __init__(self, repo: str, path: Path, fetch_interval: float = DEFAULT_FETCH_INTERVAL) -> None:
+        self.repo = repo
+        self.path = path
+        self.fetch_interval = fetch_interval
+        self.fetches = 0
+        self._fetched_at: Optional[float] = None
+        self._process: Optional[subprocess.Popen[bytes]] = None
+        self._lock = threading.Lock()
+
+    def read(self, ref: str, path: str) -> str:
+        """Return the text of path at ref, updating the mirror first when it is stale."""
+
+        with self._lock:
+            self._update()
+            stdin, stdout = self._batch_streams()
+            stdin.write(f"{ref}:{path}\n".encode("utf-8"))
+            stdin.flush()
+
+            # "<sha> <type> <size>", or "<ref>:<path> missing" for unknown objects.
+            header = stdout.readline().decode("utf-8").rstrip("\n").split(" ")
+            if len(header) != 3 or not header[2].isdigit():
+                raise RuntimeError(f"'{path}' not found at '{ref}' in {self.repo}")
+
+            _, object_type, size = header
+            content = stdout.read(int(size) + 1)[:-1]
+
+        if object_type != "blob":
+            raise RuntimeError(f"'{path}' at '{ref}' in {self.repo} is a {object_type}, not a file")
+        return content.decode("utf-8")
+
+    def close(self) -> None:
+        with self._lock:
+            self._stop_batch()
+
+    def _update(self) -> None:
+        now = time.monotonic()
+        if self._fetched_at is not None and now - self._fetched_at < self.fetch_interval:
+            return
+
+        if (self.path / "HEAD").exists():
+            _run_git(["--git-dir", str(self.path), "fetch", "--prune", "--quiet", "origin"], self.repo)
+        else:
+            self._clone()
+        self.fetches += 1
+        self._fetched_at = now
+        # A running cat-file may not see refs updated by the fetch.
+        self._stop_batch()
+
+    def _clone(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{self.path.name}-", dir=self.path.parent))
+        try:
+            _run_git(["clone", "--mirror", "--quiet", self.repo, str(staging)], self.repo)
+            try:
+                staging.rename(self.path)
+            except OSError:
+                # Another process finished its clone first; use that one.
+                if not (self.path / "HEAD").exists():
+                    raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _batch_streams(self) -> tuple[IO[bytes], IO[bytes]]:
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                ["git", "--git-dir", str(self.path), "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        assert self._process.stdin is not None and self._process.stdout is not None
+        return self._process.stdin, self._process.stdout
+
+    def _stop_batch(self) -> None:
+        if self._process is None:
+            return
+        process, self._process = self._process, None
+        if process.stdin is not None:
+            process.stdin.close()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:  # pragma: no cover - defensive cleanup
+            process.kill()
+        if process.stdout is not None:
+            process.stdout.close()
+
+
+class GitMirrorStore:
+    """Mirrors below one directory, one per repository URL."""
+
+    def __init__(self, root: Optional[Path] = None, fetch_interval: float = DEFAULT_FETCH_INTERVAL) -> None:
+        self.root = Path(root) if root is not None else default_mirror_dir()
+        self.fetch_interval = fetch_interval
+        self._mirrors: Dict[str, GitMirror] = {}
+        self._lock = threading.Lock()
+
+    def mirror(self, repo: str) -> GitMirror:
+        with self._lock:
+            mirror = self._mirrors.get(repo)
+            if mirror is None:
+                mirror = self._mirrors[repo] = GitMirror(repo, self.root / _mirror_name(repo), self.fetch_interval)
+            return mirror
+
+    def read(self, key: str) -> str:
+        source = GitSource.parse(key)
+        return self.mirror(source.repo).read(source.ref, source.path)
+
+    def close(self) -> None:
+        with self._lock:
+            mirrors = list(self._mirrors.values())
+        for mirror in mirrors:
+            mirror.close()
+
+
+_default_store: Optional[GitMirrorStore] = None
+_default_store_lock = threading.Lock()
+
+
+def read_git_source(key: str) -> str:
+    """Read a ``git+`` source through the process-wide mirror store."""
+
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = GitMirrorStore()
+            atexit.register(_default_store.close)
+        store = _default_store
+    return store.read(key)
+
+
+def _mirror_name(repo: str) -> str:
+    name = re.sub(r"[^A-Za-z0-9._-]+", "-", urlparse(repo).path.rstrip("/").rsplit("/", 1)[-1]).strip("-.")
+    if name.endswith(".git"):
+        name = name[: -len(".git")]
+    digest = hashlib.sha256(repo.encode("utf-8")).hexdigest()[:12]
+    return f"{name or 'repo'}-{digest}.git"
+
+
+def _run_git(args: list[str], repo: str) -> None:
+    try:
+        subprocess.run(["git", *args], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    except FileNotFoundError as exc:
+        raise RuntimeError("git is required for git+ sources but was not found on PATH") from exc
+    except subprocess.CalledProcessError as exc:
+        raise RuntimeError(f"Failed to update git mirror of {repo}: {exc.stderr.strip()}") from exc
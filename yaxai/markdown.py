@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import re
+from typing import Optional
+
+
+# ATX heading: group 1 holds the hashes, group 2 the title without closing hashes.
+HEADING_PATTERN = re.compile(r"^ {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$")
+_FENCE_PATTERN = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+
+
+def heading_match(line: str) -> Optional[re.Match[str]]:
+    """Match line against the ATX heading syntax, ignoring its line ending."""
+
+    return HEADING_PATTERN.match(line.rstrip("\r\n"))
+
+
+def fence_marker(line: str) -> Optional[str]:
+    """Return the backtick or tilde marker when line could open a fenced code block."""
+
+    match = _FENCE_PATTERN.match(line)
+    return match.group(1) if match else None
+
+
+class FenceTracker:
+    """Follow fenced code blocks while markdown is read line by line.
+
+    A block opens on a line starting with three or more backticks or tildes
+    and closes on a line holding only a marker of the same character that is
+    at least as long, as in CommonMark. The build stages share this, so they
+    agree on what is code.
+    """
+
+    __slots__ = ("fence",)
+
+    def __init__(self) -> None:
+        self.fence = ""
+
+    def feed(self, line: str) -> bool:
+        """Advance past line; return True when it is code or a fence line."""
+
+        if self.fence:
+            match = _FENCE_PATTERN.match(line)
+            if match and not line[match.end():].strip():
+                marker = match.group(1)
+                if marker[0] == self.fence[0] and len(marker) >= len(self.fence):
+                    self.fence = ""
+            return True
+
+        marker = fence_marker(line)
+        if marker is None:
+            return False
+        self.fence = marker
+        return True
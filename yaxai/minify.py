@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+from yaxai.markdown import FenceTracker, fence_marker, heading_match
+
+
+_INLINE_CODE_PATTERN = re.compile(r"(`+).+?\1")
+_COMMENT_PATTERN = re.compile(r"<!--.*?-->")
+_COMMENT_BLOCK_START_PATTERN = re.compile(r"^ {0,3}<!--")
+_BADGE_URL = r"[^)]*(?:shields\.io|badge)[^)]*"
+_LINKED_BADGE_PATTERN = re.compile(rf"\[!\[[^\]]*\]\({_BADGE_URL}\)\]\([^)]*\)", re.IGNORECASE)
+_BADGE_PATTERN = re.compile(rf"!\[[^\]]*\]\({_BADGE_URL}\)", re.IGNORECASE)
+_REFERENCE_DEFINITION_PATTERN = re.compile(
+    r"^ {0,3}\[([^\]]+)\]:\s*(\S+)(?:\s+(?:\"[^\"]*\"|'[^']*'|\([^)]*\)))?\s*$"
+)
+# Full ``[text][label]``, collapsed ``[text][]`` and shortcut ``[label]`` references.
+_REFERENCE_LINK_PATTERN = re.compile(r"\[([^\]]+)\](?:\[([^\]]*)\])?(?![(:\[])")
+
+
+class MinifyResult(NamedTuple):
+    fragments: List[str]
+    bytes_before: int
+    bytes_after: int
+
+    def describe(self) -> str:
+        saved = self.bytes_before - self.bytes_after
+        percent = (100 * saved / self.bytes_before) if self.bytes_before else 0.0
+        return f"{self.bytes_before} -> {self.bytes_after} bytes (-{percent:.0f}%)"
+
+
+def collect_references(lines: Iterable[str]) -> Dict[str, str]:
+    """Return link reference definitions outside fenced code, by normalized label."""
+
+    references: Dict[str, str] = {}
+    fences = FenceTracker()
+    for line in lines:
+        if fences.feed(line):
+            continue
+        definition = _REFERENCE_DEFINITION_PATTERN.match(line)
+        if definition:
+            references.setdefault(_reference_label(definition.group(1)), definition.group(2))
+    return references
+
+
+def iter_minified_lines(lines: Iterable[str], references: Optional[Dict[str, str]] = None) -> Iterator[str]:
+    """Strip agent-irrelevant markdown from lines in a single pass.
+
+    Removes HTML comments, badges, trailing whitespace and repeated blank
+    lines. Two trailing spaces are kept where they break a line inside a
+    paragraph. Links using one of ``references`` get the URL inlined, so the
+    definitions can be dropped. Fenced code blocks are passed through byte
+    for byte and lines indented like code are left as they are. A comment
+    spanning several lines is only removed when it starts a line and is
+    closed before the next fence; otherwise its lines are kept unchanged.
+    """
+
+    references = references or {}
+    fences = FenceTracker()
+    comment: List[str] = []
+    blank_pending = False
+    started = False
+    # A line ending in a hard break, held until it is known whether the
+    # paragraph continues after it.
+    held: Optional[str] = None
+
+    for line in lines:
+        emitted: List[str] = []
+        hard_break = False
+        if fences.fence:
+            fences.feed(line)
+            yield line
+            continue
+
+        if comment:
+            if fence_marker(line) is None:
+                comment.append(line)
+                end = line.find("-->")
+                if end < 0:
+                    continue
+                comment = []
+                line = line[end + 3:]
+                if not line.strip():
+                    continue
+            else:
+                # An unclosed comment must not swallow code; keep what was buffered.
+                emitted.extend(comment)
+                comment = []
+
+        if fences.feed(line):
+            emitted.append(line)
+        elif line.startswith(("    ", "\t")) and line.strip():
+            emitted.append(line)
+        elif not line.strip():
+            blank_pending = started
+            continue
+        else:
+            inline = _strip_inline(line, references).rstrip("\r\n")
+            stripped = inline.rstrip()
+            if _COMMENT_BLOCK_START_PATTERN.match(line) and stripped.lstrip().startswith("<!--"):
+                comment = [line]
+            # Lines holding only removed content disappear without leaving
+            # a blank line that would split the surrounding paragraph.
+            elif stripped and not _is_known_definition(stripped, references):
+                hard_break = inline.endswith("  ") and heading_match(stripped) is None
+                emitted.append(stripped + "\n")
+
+        for index, output in enumerate(emitted):
+            if held is not None:
+                yield held + ("\n" if blank_pending else "  \n")
+                held = None
+            if blank_pending:
+                yield "\n"
+                blank_pending = False
+            started = True
+            if hard_break and index == len(emitted) - 1:
+                held = output[:-1]
+            else:
+                yield output
+
+    if held is not None:
+        yield held + ("  \n" if comment and not blank_pending else "\n")
+    if comment:
+        if blank_pending:
+            yield "\n"
+        yield from comment
+
+
+def minify_markdown(text: str) -> str:
+    """Return minified markdown, keeping a final newline only if text had one."""
+
+    lines = text.splitlines(keepends=True)
+    # References may be defined after their use, so definitions are collected
+    # in a separate pass; text without any definition needs only one.
+    references = collect_references(lines) if "]:" in text else {}
+    minified = "".join(iter_minified_lines(lines, references))
+    if not text.endswith("\n") and minified.endswith("\n"):
+        minified = minified[:-1]
+    return minified
+
+
+def minify_fragments(fragments: Sequence[str]) -> MinifyResult:
+    minified = [minify_markdown(fragment) for fragment in fragments]
+    return MinifyResult(
+        fragments=minified,
+        bytes_before=sum(len(fragment.encode("utf-8")) for fragment in fragments),
+        bytes_after=sum(len(fragment.encode("utf-8")) for fragment in minified),
+    )
+
+
+def _reference_label(label: str) -> str:
+    return " ".join(label.lower().split())
+
+
+def _is_known_definition(line: str, references: Dict[str, str]) -> bool:
+    definition = _REFERENCE_DEFINITION_PATTERN.match(line)
+    return definition is not None and _reference_label(definition.group(1)) in references
+
+
+def _strip_inline(line: str, references: Dict[str, str]) -> str:
+    """Strip comments and badges and inline reference links outside code spans."""
+
+    parts: List[str] = []
+    position = 0
+    for code in _INLINE_CODE_PATTERN.finditer(line):
+        parts.append(_strip_text(line[position:code.start()], references))
+        parts.append(code.group())
+        position = code.end()
+
+    parts.append(_strip_text(line[position:], references))
+    return "".join(parts)
+
+
+def _strip_text(text: str, references: Dict[str, str]) -> str:
+    if "<" not in text and "[" not in text:
+        return text
+
+    text = _COMMENT_PATTERN.sub("", text)
+    text = _LINKED_BADGE_PATTERN.sub("", text)
+    text = _BADGE_PATTERN.sub("", text)
+    if references:
+        text = _REFERENCE_LINK_PATTERN.sub(lambda match: _inline_reference(match, references), text)
+    return text
+
+
+def _inline_reference(match: re.Match[str], references: Dict[str, str]) -> str:
+    label = match.group(2) or match.group(1)
+    url = references.get(_reference_label(label))
+    return match.group() if url is None else f"[{match.group(1)}]({url})"
@@ -0,0 +1,110 @@
+"""Mirror endpoints for raw GitHub content.
+
+Mirrors serve files with the raw.githubusercontent.com layout
+(``<base>/<owner>/<repo>/<ref>/<path>``) and are tried in configured order
+before the public host. They come from the YAX_GITHUB_MIRRORS environment
+variable (comma or whitespace separated) followed by ``github.mirrors`` in
+the user config. Only downloads use them; URLs written to configs and
+catalogs keep pointing at github.com.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+from urllib.parse import urlparse
+
+import yaml
+
+from yaxai.configio import load_yaml_file
+
+
+MIRRORS_ENV = "YAX_GITHUB_MIRRORS"
+USER_CONFIG_PATH = Path.home() / ".yax" / "config.yml"
+DEFAULT_COOLDOWN = 30.0
+
+
+def configured_mirrors(config_path: Optional[Path] = None) -> List[str]:
+    """Return mirror base URLs from the environment and the user config, in order."""
+
+    urls = re.split(r"[\s,]+", os.getenv(MIRRORS_ENV, "").strip())
+    config_path = config_path or USER_CONFIG_PATH
+    if config_path.exists():
+        try:
+            data = load_yaml_file(config_path) or {}
+        except yaml.YAMLError as exc:
+            raise ValueError(f"Invalid YAML in '{config_path}': {exc}") from exc
+
+        github_section = data.get("github") if isinstance(data, dict) else None
+        mirrors = github_section.get("mirrors") if isinstance(github_section, dict) else None
+        if mirrors is not None:
+            if not isinstance(mirrors, list) or not all(isinstance(entry, str) for entry in mirrors):
+                raise ValueError(f"Expected 'github.mirrors' in '{config_path}' to be a list of strings")
+            urls.extend(mirrors)
+
+    ordered: List[str] = []
+    for url in urls:
+        url = url.strip().rstrip("/")
+        if not url:
+            continue
+        if urlparse(url).scheme not in {"http", "https"}:
+            raise ValueError(f"GitHub mirror '{url}' must start with http:// or https://")
+        if url not in ordered:
+            ordered.append(url)
+    return ordered
+
+
+class MirrorPool:
+    """Health-tracked mirror endpoints.
+
+    A mirror that fails with a network or server error is skipped for
+    ``cooldown`` seconds, so later downloads do not wait on it. Mirrors that
+    are merely missing a file stay healthy.
+    """
+
+    def __init__(self, urls: Sequence[str], cooldown: float = DEFAULT_COOLDOWN) -> None:
+        self.urls = list(urls)
+        self._cooldown = cooldown
+        self._unhealthy_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self.urls)
+
+    def candidates(self) -> List[str]:
+        """Return the mirrors to try, in configured order, leaving out those cooling down."""
+
+        now = time.monotonic()
+        with self._lock:
+            return [url for url in self.urls if self._unhealthy_until.get(url, 0.0) <= now]
+
+    def mark_failed(self, url: str) -> None:
+        with self._lock:
+            self._unhealthy_until[url] = time.monotonic() + self._cooldown
+
+    def mark_ok(self, url: str) -> None:
+        with self._lock:
+            self._unhealthy_until.pop(url, None)
+
+
+_pool: Optional[MirrorPool] = None
+_pool_lock = threading.Lock()
+
+
+def mirror_pool() -> MirrorPool:
+    """Return the process-wide pool of configured mirrors.
+
+    The environment and user config are read on first use only, so
+    downloads do not re-read them and health information carries over
+    between builds of a long-running process.
+    """
+
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = MirrorPool(configured_mirrors())
+        return _pool
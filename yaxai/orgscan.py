@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.error import HTTPError, URLError
+from urllib.parse import quote
+from urllib.request import Request, urlopen
+
+from yaxai.ghurl import GitHubTokenFinder, github_api_url
+
+
+_CONFIG_FILENAME = "yax.yml"
+_CONFIG_SUFFIX = "-yax.yml"
+_NEXT_LINK = re.compile(r'<([^>]+)>;\s*rel="next"')
+
+
+def is_config_path(path: str) -> bool:
+    name = path.rsplit("/", 1)[-1]
+    return name == _CONFIG_FILENAME or (name.endswith(_CONFIG_SUFFIX) and len(name) > len(_CONFIG_SUFFIX))
+
+
+class OrganizationScanner:
+    """Find yax configs in every repository of a GitHub organization.
+
+    Repository trees are listed concurrently at the head of each default
+    branch. Results are remembered per repository together with the head
+    commit SHA in a state file, so repositories that did not change since
+    the previous scan are not listed again.
+    """
+
+    def __init__(
+        self,
+        organization: str,
+        state_path: Optional[Path | str] = None,
+        api_url: Optional[str] = None,
+        token: Optional[str] = None,
+        max_workers: int = 8,
+    ) -> None:
+        self._organization = organization.strip()
+        if not self._organization:
+            raise ValueError("Organization to scan must be a non-empty string")
+
+        self._state_path = Path(state_path) if state_path is not None else None
+        self._api_url = (api_url or github_api_url()).rstrip("/")
+        self._token = token if token is not None else GitHubTokenFinder().find()
+        self._max_workers = max_workers
+
+    def scan(self) -> List[str]:
+        """Return GitHub URLs of all yax configs found in the organization."""
+
+        repositories = self._list_repositories()
+        previous = self._load_state()
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            results = list(
+                executor.map(lambda repository: self._scan_repository(repository, previous), repositories)
+            )
+
+        state: Dict[str, Dict[str, Any]] = {}
+        sources: List[str] = []
+        for result in results:
+            if result is None:
+                continue
+            full_name, sha, repository_sources = result
+            state[full_name] = {"sha": sha, "sources": repository_sources}
+            sources.extend(repository_sources)
+
+        self._save_state(state)
+
+        return sources
+
+    def _list_repositories(self) -> List[Dict[str, Any]]:
+        repositories: List[Dict[str, Any]] = []
+        url: Optional[str] = (
+            f"{self._api_url}/orgs/{quote(self._organization, safe='')}/repos?per_page=100&type=all"
+        )
+
+        while url:
+            page, headers = self._get_json(url)
+            if not isinstance(page, list):
+                raise RuntimeError(f"Unexpected repository listing for organization '{self._organization}'")
+            repositories.extend(repo for repo in page if isinstance(repo, dict) and not repo.get("archived"))
+
+            match = _NEXT_LINK.search(headers.get("Link") or "")
+            url = match.group(1) if match else None
+
+        return repositories
+
+    def _scan_repository(
+        self,
+        repository: Dict[str, Any],
+        previous: Dict[str, Dict[str, Any]],
+    ) -> Optional[Tuple[str, str, List[str]]]:
+        full_name = repository.get("full_name")
+        branch = repository.get("default_branch")
+        if not isinstance(full_name, str) or not isinstance(branch, str):
+            return None
+
+        repo_path = "/".join(quote(part, safe="") for part in full_name.split("/", 1))
+        try:
+            branch_info, _ = self._get_json(
+                f"{self._api_url}/repos/{repo_path}/branches/{quote(branch, safe='')}"
+            )
+        except FileNotFoundError:
+            # Empty repositories have no default branch yet.
+            return None
+
+        sha = branch_info.get("commit", {}).get("sha")
+        if not isinstance(sha, str):
+            return None
+
+        cached = previous.get(full_name)
+        if cached and cached.get("sha") == sha and isinstance(cached.get("sources"), list):
+            return full_name, sha, cached["sources"]
+
+        tree, _ = self._get_json(f"{self._api_url}/repos/{repo_path}/git/trees/{sha}?recursive=1")
+        sources = [
+            f"https://github.com/{full_name}/blob/{branch}/{entry['path']}"
+            for entry in tree.get("tree", [])
+            if entry.get("type") == "blob" and isinstance(entry.get("path"), str) and is_config_path(entry["path"])
+        ]
+
+        return full_name, sha, sorted(sources)
+
+    def _get_json(self, url: str) -> Tuple[Any, Any]:
+        headers = {"Accept": "application/vnd.github+json"}
+        if self._token:
+            headers["Authorization"] = f"token {self._token}"
+
+        try:
+            with urlopen(Request(url, headers=headers)) as response:
+                return json.loads(response.read().decode("utf-8")), response.headers
+        except HTTPError as error:
+            if error.code in {404, 409}:
+                raise FileNotFoundError(f"GitHub API resource not found: {url}") from error
+            raise RuntimeError(f"GitHub API request to '{url}' failed: {error}") from error
+        except URLError as error:
+            raise RuntimeError(f"GitHub API request to '{url}' failed: {error}") from error
+        except json.JSONDecodeError as error:
+            raise RuntimeError(f"Unexpected response from GitHub API at '{url}'") from error
+
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        if self._state_path is None or not self._state_path.exists():
+            return {}
+
+        try:
+            data = json.loads(self._state_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+        if not isinstance(data, dict) or data.get("organization") != self._organization:
+            return {}
+
+        repositories = data.get("repositories")
+        return repositories if isinstance(repositories, dict) else {}
+
+    def _save_state(self, repositories: Dict[str, Dict[str, Any]]) -> None:
+        if self._state_path is None:
+            return
+
+        self._state_path.parent.mkdir(parents=True, exist_ok=True)
+        self._state_path.write_text(
+            json.dumps(
+                {"organization": self._organization, "repositories": repositories},
+                indent=2,
+                sort_keys=True,
+            ),
+            encoding="utf-8",
+        )
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import math
+import os
+import re
+import sqlite3
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+SEARCH_INDEX_SUFFIX = ".search.sqlite"
+
+_FORMAT_VERSION = "2"
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE documents (
+    id INTEGER PRIMARY KEY,
+    organization TEXT NOT NULL,
+    url TEXT NOT NULL,
+    name TEXT,
+    text TEXT NOT NULL,
+    length INTEGER NOT NULL
+);
+CREATE TABLE postings (
+    term TEXT NOT NULL,
+    document INTEGER NOT NULL,
+    frequency INTEGER NOT NULL,
+    PRIMARY KEY (term, document)
+) WITHOUT ROWID;
+"""
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from how in is it of on or that the this to was what when with".split()
+)
+_SNIPPET_LENGTH = 160
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric search terms without stopwords."""
+
+    return [token for token in _TOKEN_PATTERN.findall(text.lower()) if token not in _STOPWORDS]
+
+
+class SearchDocument(NamedTuple):
+    organization: str
+    url: str
+    name: Optional[str]
+    text: str
+
+
+@dataclass
+class SearchHit:
+    document: SearchDocument
+    score: float
+    snippet: str
+
+
+class SearchIndex:
+    """Inverted index over collection contents ranked with BM25.
+
+    The index is a SQLite database of postings and document lengths. A search
+    reads only the postings of its query terms and the texts of the returned
+    hits, so opening a saved index does not load the whole corpus.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+        meta = dict(connection.execute("SELECT key, value FROM meta").fetchall())
+        self._document_count = int(meta.get("documents", 0))
+        self._average_length = float(meta.get("average_length", 0.0))
+
+    @staticmethod
+    def path_for(catalog_path: Path | str) -> Path:
+        """Return the location of the search index belonging to a catalog JSON file."""
+
+        return Path(catalog_path).with_suffix(SEARCH_INDEX_SUFFIX)
+
+    @classmethod
+    def build(cls, documents: Iterable[SearchDocument]) -> "SearchIndex":
+        connection = sqlite3.connect(":memory:")
+        connection.executescript(_SCHEMA)
+
+        postings: List[Tuple[str, int, int]] = []
+        total_length = 0
+        document_count = 0
+        for doc_id, document in enumerate(documents):
+            tokens = tokenize(f"{document.name or ''}\n{document.text}")
+            connection.execute(
+                "INSERT INTO documents (id, organization, url, name, text, length) VALUES (?, ?, ?, ?, ?, ?)",
+                (doc_id, *document, len(tokens)),
+            )
+            postings.extend((term, doc_id, frequency) for term, frequency in Counter(tokens).items())
+            total_length += len(tokens)
+            document_count += 1
+
+        connection.executemany("INSERT INTO postings (term, document, frequency) VALUES (?, ?, ?)", postings)
+        connection.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?)",
+            [
+                ("version", _FORMAT_VERSION),
+                ("documents", str(document_count)),
+                ("average_length", str(total_length / document_count if document_count else 0.0)),
+            ],
+        )
+        connection.commit()
+        return cls(connection)
+
+    @classmethod
+    def load(cls, path: Path | str) -> "SearchIndex":
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"Search index not found: {path}")
+
+        connection = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            version = connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            if version is None or version[0] != _FORMAT_VERSION:
+                raise ValueError(f"Unsupported search index format in '{path}'")
+            return cls(connection)
+        except sqlite3.Error as exc:
+            connection.close()
+            raise ValueError(f"Invalid search index in '{path}': {exc}") from exc
+        except ValueError:
+            connection.close()
+            raise
+
+    def save(self, path: Path | str) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temp_path.unlink(missing_ok=True)
+        try:
+            target = sqlite3.connect(temp_path)
+            try:
+                self._connection.backup(target)
+            finally:
+                target.close()
+            os.replace(temp_path, path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def search(self, query: str, limit: int = 10) -> List[SearchHit]:
+        """Return documents ranked by BM25 relevance for the provided query."""
+
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self._document_count:
+            return []
+
+        scores: Dict[int, float] = {}
+
+        for term in terms:
+            postings = self._connection.execute(
+                "SELECT postings.document, postings.frequency, documents.length FROM postings "
+                "JOIN documents ON documents.id = postings.document WHERE postings.term = ?",
+                (term,),
+            ).fetchall()
+            if not postings:
+                continue
+
+            idf = math.log(1 + (self._document_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency, length in postings:
+                length_ratio = length / self._average_length if self._average_length else 0.0
+                denominator = frequency + BM25_K1 * (1 - BM25_B + BM25_B * length_ratio)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (BM25_K1 + 1) / denominator
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+        hits: List[SearchHit] = []
+        for doc_id, score in ranked:
+            row = self._connection.execute(
+                "SELECT organization, url, name, text FROM documents WHERE id = ?", (doc_id,)
+            ).fetchone()
+            document = SearchDocument(*row)
+            hits.append(SearchHit(document=document, score=score, snippet=_snippet(document.text, terms)))
+        return hits
+
+
+def _snippet(text: str, terms: List[str]) -> str:
+    """Return a short excerpt of text around the first occurrence of a query term."""
+
+    collapsed = " ".join(text.split())
+    lowered = collapsed.lower()
+
+    positions = [
+        match.start()
+        for term in terms
+        for match in [re.search(rf"\b{re.escape(term)}", lowered)]
+        if match is not None
+    ]
+    start = min(positions) if positions else 0
+    start = max(0, start - _SNIPPET_LENGTH // 4)
+
+    excerpt = collapsed[start:start + _SNIPPET_LENGTH]
+    if start > 0:
+        excerpt = "…" + excerpt
+    if start + _SNIPPET_LENGTH < len(collapsed):
+        excerpt = excerpt + "…"
+
+    return excerpt
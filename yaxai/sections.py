@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Iterable, List, NamedTuple, Sequence, Tuple
+
+from yaxai.markdown import FenceTracker, heading_match
+
+
+_ANCHOR_STRIP_PATTERN = re.compile(r"[^\w\- ]")
+
+# Only fragments with this prefix select sections; other fragments such as
+# ``#L10`` or ``#readme`` stay part of the location.
+SELECTOR_PREFIX = "#yax:"
+SELECTOR_SEPARATOR = ","
+DEFAULT_CACHE_SIZE = 128
+
+
+class Section(NamedTuple):
+    level: int
+    title: str
+    anchor: str
+    start: int
+    end: int
+
+
+def heading_anchor(title: str) -> str:
+    """Return the anchor GitHub generates for a heading title (without duplicate suffixes)."""
+
+    return _ANCHOR_STRIP_PATTERN.sub("", title.strip().lower()).replace(" ", "-")
+
+
+def split_section_selector(key: str) -> Tuple[str, List[str]]:
+    """Split ``location#yax:a,b`` into the location and its section selectors."""
+
+    location, separator, selector = key.partition(SELECTOR_PREFIX)
+    if not separator:
+        return key, []
+    return location, [name.strip() for name in selector.split(SELECTOR_SEPARATOR) if name.strip()]
+
+
+def with_section_selector(location: str, sections: Sequence[str]) -> str:
+    """Append section selectors to a location, replacing any it already has."""
+
+    location = location.partition(SELECTOR_PREFIX)[0]
+    names = [name.strip() for name in sections if name.strip()]
+    return f"{location}{SELECTOR_PREFIX}{SELECTOR_SEPARATOR.join(names)}" if names else location
+
+
+def scan_sections(lines: Iterable[str]) -> List[Section]:
+    """Scan markdown lines once and return every ATX heading with its subtree offsets.
+
+    A section ends where the next heading of the same or a higher level
+    starts. Headings inside fenced code blocks are ignored. Repeated anchors
+    get ``-1``, ``-2``... suffixes like on GitHub.
+    """
+
+    found: List[Tuple[int, str, str, int]] = []
+    seen: dict[str, int] = {}
+    fences = FenceTracker()
+    offset = 0
+
+    for line in lines:
+        start = offset
+        offset += len(line)
+
+        if fences.feed(line):
+            continue
+
+        heading = heading_match(line)
+        if heading is None:
+            continue
+        title = (heading.group(2) or "").strip()
+        anchor = heading_anchor(title)
+        count = seen.get(anchor, 0)
+        seen[anchor] = count + 1
+        found.append((len(heading.group(1)), title, f"{anchor}-{count}" if count else anchor, start))
+
+    sections: List[Section] = []
+    for index, (level, title, anchor, start) in enumerate(found):
+        end = next((later[3] for later in found[index + 1:] if later[0] <= level), offset)
+        sections.append(Section(level, title, anchor, start, end))
+    return sections
+
+
+class SectionIndexCache:
+    """Heading offsets of recently parsed documents, keyed by content hash.
+
+    Builds selecting different sections of the same text parse it once.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[bytes, List[Section]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.parses = 0
+
+    def sections(self, text: str) -> List[Section]:
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        with self._lock:
+            cached = self._entries.get(digest)
+            if cached is not None:
+                self._entries.move_to_end(digest)
+                return cached
+
+        sections = scan_sections(text.splitlines(keepends=True))
+        with self._lock:
+            self.parses += 1
+            self._entries[digest] = sections
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return sections
+
+
+_DEFAULT_CACHE = SectionIndexCache()
+
+
+def select_sections(
+    text: str,
+    selectors: Sequence[str],
+    source: str = "<text>",
+    cache: SectionIndexCache = _DEFAULT_CACHE,
+) -> str:
+    """Return the heading subtrees of text matching selectors, in document order.
+
+    A selector matches a heading's GitHub anchor, so both ``terraform-state``
+    and ``Terraform State`` select ``## Terraform State``. Raises ValueError
+    when a selector matches no heading.
+    """
+
+    sections = cache.sections(text)
+    ranges: List[Tuple[int, int]] = []
+    for selector in selectors:
+        anchor = heading_anchor(selector)
+        matched = [section for section in sections if section.anchor == anchor]
+        if not matched:
+            raise ValueError(f"Section '{selector}' not found in '{source}'")
+        ranges.extend((section.start, section.end) for section in matched)
+
+    # Overlapping ranges (a subsection selected along with its parent) are merged.
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+        else:
+            merged.append((start, end))
+
+    return "\n".join(text[start:end].rstrip("\n") + "\n" for start, end in merged)
@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from glob import glob
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import unquote, urlparse
+
+from yaxai.configio import parse_yaml
+from yaxai.contentcache import PinnedGitHubDownloader
+from yaxai.ghurl import GitHubFile
+from yaxai.gitmirror import GitSource, is_git_source, read_git_source
+from yaxai.sections import select_sections, split_section_selector, with_section_selector
+
+
+CONFIG_SUFFIXES = (".yml", ".yaml")
+
+
+def is_config_source(location: str) -> bool:
+    """Return True when a source points at another yax config instead of a fragment."""
+
+    path = urlparse(location).path if "://" in location else location
+    return path.lower().endswith(CONFIG_SUFFIXES)
+
+
+@dataclass
+class SourceNode:
+    """A resolved source: a nested config (with children) or a fragment leaf."""
+
+    key: str
+    kind: str
+    children: List[str] = field(default_factory=list)
+
+    @property
+    def is_config(self) -> bool:
+        return self.kind == "config"
+
+
+@dataclass
+class SourceGraph:
+    """Sources of a build with nested configs expanded.
+
+    Each distinct config or fragment appears once in ``nodes`` even when it
+    is reached through several parents, so it is fetched only once.
+    """
+
+    root: str
+    nodes: Dict[str, SourceNode]
+    # Top-level ``from`` entry each direct child of the root was expanded from.
+    origins: Dict[str, str] = field(default_factory=dict)
+
+    def fragments(self, key: Optional[str] = None) -> List[str]:
+        """Return fragment keys in output order, repeating fragments listed several times.
+
+        With ``key``, only fragments reached through that source are returned.
+        """
+
+        ordered: List[str] = []
+
+        def walk(key: str) -> None:
+            node = self.nodes[key]
+            if not node.is_config:
+                ordered.append(key)
+                return
+            for child in node.children:
+                walk(child)
+
+        walk(key or self.root)
+        return ordered
+
+    def origin_fragments(self) -> List[Tuple[str, str]]:
+        """Return ``(top-level entry, fragment key)`` pairs in output order."""
+
+        return [
+            (self.origins.get(child, child), key)
+            for child in self.nodes[self.root].children
+            for key in self.fragments(child)
+        ]
+
+    def render(self) -> str:
+        """Return an indented tree of the graph for debugging."""
+
+        lines: List[str] = [self.root]
+        shown: set[str] = {self.root}
+
+        def walk(key: str, depth: int) -> None:
+            for child in self.nodes[key].children:
+                node = self.nodes[child]
+                indent = "  " * depth
+                if node.is_config and child in shown:
+                    lines.append(f"{indent}- {child} (shown above)")
+                    continue
+                lines.append(f"{indent}- {child}")
+                if node.is_config:
+                    shown.add(child)
+                    walk(child, depth + 1)
+
+        walk(self.root, 0)
+        return "\n".join(lines)
+
+
+class SourceFetcher:
+    """Fetch source texts through a shared thread pool, each distinct source once.
+
+    Results are memoized by source key, so one fetcher can be shared by
+    several builds to avoid downloading common fragments repeatedly. Keys
+    with a section selector (``location#yax:a,b``) download the location once
+    and extract the selected sections from it.
+    """
+
+    def __init__(self, max_workers: int = 16, download: Optional[Callable[[str], str]] = None) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._download = download or SourceDownloader()
+        self._futures: Dict[str, Future[str]] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key: str) -> Future[str]:
+        with self._lock:
+            return self._submit_locked(key)
+
+    def _submit_locked(self, key: str) -> Future[str]:
+        future = self._futures.get(key)
+        if future is not None:
+            return future
+
+        location, selectors = split_section_selector(key)
+        if not selectors:
+            future = self._futures[key] = self._executor.submit(self._download, key)
+            return future
+
+        # Selected sections are extracted when the whole document arrives,
+        # without holding a worker while waiting for it.
+        selected: Future[str] = Future()
+        self._futures[key] = selected
+
+        def extract(document: Future[str]) -> None:
+            try:
+                selected.set_result(select_sections(document.result(), selectors, location))
+            except BaseException as exc:
+                selected.set_exception(exc)
+
+        self._submit_locked(location).add_done_callback(extract)
+        return selected
+
+    def fetch(self, key: str) -> str:
+        return self.submit(key).result()
+
+    def fetch_all(self, keys: Iterable[str]) -> Dict[str, str]:
+        futures = {key: self.submit(key) for key in keys}
+        return {key: future.result() for key, future in futures.items()}
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "SourceFetcher":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class SourceDownloader:
+    """Download a source text by key.
+
+    GitHub files go through a ``PinnedGitHubDownloader``, so each distinct
+    ref is resolved to a commit once for the lifetime of the downloader and
+    files of unchanged commits are read from the local content cache.
+    """
+
+    def __init__(self, github: Optional[PinnedGitHubDownloader] = None) -> None:
+        self._github = github or PinnedGitHubDownloader()
+
+    def __call__(self, key: str) -> str:
+        if key.startswith("file:") or is_git_source(key):
+            return _download_source(key)
+        return self._github.download(key)
+
+
+class SourceResolver:
+    """Expand ``from`` entries that point at other yax configs into a source graph.
+
+    Nested configs are fetched concurrently and memoized, so a config shared
+    by several parents is loaded and expanded once. Relative ``file:`` entries
+    are resolved against the directory of the config that lists them (the
+    ``base_dir`` for the top-level entries).
+    """
+
+    def __init__(self, fetcher: SourceFetcher, base_dir: Optional[Path] = None) -> None:
+        self._fetcher = fetcher
+        self._base_dir = base_dir or Path.cwd()
+
+    def resolve(self, entries: Sequence[str], root: str = "<root>") -> SourceGraph:
+        nodes: Dict[str, SourceNode] = {root: SourceNode(root, "config")}
+        pending: Dict[str, Future[str]] = {}
+        origins: Dict[str, str] = {}
+
+        def add_children(parent: SourceNode, parent_entries: Sequence[str], base_dir: Optional[Path]) -> None:
+            for entry in parent_entries:
+                for key in _expand_entry(entry, base_dir, parent.key):
+                    parent.children.append(key)
+                    if parent.key == root:
+                        origins.setdefault(key, entry)
+                    if key in nodes:
+                        continue
+                    kind = "config" if is_config_source(key) else "fragment"
+                    nodes[key] = SourceNode(key, kind)
+                    # Fragments are prefetched while the remaining configs resolve.
+                    future = self._fetcher.submit(key)
+                    if kind == "config":
+                        pending[key] = future
+
+        add_children(nodes[root], entries, self._base_dir)
+
+        while pending:
+            key, future = pending.popitem()
+            node = nodes[key]
+            node_entries = _config_source_entries(future.result(), key)
+            add_children(node, node_entries, _local_dir(key))
+
+        graph = SourceGraph(root=root, nodes=nodes, origins=origins)
+        _check_acyclic(graph)
+        return graph
+
+
+def expand_entries(entries: Sequence[str], base_dir: Optional[Path], parent: str = "<root>") -> List[str]:
+    """Return the source keys entries expand to (matching ``file:`` globs), without fetching."""
+
+    return [key for entry in entries for key in _expand_entry(entry, base_dir, parent)]
+
+
+def local_config_sources(key: str) -> List[str]:
+    """Return the source keys listed by the local ``file:`` config at key."""
+
+    return expand_entries(_config_source_entries(_download_source(key), key), _local_dir(key), key)
+
+
+def _expand_entry(entry: str, base_dir: Optional[Path], parent: str) -> List[str]:
+    entry = entry.strip()
+    if is_git_source(entry):
+        GitSource.parse(split_section_selector(entry)[0])
+        return [entry]
+    if not entry.startswith("file:"):
+        return [GitHubFile.parse(entry).url]
+
+    _, selectors = split_section_selector(entry)
+
+    if base_dir is None:
+        raise RuntimeError(f"Config '{parent}' cannot reference local file source '{entry}'")
+
+    parsed = urlparse(entry)
+    # Accept both file:relative/path and file:///absolute/path patterns.
+    pattern = unquote(parsed.path or "")
+    if parsed.netloc:
+        pattern = f"{parsed.netloc}{pattern}" if pattern.startswith("/") else f"{parsed.netloc}/{pattern}"
+
+    if not pattern:
+        raise RuntimeError(f"File source '{entry}' does not specify a path")
+
+    glob_pattern = pattern if pattern.startswith("/") else str((base_dir / pattern).resolve())
+    matches = sorted(Path(match_path) for match_path in glob(glob_pattern, recursive=True))
+    file_matches = [path for path in matches if path.is_file()]
+    if not file_matches:
+        raise RuntimeError(f"No files matched pattern '{pattern}' (from '{entry}')")
+
+    return [with_section_selector(f"file:{path}", selectors) for path in file_matches]
+
+
+def _config_source_entries(text: str, key: str) -> List[str]:
+    data = parse_yaml(text) or {}
+    if not isinstance(data, dict):
+        raise ValueError(f"Nested config '{key}' must contain a YAML mapping at the root")
+
+    build_section = data.get("build") or {}
+    agentsmd_section = build_section.get("agentsmd") if isinstance(build_section, dict) else None
+    if not isinstance(agentsmd_section, dict):
+        raise ValueError(f"Nested config '{key}' does not define a 'build.agentsmd' section")
+
+    entries = agentsmd_section.get("from") or []
+    if not isinstance(entries, list):
+        raise ValueError(f"Nested config '{key}' 'from' must be a list of non-empty strings")
+    # Entries may be mappings ({url, priority, sections}); only the top-level
+    # config's priorities apply, so nested ones are reduced to their URL
+    # and section selector.
+    entries = [_mapping_entry_location(entry) if isinstance(entry, dict) else entry for entry in entries]
+    if not all(isinstance(entry, str) and entry.strip() for entry in entries):
+        raise ValueError(f"Nested config '{key}' 'from' must be a list of non-empty strings")
+
+    return entries
+
+
+def _mapping_entry_location(entry: Dict[str, Any]) -> Any:
+    url = entry.get("url")
+    sections = entry.get("sections")
+    if isinstance(sections, str):
+        sections = [sections]
+    if isinstance(url, str) and isinstance(sections, list) and all(isinstance(name, str) for name in sections):
+        return with_section_selector(url, sections)
+    return url
+
+
+def _local_dir(key: str) -> Optional[Path]:
+    if key.startswith("file:"):
+        return Path(key[len("file:"):]).parent
+    return None
+
+
+def _check_acyclic(graph: SourceGraph) -> None:
+    visiting: List[str] = []
+    done: set[str] = set()
+
+    def visit(key: str) -> None:
+        if key in done:
+            return
+        if key in visiting:
+            cycle = visiting[visiting.index(key):] + [key]
+            raise ValueError("Nested configs form a cycle: " + " -> ".join(cycle))
+
+        visiting.append(key)
+        for child in graph.nodes[key].children:
+            if graph.nodes[child].is_config:
+                visit(child)
+        visiting.pop()
+        done.add(key)
+
+    visit(graph.root)
+
+
+def _download_source(key: str) -> str:
+    if key.startswith("file:"):
+        path = Path(key[len("file:"):])
+        try:
+            return path.read_text(encoding="utf-8")
+        except OSError as exc:
+            raise RuntimeError(f"Failed to read source '{path}': {exc}") from exc
+    if is_git_source(key):
+        return read_git_source(key)
+
+    return GitHubFile(key).download()
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from pathlib import PurePath
+from typing import Callable, Dict, Optional, Sequence
+
+
+def _render_markdown(content: str, description: Optional[str], globs: Sequence[str], always_apply: bool) -> str:
+    return content
+
+
+def _render_cursor_rule(content: str, description: Optional[str], globs: Sequence[str], always_apply: bool) -> str:
+    front_matter = [
+        "---",
+        f"description: {description or ''}".rstrip(),
+        f"globs: {','.join(globs)}".rstrip(),
+        f"alwaysApply: {'true' if always_apply else 'false'}",
+        "---",
+    ]
+    return "\n".join(front_matter) + "\n\n" + content
+
+
+TARGET_FORMATS: Dict[str, Callable[[str, Optional[str], Sequence[str], bool], str]] = {
+    "markdown": _render_markdown,
+    "mdc": _render_cursor_rule,
+}
+
+
+def infer_target_format(output: str) -> str:
+    """Pick the output format from the file extension (Cursor rules use .mdc)."""
+
+    return "mdc" if PurePath(output).suffix.lower() == ".mdc" else "markdown"
+
+
+def render_target(
+    content: str,
+    format_name: str,
+    description: Optional[str] = None,
+    globs: Sequence[str] = (),
+    always_apply: bool = True,
+) -> str:
+    """Wrap combined fragment content in the envelope expected by the target tool."""
+
+    renderer = TARGET_FORMATS.get(format_name)
+    if renderer is None:
+        raise ValueError(f"Unsupported target format '{format_name}'")
+
+    return renderer(content, description, globs, always_apply)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import math
+import re
+from typing import Callable, Dict
+
+
+TokenEstimator = Callable[[str], int]
+
+DEFAULT_TOKENIZER = "bpe"
+
+# Pre-tokenization in the style of GPT byte-pair encoders: contractions,
+# words with their leading space, short digit groups, punctuation runs and
+# whitespace.
+_PIECE_PATTERN = re.compile(r"'(?:[sdmt]|ll|ve|re)| ?[^\W\d_]+| ?\d{1,3}| ?(?:[^\s\w]|_)+|\s+")
+
+_CHARS_PER_TOKEN = 4
+_WORD_CHARS_PER_TOKEN = 6
+_PUNCTUATION_CHARS_PER_TOKEN = 3
+_WHITESPACE_CHARS_PER_TOKEN = 8
+
+
+def estimate_bpe_tokens(text: str) -> int:
+    """Approximate a byte-pair encoder's token count without a vocabulary.
+
+    Text is split like a BPE pre-tokenizer; common words and short digit
+    groups count as one token and longer pieces as several.
+    """
+
+    count = 0
+    for match in _PIECE_PATTERN.finditer(text):
+        piece = match.group()
+        if piece.isspace():
+            count += math.ceil(len(piece) / _WHITESPACE_CHARS_PER_TOKEN)
+            continue
+
+        body = piece.lstrip(" ")
+        if body[0].isalpha():
+            count += math.ceil(len(body) / _WORD_CHARS_PER_TOKEN)
+        elif body[0].isdigit() or body[0] == "'":
+            count += 1
+        else:
+            count += math.ceil(len(body) / _PUNCTUATION_CHARS_PER_TOKEN)
+    return count
+
+
+def estimate_char_tokens(text: str) -> int:
+    """Estimate tokens as one per four characters."""
+
+    return math.ceil(len(text) / _CHARS_PER_TOKEN)
+
+
+TOKEN_ESTIMATORS: Dict[str, TokenEstimator] = {
+    "bpe": estimate_bpe_tokens,
+    "chars": estimate_char_tokens,
+}
+
+
+def register_token_estimator(name: str, estimator: TokenEstimator) -> None:
+    """Make an estimator (for example one backed by a real tokenizer) selectable by name."""
+
+    TOKEN_ESTIMATORS[name] = estimator
+
+
+def get_token_estimator(name: str = DEFAULT_TOKENIZER) -> TokenEstimator:
+    estimator = TOKEN_ESTIMATORS.get(name)
+    if estimator is None:
+        raise ValueError(f"Unknown tokenizer '{name}'. Available: {', '.join(sorted(TOKEN_ESTIMATORS))}")
+    return estimator
+
+
+def estimate_tokens(text: str, tokenizer: str = DEFAULT_TOKENIZER) -> int:
+    """Estimate the number of model tokens in text with the named estimator."""
+
+    return get_token_estimator(tokenizer)(text)
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Mapping, Optional
+from urllib.error import HTTPError, URLError
+from urllib.parse import unquote, urlparse
+from urllib.request import HTTPRedirectHandler, Request, build_opener
+
+from yaxai.ghurl import GitHubFile, GitHubTokenFinder
+
+
+LINK_OK = "ok"
+LINK_MOVED = "moved"
+LINK_PRIVATE = "private"
+LINK_DEAD = "dead"
+LINK_ERROR = "error"
+
+_MOVED_CODES = {301, 302, 303, 307, 308}
+_PRIVATE_CODES = {401, 403}
+_DEAD_CODES = {404, 410}
+_HEAD_UNSUPPORTED_CODES = {405, 501}
+
+# Catalog outputs mostly live on GitHub's raw CDN, which copes with far more
+# parallel requests than the general per-host limit allows.
+DEFAULT_HOST_LIMITS: Dict[str, int] = {"raw.githubusercontent.com": 32}
+
+
+@dataclass(frozen=True)
+class LinkCheck:
+    """Outcome of checking a single URL."""
+
+    url: str
+    status: str
+    http_status: Optional[int] = None
+    latency: float = 0.0
+    location: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, object]:
+        data: Dict[str, object] = {"status": self.status, "latency_ms": round(self.latency * 1000)}
+        for key in ("http_status", "location", "etag", "last_modified", "error"):
+            value = getattr(self, key)
+            if value is not None:
+                data[key] = value
+        return data
+
+
+class _NoRedirect(HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        # Surface redirects as HTTPError so moved links can be reported.
+        return None
+
+
+class LinkChecker:
+    """Check many URLs concurrently with a bounded number of requests per host.
+
+    Each URL is probed with a HEAD request (falling back to a one-byte GET when
+    HEAD is not supported). Known validators are sent along so unchanged
+    resources answer with ``304 Not Modified``. Redirects are not followed but
+    reported as moved links; GitHub files that are only reachable with a token
+    are reported as private.
+
+    ``per_host`` limits every host except those listed in ``host_limits``,
+    which extends ``DEFAULT_HOST_LIMITS``.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 32,
+        per_host: int = 8,
+        timeout: float = 10.0,
+        token: Optional[str] = None,
+        host_limits: Optional[Mapping[str, int]] = None,
+    ) -> None:
+        limits = {**DEFAULT_HOST_LIMITS, **{host.lower(): limit for host, limit in (host_limits or {}).items()}}
+        if max_workers < 1 or per_host < 1 or any(limit < 1 for limit in limits.values()):
+            raise ValueError("Link checker concurrency limits must be positive")
+
+        self._max_workers = max_workers
+        self._per_host = per_host
+        self._host_limits = limits
+        self._timeout = timeout
+        self._token = token
+        self._token_resolved = token is not None
+        self._opener = build_opener(_NoRedirect)
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        # Resolving the token may run `gh auth token`; it must not hold up host slot lookups.
+        self._token_lock = threading.Lock()
+
+    def check_all(
+        self,
+        urls: Iterable[str],
+        validators: Optional[Mapping[str, Mapping[str, Optional[str]]]] = None,
+    ) -> Dict[str, LinkCheck]:
+        """Check every distinct URL, returning results keyed by URL."""
+
+        unique_urls = list(dict.fromkeys(urls))
+        validators = validators or {}
+        if any(_github_file(url) is not None for url in unique_urls):
+            # Resolve the token once up front instead of in the first worker that needs it.
+            self._github_token()
+
+        def run(url: str) -> LinkCheck:
+            known = validators.get(url, {})
+            return self.check(url, etag=known.get("etag"), last_modified=known.get("last_modified"))
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            return dict(zip(unique_urls, executor.map(run, unique_urls)))
+
+    def check(self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> LinkCheck:
+        parsed = urlparse(url)
+
+        if parsed.scheme == "file":
+            started = time.perf_counter()
+            exists = Path(unquote(parsed.path)).is_file()
+            return LinkCheck(url, LINK_OK if exists else LINK_DEAD, latency=time.perf_counter() - started)
+
+        github_file = _github_file(url)
+        target = github_file.raw() if github_file is not None else url
+        headers: Dict[str, str] = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        result = self._probe(url, target, headers)
+        if result.status == LINK_DEAD and github_file is not None and self._github_token():
+            # Raw URLs of private repositories answer 404; ask the API with a token instead.
+            try:
+                api_url = github_file.api_url()
+            except RuntimeError:
+                return result
+            api_result = self._probe(url, api_url, {"Authorization": f"token {self._github_token()}"})
+            if api_result.status == LINK_OK:
+                return LinkCheck(
+                    url,
+                    LINK_PRIVATE,
+                    http_status=api_result.http_status,
+                    latency=api_result.latency,
+                )
+
+        return result
+
+    def _probe(self, url: str, target: str, headers: Dict[str, str]) -> LinkCheck:
+        host = urlparse(target).netloc.lower()
+        with self._slot(host):
+            # Latency covers the requests only, not the wait for a free host slot.
+            started = time.perf_counter()
+            try:
+                status, response_headers = self._request(target, headers, "HEAD")
+                if status in _HEAD_UNSUPPORTED_CODES:
+                    status, response_headers = self._request(target, {**headers, "Range": "bytes=0-0"}, "GET")
+            except (URLError, OSError) as error:
+                reason = getattr(error, "reason", error)
+                return LinkCheck(url, LINK_ERROR, latency=time.perf_counter() - started, error=str(reason))
+            latency = time.perf_counter() - started
+
+        if status in _MOVED_CODES:
+            return LinkCheck(url, LINK_MOVED, status, latency, location=response_headers.get("Location"))
+        if status in _PRIVATE_CODES:
+            return LinkCheck(url, LINK_PRIVATE, status, latency)
+        if status in _DEAD_CODES:
+            return LinkCheck(url, LINK_DEAD, status, latency)
+        if status == 304 or 200 <= status < 300:
+            return LinkCheck(
+                url,
+                LINK_OK,
+                status,
+                latency,
+                etag=response_headers.get("ETag") or headers.get("If-None-Match"),
+                last_modified=response_headers.get("Last-Modified") or headers.get("If-Modified-Since"),
+            )
+
+        return LinkCheck(url, LINK_ERROR, status, latency, error=f"Unexpected HTTP status {status}")
+
+    def _request(self, target: str, headers: Dict[str, str], method: str):  # type: ignore[no-untyped-def]
+        request = Request(target, headers=headers, method=method)
+        try:
+            with self._opener.open(request, timeout=self._timeout) as response:
+                return getattr(response, "status", response.getcode()), response.headers
+        except HTTPError as error:
+            return error.code, error.headers
+
+    def _slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(
+                    self._host_limits.get(host, self._per_host)
+                )
+            return slot
+
+    def _github_token(self) -> Optional[str]:
+        with self._token_lock:
+            if not self._token_resolved:
+                self._token = GitHubTokenFinder().find()
+                self._token_resolved = True
+            return self._token
+
+
+def _github_file(url: str) -> Optional[GitHubFile]:
+    try:
+        return GitHubFile.parse(url)
+    except ValueError:
+        return None
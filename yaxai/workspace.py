@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import os
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import List, NamedTuple, Sequence, Tuple
+
+
+IGNORE_FILES = (".gitignore", ".yaxignore")
+PROJECT_CONFIG_FILENAME = "yax.yml"
+
+
+class _IgnorePattern(NamedTuple):
+    base: Path
+    pattern: str
+    negated: bool
+    directory_only: bool
+    anchored: bool
+
+
+def _read_ignore_patterns(directory: Path) -> List[_IgnorePattern]:
+    patterns: List[_IgnorePattern] = []
+    for name in IGNORE_FILES:
+        ignore_file = directory / name
+        try:
+            lines = ignore_file.read_text(encoding="utf-8").splitlines()
+        except (OSError, UnicodeDecodeError):
+            continue
+
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            negated = line.startswith("!")
+            if negated:
+                line = line[1:]
+            directory_only = line.endswith("/")
+            line = line.rstrip("/")
+            anchored = "/" in line
+            line = line.lstrip("/")
+            if line:
+                patterns.append(_IgnorePattern(directory, line, negated, directory_only, anchored))
+
+    return patterns
+
+
+def _is_ignored(path: Path, is_dir: bool, patterns: Sequence[_IgnorePattern]) -> bool:
+    ignored = False
+    for rule in patterns:
+        if rule.directory_only and not is_dir:
+            continue
+
+        relative = path.relative_to(rule.base).as_posix()
+        target = relative if rule.anchored else path.name
+        if fnmatchcase(target, rule.pattern):
+            ignored = not rule.negated
+
+    return ignored
+
+
+def find_project_configs(root: Path) -> List[Path]:
+    """Return every yax.yml below root, skipping hidden and ignored directories.
+
+    Patterns from .gitignore and .yaxignore files apply to the directory that
+    holds them and everything below it, in the usual gitignore fashion
+    (last matching pattern wins, ``!`` re-includes, trailing ``/`` matches
+    directories only).
+    """
+
+    root = root.resolve()
+    configs: List[Path] = []
+    stack: List[Tuple[Path, List[_IgnorePattern]]] = [(root, [])]
+
+    while stack:
+        directory, inherited = stack.pop()
+        patterns = inherited + _read_ignore_patterns(directory)
+
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name, reverse=True)
+        except OSError:
+            continue
+
+        for entry in entries:
+            path = Path(entry.path)
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name.startswith(".") or _is_ignored(path, True, patterns):
+                    continue
+                stack.append((path, patterns))
+            elif entry.name == PROJECT_CONFIG_FILENAME and not _is_ignored(path, False, patterns):
+                configs.append(path)
+
+    return sorted(configs)
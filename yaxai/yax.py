@@ -1,21 +1,178 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
 import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from glob import glob
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-from urllib.parse import ParseResult, quote, unquote, urlparse
+from pathlib import Path, PurePosixPath
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+)
+from urllib.parse import ParseResult, quote, unquote, urljoin, urlparse
 
 import yaml
 
+from yaxai.agentsmd import output_matches, render_outputs, resolve_config_path, resolve_sources, write_outputs
+from yaxai.catalogstream import iter_catalog_events
+from yaxai.configio import load_yaml_file, parse_yaml, write_text_atomic, write_yaml_file
+from yaxai.contentcache import CommitResolver, PinnedGitHubDownloader
+from yaxai.defaults import DEFAULT_AGENTSMD_CONFIG_FILENAME, DEFAULT_AGENTSMD_OUTPUT, DEFAULT_CATALOG_OUTPUT
 from yaxai.ghurl import GitHubFile
+from yaxai.sections import with_section_selector
+from yaxai.sources import SourceDownloader, SourceFetcher, SourceGraph
+from yaxai.targets import TARGET_FORMATS, infer_target_format, render_target
+from yaxai.tokens import DEFAULT_TOKENIZER, TOKEN_ESTIMATORS
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+# Modules only needed by individual catalog commands (SQLite index, search,
+# exports, link checks, org scans) are imported where they are used so that
+# importing this module stays cheap.
+if TYPE_CHECKING:  # pragma: no cover - imported for annotations only
+    from yaxai.buildstate import BuildState
+    from yaxai.catalogcache import RemoteCatalogCache
+    from yaxai.catalogindex import CatalogIndex, CatalogIndexRow
+    from yaxai.export import CatalogWriter
+    from yaxai.search import SearchDocument, SearchHit
+    from yaxai.verify import LinkCheck, LinkChecker
+
+
+def _split_source_entries(data: Any, allow_scopes: bool) -> Any:
+    """Reduce ``{url, priority, scope, sections}`` entries in ``from`` to URLs.
+
+    Priorities and scopes move to their own mappings and sections become a
+    ``#yax:a,b`` selector on the URL. A URL listed several times must be listed
+    with the same scope (or always without one) each time.
+    """
+
+    key = "from" if isinstance(data, dict) and "from" in data else "urls"
+    if not isinstance(data, dict) or not isinstance(data.get(key), list):
+        return data
+
+    urls: List[Any] = []
+    priorities = dict(data.get("priorities") or {})
+    given_scopes = dict(data.get("scopes") or {})
+    scopes = dict(given_scopes)
+    # Scope each URL was listed with, so repeated entries cannot disagree.
+    listed: Dict[str, Any] = {}
+    for entry in data[key]:
+        scope = given_scopes.get(entry) if isinstance(entry, str) else None
+        if isinstance(entry, dict):
+            url = entry.get("url")
+            sections = entry.get("sections")
+            if isinstance(url, str) and sections is not None:
+                if isinstance(sections, str):
+                    sections = [sections]
+                if not isinstance(sections, list) or not all(isinstance(name, str) for name in sections):
+                    raise ValueError(f"sections of '{url}' must be a list of heading names")
+                url = with_section_selector(url, sections)
+            if isinstance(url, str) and "priority" in entry:
+                priorities[url] = entry["priority"]
+            if isinstance(url, str) and "scope" in entry:
+                if not allow_scopes:
+                    raise ValueError(f"scope of '{url}' is only supported in the main 'from' list")
+                scope = entry["scope"]
+            elif isinstance(url, str):
+                scope = given_scopes.get(url)
+            entry = url
+        if allow_scopes and isinstance(entry, str):
+            normalized = scope.strip().rstrip("/") if isinstance(scope, str) else scope
+            if entry in listed and listed[entry] != normalized:
+                raise ValueError(f"'{entry}' is listed with different scopes")
+            listed[entry] = normalized
+            if scope is not None:
+                scopes[entry] = scope
+        urls.append(entry)
+
+    split = {**data, key: urls, "priorities": priorities}
+    if allow_scopes:
+        split["scopes"] = scopes
+    return split
+
+
+class AgentsmdTarget(BaseModel):
+    """Additional output built from the same fetch pass as the main output."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    output: str
+    urls: Optional[List[str]] = Field(default=None, alias="from")
+    format: Optional[str] = None
+    description: Optional[str] = None
+    globs: List[str] = Field(default_factory=list)
+    always_apply: bool = Field(default=True, alias="alwaysApply")
+    dedupe: Optional[bool] = None
+    minify: Optional[bool] = None
+    max_tokens: Optional[int] = Field(default=None, gt=0)
+    tokenizer: Optional[str] = None
+    priorities: Dict[str, int] = Field(default_factory=dict)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _split_source_options(cls, data: Any) -> Any:
+        return _split_source_entries(data, allow_scopes=False)
+
+    @field_validator("output")
+    @classmethod
+    def _output_must_not_be_empty(cls, output: str) -> str:
+        if not output.strip():
+            raise ValueError("target output must be a non-empty string")
+        return output.strip()
+
+    @field_validator("urls")
+    @classmethod
+    def _urls_must_be_strings(cls, urls: Optional[List[str]]) -> Optional[List[str]]:
+        if urls is not None:
+            for url in urls:
+                if not isinstance(url, str) or not url.strip():
+                    raise ValueError("each URL must be a non-empty string")
+        return urls
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+    @field_validator("format")
+    @classmethod
+    def _format_must_be_known(cls, format_name: Optional[str]) -> Optional[str]:
+        if format_name is not None and format_name not in TARGET_FORMATS:
+            raise ValueError(f"format must be one of: {', '.join(TARGET_FORMATS)}")
+        return format_name
+
+    @field_validator("tokenizer")
+    @classmethod
+    def _tokenizer_must_be_known(cls, tokenizer: Optional[str]) -> Optional[str]:
+        if tokenizer is not None and tokenizer not in TOKEN_ESTIMATORS:
+            raise ValueError(f"tokenizer must be one of: {', '.join(sorted(TOKEN_ESTIMATORS))}")
+        return tokenizer
 
+    @field_validator("globs", mode="before")
+    @classmethod
+    def _split_globs(cls, globs: Any) -> Any:
+        if isinstance(globs, str):
+            return [part.strip() for part in globs.split(",") if part.strip()]
+        return globs
+
+    def render(self, content: str) -> str:
+        return render_target(
+            content,
+            self.format or infer_target_format(self.output),
+            description=self.description,
+            globs=self.globs,
+            always_apply=self.always_apply,
+        )
 
-DEFAULT_AGENTSMD_OUTPUT = "AGENTS.md"
-DEFAULT_AGENTSMD_CONFIG_FILENAME = "yax.yml"
 
 class AgentsmdBuildConfig(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
@@ -23,6 +180,38 @@ class AgentsmdBuildConfig(BaseModel):
     urls: List[str] = Field(default_factory=list, alias="from")
     output: str = DEFAULT_AGENTSMD_OUTPUT
     metadata: Optional[Dict[str, Any]] = None
+    targets: List[AgentsmdTarget] = Field(default_factory=list)
+    dedupe: bool = False
+    minify: bool = False
+    max_tokens: Optional[int] = Field(default=None, gt=0)
+    tokenizer: str = DEFAULT_TOKENIZER
+    # Filled from ``from`` entries written as ``{url, priority, scope}`` mappings;
+    # their ``sections`` become a ``#yax:a,b`` selector on the URL.
+    priorities: Dict[str, int] = Field(default_factory=dict)
+    scopes: Dict[str, str] = Field(default_factory=dict)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _split_source_options(cls, data: Any) -> Any:
+        return _split_source_entries(data, allow_scopes=True)
+
+    @field_validator("scopes")
+    @classmethod
+    def _scopes_must_be_relative_directories(cls, scopes: Dict[str, str]) -> Dict[str, str]:
+        normalized: Dict[str, str] = {}
+        for url, scope in scopes.items():
+            path = PurePosixPath(scope.strip().rstrip("/")) if isinstance(scope, str) else None
+            if path is None or path.is_absolute() or str(path) == "." or ".." in path.parts:
+                raise ValueError(f"scope of '{url}' must be a directory below the project root")
+            normalized[url] = path.as_posix()
+        return normalized
+
+    @field_validator("tokenizer")
+    @classmethod
+    def _tokenizer_must_be_known(cls, tokenizer: str) -> str:
+        if tokenizer not in TOKEN_ESTIMATORS:
+            raise ValueError(f"tokenizer must be one of: {', '.join(sorted(TOKEN_ESTIMATORS))}")
+        return tokenizer
 
     @field_validator("urls")
     @classmethod
@@ -34,37 +223,72 @@ class AgentsmdBuildConfig(BaseModel):
                 raise ValueError("each URL must be a non-empty string")
         return urls
 
+    def build_targets(self) -> List[AgentsmdTarget]:
+        """Return the main output followed by extra targets, with inherited options filled in.
+
+        Scoped sources are left out of the main output and of inheriting
+        targets; each scope gets its own file named like the main output
+        inside the scope directory. The main output is skipped when every
+        source is scoped.
+        """
+
+        inherited = {
+            "dedupe": self.dedupe,
+            "minify": self.minify,
+            "max_tokens": self.max_tokens,
+            "tokenizer": self.tokenizer,
+        }
+        unscoped = [url for url in self.urls if url not in self.scopes]
+        targets: List[AgentsmdTarget] = []
+        if unscoped:
+            targets.append(
+                AgentsmdTarget(output=self.output, urls=unscoped, priorities=dict(self.priorities), **inherited)
+            )
+
+        output_name = PurePosixPath(self.output).name
+        for scope in dict.fromkeys(self.scopes.values()):
+            targets.append(
+                AgentsmdTarget(
+                    output=f"{scope}/{output_name}",
+                    urls=[url for url in self.urls if self.scopes.get(url) == scope],
+                    priorities=dict(self.priorities),
+                    **inherited,
+                )
+            )
+
+        for target in self.targets:
+            updates: Dict[str, Any] = {name: value for name, value in inherited.items() if getattr(target, name) is None}
+            if target.urls is None:
+                updates["urls"] = list(unscoped)
+            updates["priorities"] = {**self.priorities, **target.priorities}
+            targets.append(target.model_copy(update=updates))
+        return targets
+
+    def source_entries(self) -> List[Any]:
+        """Return ``from`` entries as written to YAML, with priorities and scopes where set."""
+
+        entries: List[Any] = []
+        for url in self.urls:
+            options: Dict[str, Any] = {}
+            if url in self.priorities:
+                options["priority"] = self.priorities[url]
+            if url in self.scopes:
+                options["scope"] = self.scopes[url]
+            entries.append({"url": url, **options} if options else url)
+        return entries
+
     @staticmethod
     def resolve_config_path(
         config_path: Path
     ) -> Path:
         """Resolve the expected config path, allowing parent fallback for defaults."""
 
-        config_path = Path(config_path)
-        if not config_path.is_absolute():
-            config_path = config_path.resolve(strict=False)
-
-        if config_path.exists():
-            return config_path
-
-        cwd = Path.cwd()
-        is_default_selection = (
-            config_path.name == DEFAULT_AGENTSMD_CONFIG_FILENAME
-            and config_path.parent == cwd
-        )
-
-        if is_default_selection and cwd.parent != cwd and cwd.name:
-            fallback_path = cwd.parent / f"{cwd.name}-{DEFAULT_AGENTSMD_CONFIG_FILENAME}"
-            if fallback_path.exists():
-                return fallback_path
-
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+        return resolve_config_path(config_path)
 
     @classmethod
     def parse_yml(cls, config_file_path: str | Path) -> AgentsmdBuildConfig:
         """Load Agentsmd build configuration from YAML file."""
-        with open(config_file_path, "r", encoding="utf-8") as config_file:
-            data = yaml.safe_load(config_file) or {}
+        data = load_yaml_file(config_file_path) or {}
 
         return AgentsmdBuildConfig.model_validate(
             data.get("build", {}).get("agentsmd", {})
@@ -78,28 +302,44 @@ class AgentsmdBuildConfig(BaseModel):
 
         if config_path.exists():
             try:
-                raw_text = config_path.read_text(encoding="utf-8")
+                data = load_yaml_file(config_path) or {}
             except OSError as exc:
                 raise RuntimeError(f"Failed to read configuration '{config_path}': {exc}") from exc
-
-            try:
-                data = yaml.safe_load(raw_text) or {}
             except yaml.YAMLError as exc:
                 raise ValueError(f"Invalid YAML in '{config_path}': {exc}") from exc
 
             if not isinstance(data, dict):
                 raise ValueError(f"Configuration '{config_path}' must contain a mapping at the root")
+
+            build_section = data.setdefault("build", {})
+            if not isinstance(build_section, dict):
+                raise ValueError(f"Configuration '{config_path}' 'build' section must be a mapping")
+
+            agentsmd_section = build_section.get("agentsmd")
+            if not isinstance(agentsmd_section, dict):
+                agentsmd_section = build_section["agentsmd"] = {}
+
+            agentsmd_section.update(self.model_dump(by_alias=True, exclude_defaults=True, exclude={"priorities", "scopes"}))
+            agentsmd_section["from"] = self.source_entries()
         else:
-            data = {"build": {"agentsmd": self.model_dump(by_alias=True)}}
+            # Optional settings are only written when they differ from their defaults.
+            defaults = AgentsmdBuildConfig()
+            unset = {
+                name
+                for name in ("targets", "dedupe", "minify", "max_tokens", "tokenizer")
+                if getattr(self, name) == getattr(defaults, name)
+            }
+            agentsmd_section = self.model_dump(by_alias=True, exclude=unset | {"priorities", "scopes"})
+            agentsmd_section["from"] = self.source_entries()
+            data = {"build": {"agentsmd": agentsmd_section}}
 
-        config_path.parent.mkdir(parents=True, exist_ok=True)
-        config_path.write_text(
-            yaml.safe_dump(data, sort_keys=False),
-            encoding="utf-8",
-        )
+        write_yaml_file(config_path, data)
 
 
-DEFAULT_CATALOG_OUTPUT = "yax-catalog.json"
+# Starting a process pool costs 20-50 ms, while inline parsing runs at 2-3
+# MB/s; below this many bytes of YAML the pool is slower even with
+# several cores (see benchmarks/catalog_parse.py).
+_PARALLEL_PARSE_MIN_BYTES = 512 * 1024
 
 
 @dataclass
@@ -112,11 +352,27 @@ class CatalogSource:
             raise ValueError("Catalog source url must be a non-empty string")
 
 
+@dataclass
+class CatalogShardConfig:
+    """Split catalog output into per-organization shard files listed in a manifest."""
+
+    buckets: int = 1
+    gzip: bool = False
+
+    def __post_init__(self) -> None:
+        if isinstance(self.buckets, bool) or not isinstance(self.buckets, int) or self.buckets < 1:
+            raise ValueError("Catalog shard 'buckets' must be a positive integer")
+
+
 @dataclass
 class CatalogBuildConfig:
     organization: str
     sources: List[CatalogSource] = field(default_factory=list)
     output: str = DEFAULT_CATALOG_OUTPUT
+    index: bool = False
+    search: bool = False
+    shards: Optional[CatalogShardConfig] = None
+    scan_organization: Optional[str] = None
 
     def __post_init__(self) -> None:
         normalized_sources: List[CatalogSource] = []
@@ -135,8 +391,7 @@ class CatalogBuildConfig:
     def open_catalog_build_config(cls, config_file_path: str | Path) -> "CatalogBuildConfig":
         """Load catalog build configuration from YAML file."""
 
-        with open(config_file_path, "r", encoding="utf-8") as config_file:
-            data = yaml.safe_load(config_file) or {}
+        data = load_yaml_file(config_file_path) or {}
 
         catalog_section = data.get("build", {}).get("catalog", {})
 
@@ -185,10 +440,50 @@ class CatalogBuildConfig:
         if not isinstance(output, str):
             raise ValueError("Expected 'output' to be a string in config file")
 
-        return cls(organization=organization, sources=sources, output=output)
+        shards: Optional[CatalogShardConfig] = None
+        raw_shards = catalog_section.get("shards")
+        if raw_shards is True:
+            shards = CatalogShardConfig()
+        elif isinstance(raw_shards, dict):
+            buckets = raw_shards.get("buckets", 1)
+            if isinstance(buckets, bool) or not isinstance(buckets, int):
+                raise ValueError("Expected 'shards.buckets' to be an integer in config file")
+            shards = CatalogShardConfig(buckets=buckets, gzip=_read_bool_option(raw_shards, "gzip"))
+        elif raw_shards not in (None, False):
+            raise ValueError("Expected 'shards' to be a boolean or a mapping in config file")
+
+        scan_organization = catalog_section.get("scan-org")
+        if scan_organization is not None:
+            if not isinstance(scan_organization, str) or not scan_organization.strip():
+                raise ValueError("Expected 'scan-org' to be a non-empty string in config file")
+            scan_organization = scan_organization.strip()
+
+        return cls(
+            organization=organization,
+            sources=sources,
+            output=output,
+            index=_read_bool_option(catalog_section, "index"),
+            search=_read_bool_option(catalog_section, "search"),
+            shards=shards,
+            scan_organization=scan_organization,
+        )
 
+    def scan_state_path(self) -> Path:
+        """Return the file remembering repository heads seen by the last organization scan."""
 
-@dataclass
+        return Path(self.output).with_suffix(".scan.json")
+
+
+def _read_bool_option(section: Dict[str, Any], key: str) -> bool:
+    value = section.get(key, False)
+    if value is None:
+        return False
+    if not isinstance(value, bool):
+        raise ValueError(f"Expected '{key}' to be a boolean in config file")
+    return value
+
+
+@dataclass(slots=True)
 class CatalogCollection:
     url: str
     name: Optional[str] = None
@@ -255,6 +550,46 @@ class CatalogCollection:
 
         return cls(url=url_value.strip(), name=name_value, output=output_value)
 
+    @classmethod
+    def from_mappings(cls, entries: Iterable[Any]) -> List["CatalogCollection"]:
+        """Validate and build many collections in a single pass.
+
+        Produces the same result as calling ``from_mapping`` for every entry.
+        Entries whose values are already well-formed and stripped, which is
+        what ``yax catalog build`` writes, are checked inline and built
+        without re-running ``__post_init__``; anything else (legacy
+        metadata, surrounding whitespace, invalid values) goes through
+        ``from_mapping`` for the full checks and error messages.
+        """
+
+        new = object.__new__
+        collections: List[CatalogCollection] = []
+        append = collections.append
+        for data in entries:
+            if type(data) is dict:
+                url = data.get("url", "")
+                name = data.get("name")
+                output = data.get("output")
+                if (
+                    type(url) is str
+                    and url == url.strip()
+                    and (
+                        (type(name) is str and name and name == name.strip())
+                        or (name is None and "metadata" not in data)
+                    )
+                    and (output is None or (type(output) is str and output and output == output.strip()))
+                ):
+                    collection = new(cls)
+                    collection.url = url
+                    collection.name = name
+                    collection.output = output
+                    append(collection)
+                    continue
+
+            append(cls.from_mapping(data))
+
+        return collections
+
     def output_url(self) -> str:
         """Return URL pointing to the collection output artifact."""
 
@@ -274,6 +609,19 @@ class CatalogCollection:
 
         return parsed._replace(path=new_path).geturl()
 
+    def canonical_output_url(self) -> str:
+        """Return output URL normalized so equivalent GitHub links compare equal."""
+
+        try:
+            url = self.output_url()
+        except ValueError:
+            url = self.url
+
+        try:
+            return GitHubFile.parse(url).url
+        except ValueError:
+            return url
+
     def to_dict(self) -> Dict[str, Any]:
         data: Dict[str, Any] = {"url": self.url}
         if self.name:
@@ -283,7 +631,7 @@ class CatalogCollection:
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class CatalogOrganization:
     name: str
     collections: List[CatalogCollection] = field(default_factory=list)
@@ -301,7 +649,7 @@ class CatalogOrganization:
         if not isinstance(collections_raw, list):
             raise ValueError("Expected organization 'collections' to be a list")
 
-        collections = [CatalogCollection.from_mapping(entry) for entry in collections_raw]
+        collections = CatalogCollection.from_mappings(collections_raw)
 
         return cls(name=name_value.strip(), collections=collections)
 
@@ -312,7 +660,7 @@ class CatalogOrganization:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Catalog:
     organizations: List[CatalogOrganization] = field(default_factory=list)
 
@@ -329,34 +677,162 @@ class Catalog:
 
         return cls(organizations=organizations)
 
+    @classmethod
+    def load(cls, path: Path, organizations: Optional[Collection[str]] = None) -> "Catalog":
+        """Read a catalog file, following shard manifests.
+
+        When ``organizations`` is provided only those organizations are
+        returned, and for sharded catalogs only their shard files are read.
+        """
+
+        data = _read_catalog_json(path)
+
+        if isinstance(data, dict) and "shards" in data:
+            shard_catalogs: List[Catalog] = []
+            for entry in _manifest_shard_entries(data, path):
+                if organizations is not None and entry["organization"] not in organizations:
+                    continue
+                shard_catalogs.append(cls.from_mapping(_read_catalog_json(path.parent / entry["path"])))
+            return cls.joined(shard_catalogs)
+
+        catalog = cls.from_mapping(data)
+        if organizations is not None:
+            catalog.organizations = [org for org in catalog.organizations if org.name in organizations]
+        return catalog
+
+    @classmethod
+    def joined(cls, catalogs: Iterable["Catalog"]) -> "Catalog":
+        """Concatenate catalogs, joining organizations that share a name."""
+
+        organizations: Dict[str, CatalogOrganization] = {}
+        for catalog in catalogs:
+            for organization in catalog.organizations:
+                target = organizations.get(organization.name)
+                if target is None:
+                    target = organizations[organization.name] = CatalogOrganization(name=organization.name)
+                target.collections.extend(organization.collections)
+
+        return cls(organizations=list(organizations.values()))
+
+    @classmethod
+    def merged(cls, catalogs: Iterable["Catalog"]) -> "Catalog":
+        """Merge catalogs, joining organizations by name and dropping duplicate collections.
+
+        The first occurrence of each collection (by canonical output URL) wins.
+        """
+
+        organizations: Dict[str, CatalogOrganization] = {}
+        seen_urls: set[str] = set()
+
+        for catalog in catalogs:
+            for organization in catalog.organizations:
+                target = organizations.get(organization.name)
+                if target is None:
+                    target = organizations[organization.name] = CatalogOrganization(name=organization.name)
+
+                for collection in organization.collections:
+                    key = collection.canonical_output_url()
+                    if key in seen_urls:
+                        continue
+                    seen_urls.add(key)
+                    target.collections.append(collection)
+
+        return cls(organizations=list(organizations.values()))
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "organizations": [org.to_dict() for org in self.organizations],
         }
 
+    def index_rows(self) -> List[CatalogIndexRow]:
+        """Flatten the catalog into rows suitable for the compiled catalog index."""
+
+        from yaxai.catalogindex import CatalogIndexRow
+
+        rows: List[CatalogIndexRow] = []
+        for organization in self.organizations:
+            for collection in organization.collections:
+                try:
+                    output_url: Optional[str] = collection.output_url()
+                except ValueError:
+                    output_url = None
+
+                rows.append(
+                    CatalogIndexRow(
+                        organization=organization.name,
+                        url=collection.url,
+                        name=collection.name,
+                        output=collection.output,
+                        output_url=output_url,
+                    )
+                )
+
+        return rows
+
 
 class Discovery:
-    """Load catalog information and expose its collections."""
+    """Load catalog information and expose its collections.
 
-    DEFAULT_CATALOG_PATH = Path.home() / ".yax" / DEFAULT_CATALOG_OUTPUT
+    Several catalogs (local paths or GitHub URLs) can be federated into a
+    single view: remote catalogs are cached locally and revalidated with
+    conditional requests, collections are deduplicated by their canonical
+    output URL and the merged catalog is persisted, so following runs reuse it
+    until one of the sources changes.
+    """
 
-    def __init__(self, catalog_path: Optional[Path | str] = None) -> None:
+    DEFAULT_CATALOG_PATH = Path.home() / ".yax" / DEFAULT_CATALOG_OUTPUT
+    DEFAULT_CACHE_DIR = Path.home() / ".yax" / "cache"
+    USER_CONFIG_PATH = Path.home() / ".yax" / "config.yml"
+
+    def __init__(
+        self,
+        catalog_path: Optional[Path | str | Sequence[Path | str]] = None,
+        cache_dir: Optional[Path | str] = None,
+        refresh: bool = False,
+        organizations: Optional[Collection[str]] = None,
+    ) -> None:
         if catalog_path is None:
-            self._catalog_path = self.DEFAULT_CATALOG_PATH
+            sources = self._user_catalog_sources() or [self.DEFAULT_CATALOG_PATH]
+        elif isinstance(catalog_path, (str, Path)):
+            sources = [catalog_path]
         else:
-            self._catalog_path = Path(catalog_path)
+            sources = list(catalog_path)
+
+        if not sources:
+            raise ValueError("At least one catalog must be provided")
+
+        self._sources: List[Path | str] = [
+            str(source).strip() if _is_remote_catalog(source) else Path(source)
+            for source in sources
+        ]
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else self.DEFAULT_CACHE_DIR
+        self._refresh = refresh
+        self._organizations = set(organizations) if organizations is not None else None
+
+        self._catalog_path: Optional[Path] = None
+        if len(self._sources) == 1 and isinstance(self._sources[0], Path):
+            self._catalog_path = self._sources[0]
+
+    @property
+    def catalog_path(self) -> Path:
+        """Local catalog file backing this discovery, federating sources on first use."""
+
+        if self._catalog_path is None:
+            self._catalog_path = self._federate()
+        return self._catalog_path
 
     def discover(self) -> List[CatalogCollection]:
-        catalog_path = self._catalog_path
+        catalog_path = self.catalog_path
         if not catalog_path.exists():
             raise FileNotFoundError(f"Catalog file not found: {catalog_path}")
 
-        try:
-            catalog_data = json.loads(catalog_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
-            raise ValueError(f"Invalid catalog JSON in '{catalog_path}': {exc}") from exc
+        from yaxai.catalogindex import CatalogIndex
 
-        catalog = Catalog.from_mapping(catalog_data)
+        index = CatalogIndex.for_catalog(catalog_path)
+        if index.exists() and self._organizations is None:
+            return self._query_index(index)
+
+        catalog = self._load_catalog()
 
         collections: List[CatalogCollection] = []
         for organization in catalog.organizations:
@@ -364,45 +840,695 @@ class Discovery:
 
         return collections
 
+    def iter_collections(self) -> Iterator[CatalogCollection]:
+        """Yield collections lazily while the catalog JSON is being parsed.
 
-class Yax:
-    """Core Yax entry point placeholder."""
+        Memory use stays flat regardless of catalog size, so consumers that only
+        need the first few entries stop reading the file early. A fresh compiled
+        index is used instead of the JSON when one is available.
+        """
 
-    USER_AGENT = "yax/1.0"
+        catalog_path = self.catalog_path
+        if not catalog_path.exists():
+            raise FileNotFoundError(f"Catalog file not found: {catalog_path}")
 
-    def __init__(self) -> None:
-        self._github_token: Optional[str] = None
+        from yaxai.catalogindex import CatalogIndex
 
-    def build_agentsmd(self, config: AgentsmdBuildConfig) -> None:
-        """Download agent markdown fragments and concatenate them into the output file."""
+        index = CatalogIndex.for_catalog(catalog_path)
+        if index.is_fresh(catalog_path):
+            for row in index.query():
+                if self._organizations is None or row.organization in self._organizations:
+                    yield CatalogCollection(url=row.url, name=row.name, output=row.output)
+            return
 
-        urls = config.urls or []
+        yield from self._stream_collections(catalog_path)
 
-        fragments: List[str] = []
-        for url in urls:
-            if url.startswith("file:"):
-                fragments.extend(self._read_local_sources(url))
+    def _stream_collections(self, catalog_path: Path) -> Iterator[CatalogCollection]:
+        for item in _iter_catalog_stream(catalog_path, self._organizations, ordered=False):
+            if item.collection is not None:
+                yield item.collection
+
+    def find(
+        self,
+        organization: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        url: Optional[str] = None,
+    ) -> List[CatalogCollection]:
+        """Look up collections by organization, name prefix and/or URL.
+
+        Lookups are answered from the compiled catalog index, which is created
+        or refreshed on demand when it is missing or older than the catalog JSON.
+        """
+
+        catalog_path = self.catalog_path
+        if not catalog_path.exists():
+            raise FileNotFoundError(f"Catalog file not found: {catalog_path}")
+
+        from yaxai.catalogindex import CatalogIndex
+
+        index = CatalogIndex.for_catalog(catalog_path)
+        return self._query_index(
+            index,
+            organization=organization,
+            name_prefix=name_prefix,
+            url=url,
+        )
+
+    def search(self, query: str, limit: int = 10) -> List[SearchHit]:
+        """Rank catalog collections by relevance of their contents to the query.
+
+        Each local catalog source is searched with its own search index and
+        the hits are merged by score, keeping the best hit of an output listed
+        in several catalogs. Remote catalogs are published without a search
+        index and are not searched.
+        """
+
+        from yaxai.search import SearchIndex
+
+        index_paths = [
+            SearchIndex.path_for(source) for source in self._sources if isinstance(source, Path)
+        ]
+        available = [path for path in index_paths if path.exists()]
+        if not index_paths:
+            raise FileNotFoundError("Remote catalogs have no search index; search a local catalog instead")
+        if not available:
+            raise FileNotFoundError(
+                f"Search index not found: {index_paths[0]} (run 'yax catalog build --search')"
+            )
+
+        hits: List[SearchHit] = []
+        for path in available:
+            search_index = SearchIndex.load(path)
+            try:
+                hits.extend(search_index.search(query, limit=limit))
+            finally:
+                search_index.close()
+
+        seen: set[str] = set()
+        ranked: List[SearchHit] = []
+        for hit in sorted(hits, key=lambda hit: -hit.score):
+            if hit.document.url not in seen:
+                seen.add(hit.document.url)
+                ranked.append(hit)
+        return ranked[:limit]
+
+    def _query_index(
+        self,
+        index: CatalogIndex,
+        organization: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        url: Optional[str] = None,
+    ) -> List[CatalogCollection]:
+        import sqlite3
+
+        rows: Iterable[CatalogIndexRow]
+        if index.is_fresh(self.catalog_path):
+            rows = index.query(organization=organization, name_prefix=name_prefix, url=url)
+        else:
+            all_rows = self._load_catalog().index_rows()
+            try:
+                index.write(self.catalog_path, all_rows)
+            except (OSError, sqlite3.Error):
+                # Read-only catalog locations still answer lookups, just without the index.
+                rows = [
+                    row
+                    for row in all_rows
+                    if (organization is None or row.organization == organization)
+                    and (not name_prefix or (row.name or "").lower().startswith(name_prefix.lower()))
+                    and (url is None or url in (row.url, row.output_url))
+                ]
+            else:
+                rows = index.query(organization=organization, name_prefix=name_prefix, url=url)
+
+        return [
+            CatalogCollection(url=row.url, name=row.name, output=row.output)
+            for row in rows
+            if self._organizations is None or row.organization in self._organizations
+        ]
+
+    def _load_catalog(self, catalog_path: Optional[Path] = None) -> Catalog:
+        return Catalog.load(catalog_path or self.catalog_path, organizations=self._organizations)
+
+    def _federate(self) -> Path:
+        """Merge all catalog sources into a persisted view and return its path."""
+
+        from yaxai.catalogcache import RemoteCatalogCache
+
+        remote_cache = RemoteCatalogCache(self._cache_dir / "catalogs")
+
+        local_paths: List[Path] = []
+        # Cached shards of remote manifests; their changes invalidate the merged view too.
+        remote_shards: List[Path] = []
+        for source in self._sources:
+            if isinstance(source, Path):
+                if not source.exists():
+                    raise FileNotFoundError(f"Catalog file not found: {source}")
+                local_paths.append(source)
+            else:
+                local_path = remote_cache.fetch(source, refresh=self._refresh)
+                if _is_catalog_manifest(local_path):
+                    local_path, shard_paths = self._fetch_remote_shards(source, local_path, remote_cache)
+                    remote_shards.extend(shard_paths)
+                local_paths.append(local_path)
+
+        sources_key = "\n".join(str(source) for source in self._sources)
+        digest = hashlib.sha256(sources_key.encode("utf-8")).hexdigest()[:16]
+        merged_path = self._cache_dir / "federated" / f"{digest}.json"
+        state_path = merged_path.with_name(f"{digest}.state.json")
+
+        state = []
+        for path in [*local_paths, *remote_shards]:
+            stat = path.stat()
+            state.append(f"{path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}")
+
+        if merged_path.exists() and state_path.exists():
+            try:
+                if json.loads(state_path.read_text(encoding="utf-8")) == state:
+                    return merged_path
+            except json.JSONDecodeError:
+                pass
+
+        merged = Catalog.merged(self._load_catalog(path) for path in local_paths)
+
+        merged_path.parent.mkdir(parents=True, exist_ok=True)
+        write_text_atomic(merged_path, json.dumps(merged.to_dict(), separators=(",", ":")))
+        write_text_atomic(state_path, json.dumps(state))
+
+        return merged_path
+
+    def _fetch_remote_shards(
+        self,
+        manifest_url: str,
+        manifest_path: Path,
+        remote_cache: RemoteCatalogCache,
+    ) -> Tuple[Path, List[Path]]:
+        """Cache the shards of a remote manifest and return a local manifest listing them.
+
+        Shard paths are resolved against the manifest URL. Only shards of the
+        selected organizations are downloaded.
+        """
+
+        manifest = _read_catalog_json(manifest_path)
+        entries: List[Dict[str, Any]] = []
+        shard_paths: List[Path] = []
+        for entry in _manifest_shard_entries(manifest, manifest_path):
+            if self._organizations is not None and entry["organization"] not in self._organizations:
                 continue
+            shard_path = remote_cache.fetch(urljoin(manifest_url, entry["path"]), refresh=self._refresh)
+            shard_paths.append(shard_path)
+            entries.append({**entry, "path": os.path.relpath(shard_path, manifest_path.parent)})
 
-            ghfile = GitHubFile.parse(url)
-            fragments.append(ghfile.download())
+        local_manifest = manifest_path.with_name(f"{manifest_path.stem}.local.json")
+        content = json.dumps({"shards": entries}, indent=2, sort_keys=True)
+        if not local_manifest.exists() or local_manifest.read_text(encoding="utf-8") != content:
+            write_text_atomic(local_manifest, content)
+        return local_manifest, shard_paths
 
-        output_path = Path(config.output)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+    @classmethod
+    def _user_catalog_sources(cls) -> List[str]:
+        """Return catalogs listed under 'discover.catalogs' in the user config."""
+
+        config_path = cls.USER_CONFIG_PATH
+        if not config_path.exists():
+            return []
+
+        try:
+            data = load_yaml_file(config_path) or {}
+        except yaml.YAMLError as exc:
+            raise ValueError(f"Invalid YAML in '{config_path}': {exc}") from exc
+
+        discover_section = data.get("discover") if isinstance(data, dict) else None
+        if not isinstance(discover_section, dict):
+            return []
+
+        catalogs = discover_section.get("catalogs") or []
+        if not isinstance(catalogs, list) or not all(isinstance(entry, str) for entry in catalogs):
+            raise ValueError(f"Expected 'discover.catalogs' in '{config_path}' to be a list of strings")
+
+        return [
+            entry if _is_remote_catalog(entry) else str(Path(entry).expanduser())
+            for entry in catalogs
+        ]
+
+
+class _CatalogStreamItem(NamedTuple):
+    kind: str
+    organization: str
+    collection: Optional[CatalogCollection] = None
+
+
+def _iter_catalog_stream(
+    path: Path,
+    organizations: Optional[Collection[str]] = None,
+    ordered: bool = True,
+) -> Iterator[_CatalogStreamItem]:
+    """Stream a catalog file (following shard manifests) as organization/collection items.
+
+    Items are ``organization`` (start of an organization), ``collection`` and
+    ``end``. With ``ordered`` every organization item precedes its
+    collections: when a name trails its collections in the JSON (as in
+    catalogs written with plain ``sort_keys``) the collections of that
+    organization are held back until the name is known. Catalogs written by
+    yax put the name first, so nothing is buffered. Without it, unfiltered collections are yielded as
+    soon as they are parsed and may carry an empty organization name.
+    """
+
+    with _open_catalog_text(path) as stream:
+        try:
+            shard_organization: Optional[str] = None
+            name: Optional[str] = None
+            started = False
+            pending: List[CatalogCollection] = []
+
+            for event in iter_catalog_events(stream):
+                if event.kind == "shard":
+                    _validate_shard_entry(event.value)
+                    entry_organization = event.value["organization"]
+                    if organizations is not None and entry_organization not in organizations:
+                        continue
+
+                    if entry_organization != shard_organization:
+                        if shard_organization is not None:
+                            yield _CatalogStreamItem("end", shard_organization)
+                        shard_organization = entry_organization
+                        yield _CatalogStreamItem("organization", shard_organization)
+
+                    shard_path = path.parent / event.value["path"]
+                    if not shard_path.exists():
+                        raise FileNotFoundError(f"Catalog shard not found: {shard_path}")
+                    for item in _iter_catalog_stream(shard_path, ordered=False):
+                        if item.collection is not None:
+                            yield _CatalogStreamItem("collection", shard_organization, item.collection)
+                    continue
+
+                if event.kind == "organization_start":
+                    name = _stream_organization_name(event.value)
+                    if name is not None and (organizations is None or name in organizations):
+                        started = True
+                        yield _CatalogStreamItem("organization", name)
+                    continue
+
+                if event.kind == "collection":
+                    collection = CatalogCollection.from_mapping(event.value)
+                    if name is None and (ordered or organizations is not None):
+                        pending.append(collection)
+                    elif name is None or organizations is None or name in organizations:
+                        yield _CatalogStreamItem("collection", name or "", collection)
+                    continue
+
+                final_name = _stream_organization_name(event.value) or ""
+                if organizations is None or final_name in organizations:
+                    if not started:
+                        yield _CatalogStreamItem("organization", final_name)
+                    for collection in pending:
+                        yield _CatalogStreamItem("collection", final_name, collection)
+                    yield _CatalogStreamItem("end", final_name)
+
+                name, started, pending = None, False, []
+
+            if shard_organization is not None:
+                yield _CatalogStreamItem("end", shard_organization)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Invalid catalog JSON in '{path}': {exc}") from exc
+
+
+def _stream_organization_name(fields: Dict[str, Any]) -> Optional[str]:
+    if "name" not in fields:
+        return None
+
+    value = fields["name"]
+    if not isinstance(value, str):
+        raise ValueError("Expected organization 'name' to be a string")
+    return value.strip()
+
+
+def _open_catalog_text(path: Path) -> TextIO:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    return path.open("r", encoding="utf-8")
+
+
+def _read_catalog_json(path: Path) -> Any:
+    if not path.exists():
+        raise FileNotFoundError(f"Catalog file not found: {path}")
 
-        combined_content = "\n\n".join(fragments)
-        output_path.write_text(combined_content, encoding="utf-8")
+    try:
+        with _open_catalog_text(path) as stream:
+            return json.load(stream)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"Invalid catalog JSON in '{path}': {exc}") from exc
 
-    
-    def build_catalog(self, config: CatalogBuildConfig) -> None:
-        """Construct a catalog JSON document based on the provided configuration."""
+
+def _is_catalog_manifest(path: Path) -> bool:
+    with _open_catalog_text(path) as stream:
+        try:
+            first = next(iter_catalog_events(stream), None)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Invalid catalog JSON in '{path}': {exc}") from exc
+    return first is not None and first.kind == "shard"
+
+
+def _manifest_shard_entries(manifest: Dict[str, Any], manifest_path: Path) -> List[Dict[str, Any]]:
+    entries = manifest.get("shards")
+    if not isinstance(entries, list):
+        raise ValueError(f"Catalog manifest '{manifest_path}' 'shards' must be a list")
+
+    for entry in entries:
+        _validate_shard_entry(entry)
+
+    return entries
+
+
+def _validate_shard_entry(entry: Any) -> None:
+    if not isinstance(entry, dict):
+        raise ValueError("Expected catalog shard entry to be an object")
+    if not isinstance(entry.get("organization"), str):
+        raise ValueError("Expected catalog shard 'organization' to be a string")
+    if not isinstance(entry.get("path"), str) or not entry["path"].strip():
+        raise ValueError("Expected catalog shard 'path' to be a non-empty string")
+
+
+def _shard_filename(organization: str, bucket: int, compress: bool) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "-", organization.lower()).strip("-") or "organization"
+    digest = hashlib.sha256(organization.encode("utf-8")).hexdigest()[:8]
+    return f"{slug}-{digest}-{bucket}.json" + (".gz" if compress else "")
+
+
+def _shard_bucket(collection: CatalogCollection, buckets: int) -> int:
+    digest = hashlib.sha256(collection.url.encode("utf-8")).digest()
+    return int.from_bytes(digest[:4], "big") % buckets
+
+
+def _is_remote_catalog(source: Path | str) -> bool:
+    return isinstance(source, str) and source.strip().lower().startswith(("http://", "https://"))
+
+
+def _catalog_source_details(contents: str, source_url: str) -> Tuple[Optional[str], Optional[str]]:
+    """Parse a catalog source config and extract the collection name and output.
+
+    Runs in worker processes for large builds, so it only returns the two
+    extracted values instead of the parsed document.
+    """
+
+    try:
+        config_data = parse_yaml(contents) or {}
+    except yaml.YAMLError as exc:  # pragma: no cover - yaml parser detail path
+        raise RuntimeError(
+            f"Failed to parse YAML from catalog source '{source_url}': {exc}"
+        ) from exc
+
+    if not isinstance(config_data, dict):
+        raise ValueError(
+            f"Catalog source '{source_url}' must contain a YAML mapping at the root"
+        )
+
+    build_section = config_data.get("build")
+    if not isinstance(build_section, dict):
+        return (None, None)
+
+    agentsmd_section = build_section.get("agentsmd")
+    if not isinstance(agentsmd_section, dict):
+        return (None, None)
+
+    name_value: Optional[str] = None
+    metadata = agentsmd_section.get("metadata")
+    if isinstance(metadata, dict):
+        raw_name = metadata.get("name")
+        if raw_name is not None:
+            if not isinstance(raw_name, str):
+                raise ValueError(
+                    f"Catalog source '{source_url}' metadata 'name' must be a string"
+                )
+
+            stripped_name = raw_name.strip()
+            if not stripped_name:
+                raise ValueError(
+                    f"Catalog source '{source_url}' metadata 'name' must be a non-empty string"
+                )
+            name_value = stripped_name
+
+    output_value: Optional[str] = None
+    raw_output = agentsmd_section.get("output", DEFAULT_AGENTSMD_OUTPUT)
+    if raw_output is None:
+        raw_output = DEFAULT_AGENTSMD_OUTPUT
+
+    if raw_output is not None:
+        if not isinstance(raw_output, str):
+            raise ValueError(
+                f"Catalog source '{source_url}' 'output' must be a string"
+            )
+        stripped_output = raw_output.strip()
+        if not stripped_output:
+            raise ValueError(
+                f"Catalog source '{source_url}' 'output' must be a non-empty string when provided"
+            )
+        output_value = stripped_output
+
+    return (name_value, output_value)
+
+
+def _parse_catalog_sources(
+    sources: Sequence[Tuple[str, str]],
+    max_workers: Optional[int] = None,
+) -> List[Tuple[Optional[str], Optional[str]]]:
+    """Extract collection details for ``(contents, source_url)`` pairs, in order.
+
+    Large batches are parsed in a process pool so YAML parsing is not limited
+    to a single core by the GIL; small ones, and any batch on a single
+    available CPU, are parsed inline.
+    """
+
+    workers = max_workers or _available_cpus()
+    if workers < 2 or sum(len(contents) for contents, _ in sources) < _PARALLEL_PARSE_MIN_BYTES:
+        return [_catalog_source_details(contents, url) for contents, url in sources]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, len(sources) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                _catalog_source_details,
+                [contents for contents, _ in sources],
+                [url for _, url in sources],
+                chunksize=chunksize,
+            )
+        )
+
+
+def _available_cpus() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+PROJECT_BUILT = "built"
+PROJECT_UNCHANGED = "unchanged"
+PROJECT_FAILED = "failed"
+
+
+class ProjectBuild(NamedTuple):
+    """Outcome of building one project during a batch build."""
+
+    config_path: Path
+    status: str
+    outputs: List[Path]
+    duration: float
+    error: Optional[str] = None
+
+
+class CatalogVerification(NamedTuple):
+    """Link check result for one catalog collection."""
+
+    organization: str
+    collection: CatalogCollection
+    check: LinkCheck
+
+
+class _CatalogDocument(NamedTuple):
+    path: Path
+    data: Dict[str, Any]
+    shard: bool = False
+
+
+def _read_catalog_documents(path: Path) -> List[_CatalogDocument]:
+    """Return the catalog file (or every shard of a manifest) with its raw JSON."""
+
+    data = _read_catalog_json(path)
+    if isinstance(data, dict) and "shards" in data:
+        documents: List[_CatalogDocument] = []
+        for entry in _manifest_shard_entries(data, path):
+            shard_path = path.parent / entry["path"]
+            documents.append(_CatalogDocument(shard_path, _read_catalog_json(shard_path), shard=True))
+        return documents
+
+    return [_CatalogDocument(path, data)]
+
+
+def _catalog_json(data: Any, compact: bool = False) -> str:
+    """Serialize catalog JSON with sorted keys, but each organization's name first.
+
+    Writing ``name`` ahead of ``collections`` lets ``_iter_catalog_stream``
+    hand collections on as they are parsed instead of buffering each
+    organization until its name appears.
+    """
+
+    def ordered(value: Any) -> Any:
+        if isinstance(value, dict):
+            keys = sorted(value)
+            if "collections" in value and "name" in value:
+                keys.remove("name")
+                keys.insert(0, "name")
+            return {key: ordered(value[key]) for key in keys}
+        if isinstance(value, list):
+            return [ordered(item) for item in value]
+        return value
+
+    if compact:
+        return json.dumps(ordered(data), separators=(",", ":"))
+    return json.dumps(ordered(data), indent=2)
+
+
+def _write_catalog_document(document: _CatalogDocument) -> None:
+    """Write a catalog document back, compact like ``_write_sharded_catalog`` when it is a shard."""
+
+    path = document.path
+    if path.suffix == ".gz":
+        payload = _catalog_json(document.data, compact=True).encode("utf-8")
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temp_path.write_bytes(gzip.compress(payload, mtime=0))
+        os.replace(temp_path, path)
+    else:
+        write_text_atomic(path, _catalog_json(document.data, compact=document.shard))
+
+
+class Yax:
+    """Core Yax entry point placeholder."""
+
+    USER_AGENT = "yax/1.0"
+
+    def __init__(self) -> None:
+        self._github_token: Optional[str] = None
+
+    def build_agentsmd(
+        self,
+        config: AgentsmdBuildConfig,
+        config_path: Optional[Path] = None,
+        fetcher: Optional[SourceFetcher] = None,
+    ) -> List[Path]:
+        """Download agent markdown fragments and write every configured output.
+
+        The main output and all ``targets`` share one fetch pass over the union
+        of their sources; outputs are then rendered and written in parallel.
+        Sources pointing at other yax configs are expanded recursively. A
+        ``fetcher`` may be shared between builds to download common sources once.
+        """
+
+        return write_outputs(render_outputs(config.build_targets(), config_path, fetcher))
+
+    def render_agentsmd(
+        self,
+        config: AgentsmdBuildConfig,
+        config_path: Optional[Path] = None,
+        fetcher: Optional[SourceFetcher] = None,
+        base_dir: Optional[Path] = None,
+    ) -> List[Tuple[Path, str]]:
+        """Return the output path and rendered content of every target without writing."""
+
+        return render_outputs(config.build_targets(), config_path, fetcher, base_dir)
+
+    def build_all(self, root: Path, max_workers: int = 8, state_path: Optional[Path] = None) -> List[ProjectBuild]:
+        """Build every yax.yml project below root.
+
+        All projects share one fetcher, so a source used by many projects is
+        downloaded once; projects are then assembled concurrently. Projects
+        whose inputs match the fingerprint stored in ``state_path`` (a file
+        per root below the yax cache by default) are skipped without fetching
+        or rendering, and outputs whose content would not change are left
+        untouched.
+        """
+
+        from yaxai.buildstate import BuildState
+        from yaxai.workspace import find_project_configs
+
+        config_paths = find_project_configs(root)
+        if not config_paths:
+            return []
+
+        if state_path is None:
+            digest = hashlib.sha256(str(root.resolve()).encode("utf-8")).hexdigest()[:16]
+            state_path = Discovery.DEFAULT_CACHE_DIR / "builds" / f"{digest}.json"
+        commits = CommitResolver()
+        state = BuildState(state_path, commits)
+        download = SourceDownloader(PinnedGitHubDownloader(commits))
+
+        with SourceFetcher(download=download) as fetcher, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(
+                executor.map(lambda config_path: self._build_project(config_path, fetcher, state), config_paths)
+            )
+        state.save()
+        return results
+
+    def _build_project(self, config_path: Path, fetcher: SourceFetcher, state: BuildState) -> ProjectBuild:
+        from yaxai.buildstate import project_sources
+
+        started = time.perf_counter()
+        try:
+            config = AgentsmdBuildConfig.parse_yml(config_path)
+            targets = config.build_targets()
+            target_sources = [target.urls or [] for target in targets]
+            output_paths = [config_path.parent / target.output for target in targets]
+            if state.is_unchanged(config_path, target_sources):
+                return ProjectBuild(config_path, PROJECT_UNCHANGED, output_paths, time.perf_counter() - started)
+
+            graphs: List[SourceGraph] = []
+            outputs = render_outputs(targets, config_path, fetcher, config_path.parent, graphs=graphs)
+            changed = [(path, content) for path, content in outputs if not output_matches(path, content)]
+            write_outputs(changed)
+        except Exception as exc:
+            state.forget(config_path)
+            return ProjectBuild(config_path, PROJECT_FAILED, [], time.perf_counter() - started, str(exc))
+
+        state.record(config_path, target_sources, project_sources(graphs), dict(outputs))
+        status = PROJECT_BUILT if changed else PROJECT_UNCHANGED
+        return ProjectBuild(config_path, status, [path for path, _ in outputs], time.perf_counter() - started)
+
+    def resolve_agentsmd_sources(
+        self,
+        sources: AgentsmdBuildConfig | Sequence[str],
+        config_path: Optional[Path] = None,
+        fetcher: Optional[SourceFetcher] = None,
+        base_dir: Optional[Path] = None,
+    ) -> SourceGraph:
+        """Expand config sources, including nested yax configs, into a source graph."""
+
+        urls = sources.urls if isinstance(sources, AgentsmdBuildConfig) else sources
+        return resolve_sources(urls, config_path, fetcher, base_dir)
+
+    def build_catalog(self, config: CatalogBuildConfig) -> Dict[str, str]:
+        """Construct a catalog JSON document based on the provided configuration.
+
+        Returns the collections left out of the search index, keyed by
+        collection URL, with the reason their output could not be indexed.
+        """
+
+        source_urls = [source.url for source in config.sources]
+        if config.scan_organization:
+            from yaxai.orgscan import OrganizationScanner
+
+            scanner = OrganizationScanner(config.scan_organization, state_path=config.scan_state_path())
+            source_urls.extend(url for url in scanner.scan() if url not in source_urls)
+
+        with SourceFetcher(download=self._read_catalog_source_text) as fetcher:
+            futures = [fetcher.submit(source_url) for source_url in source_urls]
+            contents = [future.result() for future in futures]
+        details = _parse_catalog_sources(list(zip(contents, source_urls)))
 
         collections: List[CatalogCollection] = []
-        for source in config.sources:
-            collection_name, collection_output = self._discover_catalog_collection_details(source.url)
+        for source_url, (collection_name, collection_output) in zip(source_urls, details):
             collections.append(
                 CatalogCollection(
-                    url=source.url,
+                    url=source_url,
                     name=collection_name,
                     output=collection_output,
                 )
@@ -420,103 +1546,235 @@ class Yax:
         output_path = Path(config.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        if config.shards is not None:
+            self._write_sharded_catalog(catalog, output_path, config.shards)
+        else:
+            output_path.write_text(_catalog_json(catalog.to_dict()), encoding="utf-8")
+
+        if config.index:
+            from yaxai.catalogindex import CatalogIndex
+
+            CatalogIndex.for_catalog(output_path).write(output_path, catalog.index_rows())
+
+        search_failures: Dict[str, str] = {}
+        if config.search:
+            from yaxai.search import SearchIndex
+
+            documents, search_failures = self._fetch_search_documents(catalog)
+            search_index = SearchIndex.build(documents)
+            try:
+                search_index.save(SearchIndex.path_for(output_path))
+            finally:
+                search_index.close()
+
+        return search_failures
+
+    def _write_sharded_catalog(self, catalog: Catalog, output_path: Path, shards: CatalogShardConfig) -> None:
+        """Write per-organization (optionally hash-bucketed) shards plus a manifest at output_path."""
+
+        shard_dir_name = f"{output_path.stem}.shards"
+        shard_dir = output_path.parent / shard_dir_name
+        shard_dir.mkdir(parents=True, exist_ok=True)
+        for stale in [*shard_dir.glob("*.json"), *shard_dir.glob("*.json.gz")]:
+            stale.unlink()
+
+        entries: List[Dict[str, Any]] = []
+        for organization in catalog.organizations:
+            buckets: List[List[CatalogCollection]] = [[] for _ in range(shards.buckets)]
+            for collection in organization.collections:
+                buckets[_shard_bucket(collection, shards.buckets)].append(collection)
+
+            for bucket, collections in enumerate(buckets):
+                if not collections and bucket:
+                    continue
+
+                filename = _shard_filename(organization.name, bucket, shards.gzip)
+                shard = Catalog(organizations=[CatalogOrganization(name=organization.name, collections=collections)])
+                payload = _catalog_json(shard.to_dict(), compact=True).encode("utf-8")
+                if shards.gzip:
+                    payload = gzip.compress(payload, mtime=0)
+                (shard_dir / filename).write_bytes(payload)
+
+                entries.append(
+                    {
+                        "organization": organization.name,
+                        "path": f"{shard_dir_name}/{filename}",
+                        "collections": len(collections),
+                    }
+                )
+
         output_path.write_text(
-            json.dumps(catalog.to_dict(), indent=2, sort_keys=True),
+            json.dumps({"shards": entries}, indent=2, sort_keys=True),
             encoding="utf-8",
         )
 
-    def export_catalog(self, source: Path, format_name: str) -> Path:
-        """Export the catalog JSON into the requested format and return output path."""
-
-        if not source.exists():
-            raise FileNotFoundError(f"Catalog source '{source}' was not found")
+    def _fetch_search_documents(self, catalog: Catalog) -> Tuple[List[SearchDocument], Dict[str, str]]:
+        """Download the output of every catalog collection for full-text indexing.
+
+        Outputs are fetched concurrently. Collections without a valid output
+        URL or whose output cannot be downloaded are left out of the index;
+        they are returned with the reason, keyed by collection URL.
+        """
+
+        from yaxai.search import SearchDocument
+
+        documents: List[SearchDocument] = []
+        failures: Dict[str, str] = {}
+        with SourceFetcher(download=self._read_catalog_source_text) as fetcher:
+            pending = []
+            for organization in catalog.organizations:
+                for collection in organization.collections:
+                    try:
+                        output_url = collection.output_url()
+                    except ValueError as exc:
+                        failures[collection.url] = str(exc)
+                        continue
+                    pending.append((organization.name, collection, output_url, fetcher.submit(output_url)))
+
+            for organization_name, collection, output_url, future in pending:
+                try:
+                    text = future.result()
+                except (OSError, RuntimeError, ValueError) as exc:
+                    failures[collection.url] = str(exc)
+                    continue
+                documents.append(
+                    SearchDocument(
+                        organization=organization_name,
+                        url=output_url,
+                        name=collection.name,
+                        text=text,
+                    )
+                )
 
-        try:
-            catalog_data = json.loads(source.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
-            raise ValueError(f"Invalid catalog JSON in '{source}': {exc}") from exc
+        return documents, failures
 
-        normalized_format = format_name.strip().lower()
+    def export_catalog(
+        self,
+        source: Path,
+        format_name: str,
+        organizations: Optional[Collection[str]] = None,
+        output: Optional[Path | TextIO] = None,
+    ) -> Optional[Path]:
+        """Stream the catalog into the requested format.
 
-        catalog = Catalog.from_mapping(catalog_data)
+        Rows are written while the catalog is read. ``output`` may be a path
+        (defaults to the source path with the format extension) or an open text
+        stream; the written path is returned, or ``None`` for streams.
+        """
 
-        if normalized_format == "markdown":
-            output_path = source.with_suffix(".md")
-            content = self._catalog_to_markdown(catalog)
-        else:
-            raise ValueError(f"Unsupported export format '{format_name}'")
+        if not source.exists():
+            raise FileNotFoundError(f"Catalog source '{source}' was not found")
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(content, encoding="utf-8")
+        from yaxai.export import CATALOG_WRITERS
 
-        return output_path
+        writer_class = CATALOG_WRITERS.get(format_name.strip().lower())
+        if writer_class is None:
+            raise ValueError(f"Unsupported export format '{format_name}'")
 
-    def _discover_catalog_collection_details(self, source_url: str) -> Tuple[Optional[str], Optional[str]]:
-        """Load the referenced Yax config and extract collection metadata."""
+        if output is not None and not isinstance(output, (str, Path)):
+            self._write_catalog_export(source, writer_class(output), organizations)
+            return None
 
-        config_text = self._read_catalog_source_text(source_url)
-        config_data = self._parse_catalog_source_yaml(config_text, source_url)
+        output_path = Path(output) if output is not None else source.with_suffix(writer_class.extension)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        build_section = config_data.get("build")
-        if not isinstance(build_section, dict):
-            return (None, None)
+        temp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+        try:
+            with temp_path.open("w", encoding="utf-8", newline="") as stream:
+                self._write_catalog_export(source, writer_class(stream), organizations)
+            os.replace(temp_path, output_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
 
-        agentsmd_section = build_section.get("agentsmd")
-        if not isinstance(agentsmd_section, dict):
-            return (None, None)
+        return output_path
 
-        name_value: Optional[str] = None
-        metadata = agentsmd_section.get("metadata")
-        if isinstance(metadata, dict):
-            raw_name = metadata.get("name")
-            if raw_name is not None:
-                if not isinstance(raw_name, str):
-                    raise ValueError(
-                        f"Catalog source '{source_url}' metadata 'name' must be a string"
-                    )
+    def _write_catalog_export(
+        self,
+        source: Path,
+        writer: CatalogWriter,
+        organizations: Optional[Collection[str]],
+    ) -> None:
+        writer.begin()
+
+        organization_count = 0
+        collection_count = 0
+        for item in _iter_catalog_stream(source, organizations):
+            if item.kind == "organization":
+                organization_count += 1
+                collection_count = 0
+                writer.begin_organization(item.organization)
+            elif item.kind == "collection" and item.collection is not None:
+                collection_count += 1
+                writer.collection(item.organization, item.collection)
+            else:
+                writer.end_organization(item.organization, collection_count)
 
-                stripped_name = raw_name.strip()
-                if not stripped_name:
-                    raise ValueError(
-                        f"Catalog source '{source_url}' metadata 'name' must be a non-empty string"
-                    )
-                name_value = stripped_name
+        writer.end(organization_count)
 
-        output_value: Optional[str] = None
-        raw_output = agentsmd_section.get("output", DEFAULT_AGENTSMD_OUTPUT)
-        if raw_output is None:
-            raw_output = DEFAULT_AGENTSMD_OUTPUT
+    def verify_catalog(
+        self,
+        source: Path,
+        organizations: Optional[Collection[str]] = None,
+        checker: Optional[LinkChecker] = None,
+        write: bool = False,
+    ) -> List[CatalogVerification]:
+        """Check that every collection output URL still resolves.
 
-        if raw_output is not None:
-            if not isinstance(raw_output, str):
-                raise ValueError(
-                    f"Catalog source '{source_url}' 'output' must be a string"
-                )
-            stripped_output = raw_output.strip()
-            if not stripped_output:
-                raise ValueError(
-                    f"Catalog source '{source_url}' 'output' must be a non-empty string when provided"
-                )
-            output_value = stripped_output
+        All links are checked concurrently. With ``write`` the results are
+        stored as a ``verification`` object on each collection entry, and the
+        stored validators make the next run use conditional requests.
+        """
 
-        return (name_value, output_value)
+        if not source.exists():
+            raise FileNotFoundError(f"Catalog source '{source}' was not found")
 
-    def _parse_catalog_source_yaml(self, contents: str, source_url: str) -> Dict[str, Any]:
-        """Parse YAML contents from a catalog source and validate the structure."""
+        from yaxai.verify import LINK_ERROR, LinkCheck, LinkChecker
+
+        checker = checker or LinkChecker()
+        documents = _read_catalog_documents(source)
+
+        entries: List[Tuple[str, CatalogCollection, Dict[str, Any], Optional[str]]] = []
+        validators: Dict[str, Dict[str, Optional[str]]] = {}
+        for document in documents:
+            data = document.data
+            catalog = Catalog.from_mapping(data)
+            for organization, raw_organization in zip(catalog.organizations, data.get("organizations", [])):
+                if organizations is not None and organization.name not in organizations:
+                    continue
+
+                for collection, raw_collection in zip(organization.collections, raw_organization.get("collections", [])):
+                    try:
+                        target: Optional[str] = collection.output_url()
+                    except ValueError:
+                        target = None
+                    entries.append((organization.name, collection, raw_collection, target))
+
+                    previous = raw_collection.get("verification")
+                    if target is not None and isinstance(previous, dict):
+                        validators[target] = {
+                            "etag": previous.get("etag"),
+                            "last_modified": previous.get("last_modified"),
+                        }
+
+        checks = checker.check_all((target for *_, target in entries if target is not None), validators)
+
+        results: List[CatalogVerification] = []
+        checked_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        for organization_name, collection, raw_collection, target in entries:
+            if target is None:
+                check = LinkCheck(collection.url, LINK_ERROR, error="Collection does not reference an output file")
+            else:
+                check = checks[target]
+            results.append(CatalogVerification(organization_name, collection, check))
 
-        try:
-            data = yaml.safe_load(contents) or {}
-        except yaml.YAMLError as exc:  # pragma: no cover - yaml parser detail path
-            raise RuntimeError(
-                f"Failed to parse YAML from catalog source '{source_url}': {exc}"
-            ) from exc
+            if write:
+                raw_collection["verification"] = {**check.to_dict(), "checked_at": checked_at}
 
-        if not isinstance(data, dict):
-            raise ValueError(
-                f"Catalog source '{source_url}' must contain a YAML mapping at the root"
-            )
+        if write:
+            for document in documents:
+                _write_catalog_document(document)
 
-        return data
+        return results
 
     def _read_catalog_source_text(self, source_url: str) -> str:
         """Retrieve the raw YAML contents for the provided catalog source URL."""
@@ -548,74 +1806,3 @@ class Yax:
             return Path(f"/{parsed.netloc}/{path}")
 
         return Path(path)
-
-    def _read_local_sources(self, file_url: str) -> List[str]:
-        """Read and return content fragments for file-based agents sources."""
-
-        parsed = urlparse(file_url)
-        # Accept both file:relative/path and file:///absolute/path patterns.
-        pattern = unquote(parsed.path or "")
-
-        if parsed.netloc:
-            if pattern.startswith("/"):
-                pattern = f"{parsed.netloc}{pattern}"
-            else:
-                pattern = f"{parsed.netloc}/{pattern}"
-
-        if not pattern:
-            raise RuntimeError(f"File source '{file_url}' does not specify a path")
-
-        if pattern.startswith("/"):
-            glob_pattern = pattern
-        else:
-            glob_pattern = str((Path.cwd() / pattern).resolve())
-
-        matches = sorted(Path(match_path) for match_path in glob(glob_pattern, recursive=True))
-
-        file_matches = [path for path in matches if path.is_file()]
-        if not file_matches:
-            raise RuntimeError(f"No files matched pattern '{pattern}' (from '{file_url}')")
-
-        fragments: List[str] = []
-        for path in file_matches:
-            fragments.append(path.read_text(encoding="utf-8"))
-
-        return fragments
-
-    def _catalog_to_markdown(self, catalog: Catalog) -> str:
-        """Convert catalog structure into a readable markdown document."""
-
-        lines: List[str] = ["# Catalog"]
-
-        if not catalog.organizations:
-            lines.append("")
-            lines.append("_No organizations defined._")
-            lines.append("")
-            return "\n".join(lines)
-
-        for organization in catalog.organizations:
-            name = organization.name or "Unnamed organization"
-
-            lines.append("")
-            lines.append(f"## {name}")
-            lines.append("")
-
-            if not organization.collections:
-                lines.append("_No collections defined._")
-                continue
-
-            for collection in organization.collections:
-                url = collection.url.strip()
-                display_name = collection.name
-
-                if display_name and url:
-                    lines.append(f"- [{display_name}]({url})")
-                elif url:
-                    lines.append(f"- {url}")
-                elif display_name:
-                    lines.append(f"- {display_name}")
-                else:
-                    lines.append("- (missing url)")
-
-        lines.append("")
-        return "\n".join(lines)